@@ -0,0 +1,108 @@
+"""
+Benchmark: LCU credential discovery
+Compares the previous process-scan lookup (every process, full command line
+joined and regex-searched) with CredentialDiscovery's name-filtered scan and
+cached-PID revalidation.
+
+A stand-in client is started as a symlink to the Python interpreter named
+LeagueClientUx.exe carrying --app-port/--remoting-auth-token arguments (POSIX
+only), plus --background idle processes to make the host busier.
+
+Usage: python benchmarks/bench_discovery.py [--repeat 200] [--background 200]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+import psutil
+
+from lcu.discovery import CredentialDiscovery
+
+
+def legacy_read_from_process():
+    """The scan LCUConnector used before CredentialDiscovery"""
+    try:
+        for process in psutil.process_iter(['name', 'cmdline']):
+            if process.info['name'] in ['LeagueClientUx.exe', 'LeagueClient.exe']:
+                cmdline = ' '.join(process.info['cmdline'])
+                port_match = re.search(r'--app-port=(\d+)', cmdline)
+                token_match = re.search(r'--remoting-auth-token=([\w-]+)', cmdline)
+                if port_match and token_match:
+                    return (int(port_match.group(1)), token_match.group(1))
+    except Exception:
+        pass
+    return None
+
+
+def bench(label: str, func, repeat: int, expected):
+    result = func()
+    if result != expected:
+        print(f"  {label:<36} [FAILED] got {result}, expected {expected}")
+        return
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    print(f"  {label:<36} {elapsed / repeat * 1e3:8.3f} ms/lookup  "
+          f"{cpu / repeat * 1e3:8.3f} ms CPU")
+
+
+def spawn_client(tmp: Path, port: int, token: str) -> subprocess.Popen:
+    exe = tmp / 'LeagueClientUx.exe'
+    exe.symlink_to(os.path.realpath(sys.executable))
+    return subprocess.Popen([str(exe), '-c', 'import time; time.sleep(3600)',
+                             f'--app-port={port}', f'--remoting-auth-token={token}'])
+
+
+def main(args):
+    background = [subprocess.Popen(['sleep', '3600']) for _ in range(args.background)]
+    with tempfile.TemporaryDirectory() as tmp:
+        client = spawn_client(Path(tmp), 54321, 'bench-token')
+        time.sleep(0.5)
+        expected = (54321, 'bench-token')
+        missing_lockfile = [Path(tmp) / 'lockfile']
+        try:
+            print(f"{len(psutil.pids())} processes running")
+            print("Client running:")
+            bench("previous scan", legacy_read_from_process, args.repeat, expected)
+
+            def scan_only():
+                discovery = CredentialDiscovery(missing_lockfile)
+                return discovery.find()
+            bench("name-filtered scan (cold)", scan_only, args.repeat, expected)
+
+            cached = CredentialDiscovery(missing_lockfile)
+            cached.find()
+            bench("cached PID revalidation", cached.find, args.repeat, expected)
+            print(f"    {cached.stats.to_dict()}")
+
+            client.kill()
+            client.wait()
+            print("Client not running:")
+            bench("previous scan", legacy_read_from_process, args.repeat, None)
+            bench("name-filtered scan", cached.find, args.repeat, None)
+            print(f"    {cached.stats.to_dict()}")
+        finally:
+            for process in background + [client]:
+                process.kill()
+                process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LCU credential discovery benchmark")
+    parser.add_argument('--repeat', type=int, default=200, help="lookups per measurement")
+    parser.add_argument('--background', type=int, default=200,
+                        help="idle processes to start")
+    main(parser.parse_args())
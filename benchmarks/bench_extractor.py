@@ -0,0 +1,164 @@
+"""
+Benchmark: single-pass UGGExtractor vs the multi-scan _extract_*_from_html path
+Runs offline against a synthetic U.GG-shaped page, then checks that early
+stop, full scan and streaming agree on pages listing alternative rune pages,
+and match the unchanged multi-scan baseline where it is right (exits 1 if
+they don't)
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from providers.ugg_scraper import UGGScraperProvider
+from providers.ugg_extractor import StreamingExtractor, UGGExtractor
+
+PERK_CDN = "https://ddragon.leagueoflegends.com/cdn/img/perk-images"
+ITEM_CDN = "https://ddragon.leagueoflegends.com/cdn/16.3.1/img/item"
+SPELL_CDN = "https://ddragon.leagueoflegends.com/cdn/16.3.1/img/spell"
+
+# Recommended page first, then alternatives (listed after the items, as on U.GG).
+# Counting runes over the whole page would rank Domination and Precision (4 each)
+# as primary and secondary.
+RUNE_PAGES = (
+    ("Domination/Electrocute/Electrocute", "Domination/SuddenImpact/SuddenImpact",
+     "Domination/GrislyMementos/GrislyMementos", "Domination/TreasureHunter/TreasureHunter",
+     "Sorcery/ManaflowBand/ManaflowBand", "Sorcery/Scorch/Scorch"),
+    ("Precision/Conqueror/Conqueror", "Precision/Triumph/Triumph",
+     "Precision/LegendAlacrity/LegendAlacrity", "Precision/LastStand/LastStand",
+     "Resolve/BonePlating/BonePlating", "Resolve/Overgrowth/Overgrowth"),
+    ("Sorcery/ArcaneComet/ArcaneComet", "Sorcery/ManaflowBand/ManaflowBand",
+     "Sorcery/Transcendence/Transcendence", "Sorcery/Scorch/Scorch",
+     "Domination/CheapShot/CheapShot", "Domination/UltimateHunter/UltimateHunter"),
+)
+
+
+def rune_block(paths) -> str:
+    return ''.join(f'<div class="perk"><img src="{PERK_CDN}/Styles/{path}.png"></div>'
+                   for path in paths)
+
+
+def make_page(size_kb: int = 400, seed: int = 0, rune_pages: int = 1) -> str:
+    """
+    Build a page shaped like a U.G.G build page: rune page first, then spells
+    and items, then (rune_pages - 1) alternative rune pages, then a long tail
+    of markup and script that holds no build data
+    """
+    rng = random.Random(seed)
+    parts = ['<!DOCTYPE html><html><head><title>Build</title></head><body>']
+    parts.append('<div class="nav">' + 'x' * 20000 + '</div>')
+
+    parts.append(rune_block(RUNE_PAGES[0]))
+    for shard in ("StatModsAdaptiveForceIcon", "StatModsAttackSpeedIcon", "StatModsHealthScalingIcon"):
+        parts.append(f'<div class="shard"><img src="{PERK_CDN}/StatMods/{shard}.png"></div>')
+    for spell in ("SummonerFlash", "SummonerDot"):
+        parts.append(f'<img src="{SPELL_CDN}/{spell}.png">')
+    for item in (1056, 2003, 3020, 6653, 3135, 3157, 3165, 3089, 3040, 3102):
+        parts.append(f'<div class="item"><img src="{ITEM_CDN}/{item}.png"></div>')
+    for paths in RUNE_PAGES[1:rune_pages]:
+        parts.append(f'<div class="alternative">{rune_block(paths)}</div>')
+
+    filler = []
+    while sum(len(part) for part in parts) + len(filler) * 80 < size_kb * 1024:
+        filler.append(f'<div class="row-{rng.randint(0, 9999)}"><span>{rng.random():.12f}</span></div>')
+    parts.append(''.join(filler))
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def bench(label: str, func, html: str, iterations: int) -> float:
+    """Time func(html) and print ms per page"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(html)
+    per_page = (time.perf_counter() - start) / iterations * 1000
+    print(f"  {label:<28} {per_page:8.3f} ms/page")
+    return per_page
+
+
+def check_agreement(provider: UGGScraperProvider) -> bool:
+    """
+    Early stop, full scan and streaming must give the same build
+
+    The multi-scan baseline counts runes over the whole page, so it is only
+    held to the same runes when the page has one rune page; its items and
+    spells must match on every page.
+    """
+    single_pass = UGGExtractor()
+    full_scan = UGGExtractor(stop_early=False)
+    ok = True
+    for rune_pages in range(1, len(RUNE_PAGES) + 1):
+        for size_kb in (100, 400):
+            html = make_page(size_kb, rune_pages=rune_pages)
+            streaming = StreamingExtractor()
+            for start in range(0, len(html), 1000):
+                streaming.feed(html[start:start + 1000])
+
+            results = {}
+            for label, result in (("early stop", single_pass.extract(html)),
+                                  ("full scan", full_scan.extract(html)),
+                                  ("streaming", streaming.finish())):
+                results[label] = (result.runes().to_dict(), result.item_build().to_dict(),
+                                  result.spells)
+            baseline = (provider._extract_runes_from_html(html).to_dict(),
+                        provider._extract_items_from_html(html).to_dict(),
+                        provider._extract_summoner_spells(html, 0))
+            if rune_pages == 1:
+                results["multi-scan"] = baseline
+
+            same = all(value == results["early stop"] for value in results.values()) \
+                and baseline[1:] == results["early stop"][1:]
+            primary = results["early stop"][0]['primaryStyleId']
+            secondary = results["early stop"][0]['subStyleId']
+            expected = (primary, secondary) == (8100, 8200)  # First page: Domination + Sorcery
+            note = ""
+            if rune_pages > 1 and baseline[0] != results["early stop"][0]:
+                note = (f" (multi-scan baseline: {baseline[0]['primaryStyleId']} + "
+                        f"{baseline[0]['subStyleId']}, counted over all rune pages)")
+            print(f"  {rune_pages} rune page(s), {size_kb} KB: "
+                  f"{'OK' if same and expected else 'MISMATCH'}{note}")
+            if not (same and expected):
+                ok = False
+                for label, value in results.items():
+                    print(f"    {label}: {value[0]}")
+    return ok
+
+
+def main():
+    provider = UGGScraperProvider()
+    single_pass = UGGExtractor()
+    full_scan = UGGExtractor(stop_early=False)
+
+    def multi_scan(html):
+        provider._extract_runes_from_html(html)
+        provider._extract_items_from_html(html)
+        provider._extract_summoner_spells(html, 0)
+
+    iterations = 200
+    for size_kb in (100, 400, 800):
+        html = make_page(size_kb)
+        print(f"Page size: {len(html) / 1024:.0f} KB ({iterations} iterations)")
+        baseline = bench("multi-scan (current)", multi_scan, html, iterations)
+        full = bench("single-pass, full scan", full_scan.extract, html, iterations)
+        early = bench("single-pass, early stop", single_pass.extract, html, iterations)
+        print(f"  speedup: {baseline / full:.1f}x full scan, {baseline / early:.1f}x early stop")
+
+        result = single_pass.extract(html)
+        same = (result.runes().to_dict() == provider._extract_runes_from_html(html).to_dict()
+                and result.item_build().to_dict() == provider._extract_items_from_html(html).to_dict()
+                and result.spells == provider._extract_summoner_spells(html, 0))
+        print(f"  results match multi-scan: {same}")
+        print()
+
+    print("Early stop vs full scan on pages with alternative rune pages")
+    if not check_agreement(provider):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: stale helper rune page cleanup
+Fills the mock League client with leftover helper pages and times
+LCUAPI's cleanup at different DELETE concurrency caps (1 = the old one
+page at a time behaviour), then checks that a page applied without a managed
+page survives the cleanup it triggers (exits 1 if it doesn't).
+
+Usage: python benchmarks/bench_page_cleanup.py [--pages 20] [--lcu-latency 0.02]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import MockLCU
+from lcu.api import LCUAPI, CLEANUP_CONCURRENCY
+from lcu.connector import LCUConnector
+
+
+async def check_unmanaged_apply(connector: LCUConnector, lcu: MockLCU, stale: int) -> bool:
+    """Apply a page with managed_page=False; it must outlive the background cleanup"""
+    api = LCUAPI(connector, managed_page=False)
+    for index in range(stale):
+        lcu._add_page({'name': f"U.GG - Champion{index} Middle", 'selectedPerkIds': [8000] * 9})
+
+    page = api.build_rune_page("U.GG - Ahri Middle", 8100, 8200,
+                               [8112, 8143, 8140, 8135, 8226, 8237, 5008, 5008, 5001])
+    result = await api.write_rune_page(page)
+    if api._cleanup is not None:
+        await api._cleanup
+
+    names = [page['name'] for page in lcu.pages.values()]
+    ok = result is not None and result.get('id') in lcu.pages \
+        and not any(name.startswith("U.GG - Champion") for name in names)
+    print(f"  unmanaged apply: page {result.get('id') if result else None} "
+          f"{'kept' if ok else 'MISSING'}, pages left {sorted(names)}")
+    return ok
+
+
+async def run(args):
+    lcu = MockLCU(latency=args.lcu_latency, max_pages=args.pages + 5)
+    port = await lcu.start()
+    connector = LCUConnector(port=port, token=lcu.token)
+    await connector.connect()
+    api = LCUAPI(connector)
+    print(f"{args.pages} stale helper pages, LCU latency {args.lcu_latency * 1000:.0f} ms")
+
+    try:
+        for concurrency in sorted({1, 2, CLEANUP_CONCURRENCY, 8}):
+            for index in range(args.pages):
+                lcu._add_page({'name': f"U.GG - Champion{index} Middle",
+                               'selectedPerkIds': [8000] * 9})
+            before = len(lcu.pages)
+            requests = lcu.requests
+
+            start = time.perf_counter()
+            pages = await api.get_rune_pages()
+            deleted = await api.delete_rune_pages(api._stale_page_ids(pages), concurrency)
+            elapsed = time.perf_counter() - start
+
+            print(f"  concurrency {concurrency:<2} {elapsed * 1000:8.1f} ms  "
+                  f"deleted {deleted}/{args.pages}  pages {before} -> {len(lcu.pages)}  "
+                  f"requests {lcu.requests - requests}")
+
+        ok = await check_unmanaged_apply(connector, lcu, args.pages)
+    finally:
+        await connector.disconnect()
+        await lcu.stop()
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rune page cleanup benchmark")
+    parser.add_argument('--pages', type=int, default=20, help="stale helper pages")
+    parser.add_argument('--lcu-latency', type=float, default=0.02, help="mock LCU seconds/request")
+    asyncio.run(run(parser.parse_args()))
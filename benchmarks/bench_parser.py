@@ -0,0 +1,190 @@
+"""
+U.GG parser benchmark and regression suite
+Runs the HTML extractors over the offline corpus (see corpus.py), checks every
+page against its expected build, then reports throughput and allocations.
+Regression pages (captured, handwritten) and smoke test pages (synthetic) are
+reported separately.
+
+The multi-scan _extract_*_from_html path is the unchanged baseline that
+UGGExtractor replaced; pages it is known to get wrong are marked
+baseline_xfail, and there only UGGExtractor has to match.
+
+Usage: python benchmarks/bench_parser.py [--repeat N] [--manifest PATH]
+Exits with status 1 if any page parses wrong (pages marked xfail excepted).
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from corpus import MANIFEST_PATH, load_corpus
+from providers.ugg_scraper import UGGScraperProvider
+from providers.ugg_extractor import UGGExtractor
+
+FULL_SCAN = UGGExtractor(stop_early=False)
+
+
+def check_page(provider: UGGScraperProvider, extractor: UGGExtractor,
+               page) -> Tuple[List[str], List[str]]:
+    """
+    Compare every extractor's output on a page with the expected build
+
+    Returns:
+        (baseline mismatches, UGGExtractor mismatches), both empty if the page
+        parsed correctly
+    """
+    baseline_errors = []
+    errors = []
+    expected_runes = page.runes.to_dict()
+    expected_items = page.items.to_dict() if page.items else None
+
+    runes = provider._extract_runes_from_html(page.html)
+    if runes is None or runes.to_dict() != expected_runes:
+        baseline_errors.append(f"runes: {runes.to_dict() if runes else None} != {expected_runes}")
+
+    items = provider._extract_items_from_html(page.html)
+    if (items.to_dict() if items else None) != expected_items:
+        baseline_errors.append(f"items: {items.to_dict() if items else None} != {expected_items}")
+
+    spells = provider._extract_summoner_spells(page.html, page.champion_id)
+    if spells != page.spells:
+        baseline_errors.append(f"spells: {spells} != {page.spells}")
+
+    # The single-pass extractor used by get_build must agree
+    extracted = extractor.extract(page.html)
+    runes = extracted.runes()
+    if runes is None or runes.to_dict() != expected_runes:
+        errors.append(f"extractor runes: {runes.to_dict() if runes else None} != {expected_runes}")
+    items = extracted.item_build()
+    if (items.to_dict() if items else None) != expected_items:
+        errors.append(f"extractor items: {items.to_dict() if items else None} != {expected_items}")
+    spells = extracted.spells if len(extracted.spells) == 2 \
+        else provider._default_spells(page.champion_id)
+    if spells != page.spells:
+        errors.append(f"extractor spells: {spells} != {page.spells}")
+
+    # Stopping early must not change the result
+    full = FULL_SCAN.extract(page.html)
+    if (full.rune_page, full.shards, full.items, full.spells) != \
+            (extracted.rune_page, extracted.shards, extracted.items, extracted.spells):
+        errors.append(f"extractor: early stop {extracted.rune_page} differs from "
+                      f"full scan {full.rune_page}")
+
+    return baseline_errors, errors
+
+
+def run_checks(provider: UGGScraperProvider, pages: list) -> bool:
+    """Check every page, print the results and return True if nothing regressed"""
+    extractor = UGGExtractor()
+    counts = {'PASS': 0, 'FAIL': 0, 'XFAIL': 0, 'XPASS': 0}
+    baseline_xfails = 0
+
+    for page in pages:
+        baseline_errors, errors = check_page(provider, extractor, page)
+        if page.baseline_xfail and not page.xfail:
+            if baseline_errors:
+                baseline_xfails += 1
+                print(f"  [BASELINE XFAIL] {page.name} - {page.baseline_xfail}")
+            else:
+                print(f"  [BASELINE XPASS] {page.name} - drop its baseline_xfail: "
+                      f"{page.baseline_xfail}")
+        else:
+            errors = baseline_errors + errors
+        if page.xfail:
+            status = 'XFAIL' if errors else 'XPASS'
+        else:
+            status = 'FAIL' if errors else 'PASS'
+        counts[status] += 1
+
+        if status == 'FAIL':
+            print(f"  [FAILED] {page.name}")
+            for error in errors:
+                print(f"      {error}")
+        elif status == 'XPASS':
+            print(f"  [XPASS] {page.name} - known issue looks fixed, drop its xfail: {page.xfail}")
+        elif status == 'XFAIL':
+            print(f"  [XFAIL] {page.name} - {page.xfail}")
+
+    print(f"  {counts['PASS']} passed, {counts['FAIL']} failed, "
+          f"{counts['XFAIL']} xfail, {counts['XPASS']} xpass "
+          f"({baseline_xfails} passed by UGGExtractor only)")
+    return counts['FAIL'] == 0
+
+
+def bench(label: str, func, pages: list, repeat: int):
+    """Print pages/sec, MB/sec and per-page allocation figures for func(page)"""
+    total_bytes = sum(page.size for page in pages) * repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            func(page)
+    elapsed = time.perf_counter() - start
+
+    # Allocation pass (separate, tracemalloc slows everything down)
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    for page in pages:
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func(page)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        peaks.append(peak - baseline)
+        blocks.append(sum(stat.count_diff for stat in after.compare_to(before, 'filename')
+                          if stat.count_diff > 0))
+    tracemalloc.stop()
+
+    pages_per_sec = len(pages) * repeat / elapsed
+    mb_per_sec = total_bytes / elapsed / (1024 * 1024)
+    print(f"  {label:<28} {pages_per_sec:9.1f} pages/s {mb_per_sec:8.1f} MB/s "
+          f"{sum(peaks) / len(peaks) / 1024:8.1f} KB peak/page "
+          f"{sum(blocks) / len(blocks):6.1f} blocks kept/page")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="timing passes over the corpus")
+    parser.add_argument('--manifest', default=str(MANIFEST_PATH), help="corpus manifest")
+    args = parser.parse_args()
+
+    pages = load_corpus(Path(args.manifest))
+    provider = UGGScraperProvider()
+    extractor = UGGExtractor()
+    total_mb = sum(page.size for page in pages) / (1024 * 1024)
+    sources = sorted({page.source for page in pages})
+    print(f"Corpus: {len(pages)} pages, {total_mb:.1f} MB ({', '.join(sources)})")
+    print()
+
+    regression = [page for page in pages if not page.smoke]
+    smoke = [page for page in pages if page.smoke]
+    print(f"Correctness, regression pages ({len(regression)}):")
+    ok = run_checks(provider, regression)
+    print(f"Correctness, smoke tests ({len(smoke)} synthetic pages):")
+    ok = run_checks(provider, smoke) and ok
+    print()
+
+    print(f"Throughput ({args.repeat} passes):")
+    bench("_extract_runes_from_html", lambda page: provider._extract_runes_from_html(page.html),
+          pages, args.repeat)
+    bench("_extract_items_from_html", lambda page: provider._extract_items_from_html(page.html),
+          pages, args.repeat)
+    bench("_extract_summoner_spells",
+          lambda page: provider._extract_summoner_spells(page.html, page.champion_id),
+          pages, args.repeat)
+    bench("UGGExtractor.extract", lambda page: extractor.extract(page.html), pages, args.repeat)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
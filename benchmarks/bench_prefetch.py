@@ -0,0 +1,153 @@
+"""
+Benchmark: champ select prefetch for trades, position swaps and the ARAM bench
+Builds champ select sessions (from mock_lcu's synthetic recordings) where the
+local player then trades, swaps positions or grabs a bench champion, and times
+the build lookup for the champion they end up on - with an empty cache, and
+after SessionPrefetcher has had --think seconds to warm the candidates.
+
+Usage: python benchmarks/bench_prefetch.py [--trials 10] [--ugg-latency 0.05]
+                                           [--think 0.5] [--concurrency 2]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import copy
+import io
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import SESSION_URI, make_champ_select_recording
+from mock_server import MockConfig, MockServer
+from cache.build_cache import BuildCache
+from cache.prefetch import SessionPrefetcher, prefetch_candidates
+from providers.base import ROLES
+from providers.http import HTTPClient
+from providers.ugg_scraper import UGGScraperProvider
+
+PATCH = "14_1"
+
+
+def final_session(recording: dict) -> dict:
+    """Last champ select session in a recording (everyone has a champion)"""
+    sessions = [event['data'] for event in recording['events']
+                if event['uri'] == SESSION_URI and event['data']]
+    return copy.deepcopy(sessions[-1])
+
+
+def local_player(session: dict) -> dict:
+    return next(player for player in session['myTeam']
+                if player['cellId'] == session['localPlayerCellId'])
+
+
+def aram_bench_grab(seed: int):
+    """ARAM session with a bench; the local player grabs one bench champion"""
+    session = final_session(make_champ_select_recording(1 + seed % 20, aram=True, seed=seed))
+    target = random.Random(seed).choice(session['benchChampions'])['championId']
+    return session, (target, 'middle')
+
+
+def draft_trade(seed: int):
+    """Draft session after picks; a teammate offers a trade, others are available"""
+    role = ROLES[seed % len(ROLES)]
+    session = final_session(make_champ_select_recording(1 + seed % 20, role, seed=seed))
+    teammates = [player for player in session['myTeam']
+                 if player['cellId'] != session['localPlayerCellId']]
+    offer = random.Random(seed).choice(teammates)
+    session['trades'] = [{'id': player['cellId'], 'cellId': player['cellId'],
+                          'state': 'RECEIVED' if player is offer else 'AVAILABLE'}
+                         for player in teammates]
+    return session, (offer['championId'], local_player(session)['assignedPosition'])
+
+
+def draft_position_swap(seed: int):
+    """Draft session after picks; a teammate offers to swap positions"""
+    role = ROLES[seed % len(ROLES)]
+    session = final_session(make_champ_select_recording(1 + seed % 20, role, seed=seed))
+    teammates = [player for player in session['myTeam']
+                 if player['cellId'] != session['localPlayerCellId']]
+    offer = random.Random(seed).choice(teammates)
+    session['positionSwaps'] = [{'id': player['cellId'], 'cellId': player['cellId'],
+                                 'state': 'RECEIVED' if player is offer else 'AVAILABLE'}
+                                for player in teammates]
+    return session, (local_player(session)['championId'], offer['assignedPosition'])
+
+
+async def lookup(ugg_url: str, http: HTTPClient, tmp: str, session: dict, target,
+                 args, prefetch: bool):
+    """Time the target's build lookup with a fresh cache; return (ms, U.GG fetches)"""
+    cache = BuildCache(db_path=str(Path(tmp) / f"prefetch-{time.monotonic_ns()}.db"))
+    provider = UGGScraperProvider(cache=cache, http=http, base_url=ugg_url, ddragon_url=ugg_url)
+    prefetcher = SessionPrefetcher(
+        lambda champion_id, role: provider.get_build(champion_id, role, PATCH),
+        concurrency=args.concurrency
+    )
+    try:
+        if prefetch:
+            prefetcher.on_session(session)
+            await asyncio.sleep(args.think)
+
+        start = time.perf_counter()
+        await provider.get_build(*target, PATCH)
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, prefetcher.stats.fetched
+    finally:
+        await prefetcher.stop()
+        cache.close()
+
+
+async def run(args):
+    ugg = MockServer(MockConfig(latency=args.ugg_latency, seed=1))
+    ugg_url = await ugg.start()
+    http = HTTPClient()
+    print(f"U.GG latency {args.ugg_latency * 1000:.0f} ms, {args.think:.1f} s before the "
+          f"swap, prefetch concurrency {args.concurrency}")
+
+    scenarios = (("ARAM bench grab", aram_bench_grab), ("draft trade", draft_trade),
+                 ("draft position swap", draft_position_swap))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, scenario in scenarios:
+                results = {False: [], True: []}
+                fetched = []
+                ranks = []
+                for seed in range(args.trials):
+                    session, target = scenario(seed)
+                    candidates = [(champion_id, role)
+                                  for _, champion_id, role in prefetch_candidates(session)]
+                    ranks.append(candidates.index(target) + 1 if target in candidates else 0)
+                    for prefetch in (False, True):
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            elapsed, count = await lookup(ugg_url, http, tmp, session, target,
+                                                          args, prefetch)
+                        results[prefetch].append(elapsed)
+                        if prefetch:
+                            fetched.append(count)
+
+                print(f"{label} (target ranked {statistics.mean(ranks):.1f} of "
+                      f"~{statistics.mean(fetched):.1f} prefetched)")
+                for prefetch, name in ((False, "no prefetch"), (True, "prefetched")):
+                    values = sorted(results[prefetch])
+                    print(f"  {name:<12} p50 {statistics.median(values):7.2f} ms  "
+                          f"max {values[-1]:7.2f} ms")
+    finally:
+        await http.close()
+        await ugg.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Champ select prefetch benchmark")
+    parser.add_argument('--trials', type=int, default=10, help="sessions per scenario")
+    parser.add_argument('--ugg-latency', type=float, default=0.05, help="mock U.GG seconds/request")
+    parser.add_argument('--think', type=float, default=0.5,
+                        help="seconds between the session update and the swap")
+    parser.add_argument('--concurrency', type=int, default=2, help="prefetch fetches in flight")
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,113 @@
+"""
+Benchmark: rune page validation and repair
+Runs PerkCatalog.validate() and repair() over hand-picked pages (valid,
+reordered, wrong row, stale IDs, short), checks both against the expected
+result and that they agree (a page validate() accepts comes back from
+repair() unchanged), then times them. Exits 1 on any mismatch.
+
+Usage: python benchmarks/bench_rune_catalog.py [--repeat 20000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from providers.base import RuneData
+from runes.catalog import PerkCatalog
+
+
+# Electrocute (Domination) with Sorcery secondary
+PRIMARY = [8112, 8143, 8140, 8135]
+SHARDS = [5008, 5008, 5001]
+
+# name -> (page, problems expected from validate(), perks expected from repair())
+CASES = {
+    'valid': (
+        RuneData(8100, 8200, PRIMARY + [8226, 8237] + SHARDS),
+        False, PRIMARY + [8226, 8237] + SHARDS,
+    ),
+    'secondary rows descending': (
+        RuneData(8100, 8200, PRIMARY + [8237, 8226] + SHARDS),
+        False, PRIMARY + [8237, 8226] + SHARDS,
+    ),
+    'primary rows reordered': (
+        RuneData(8100, 8200, [8143, 8112, 8135, 8140, 8226, 8237] + SHARDS),
+        True, PRIMARY + [8226, 8237] + SHARDS,
+    ),
+    'secondary runes in one row': (
+        RuneData(8100, 8200, PRIMARY + [8226, 8224] + SHARDS),
+        True, PRIMARY + [8226, 8210] + SHARDS,
+    ),
+    'keystone as secondary': (
+        RuneData(8100, 8200, PRIMARY + [8214, 8237] + SHARDS),
+        True, PRIMARY + [8237, 8224] + SHARDS,
+    ),
+    'stale rune ID': (
+        RuneData(8100, 8200, [8112, 8143, 9999, 8135, 8226, 8237] + SHARDS),
+        True, [8112, 8143, 8137, 8135, 8226, 8237] + SHARDS,
+    ),
+    'stale shard ID': (
+        RuneData(8100, 8200, PRIMARY + [8226, 8237, 5008, 5002, 5001]),
+        True, PRIMARY + [8226, 8237, 5008, 5008, 5001],
+    ),
+    'short page': (
+        RuneData(8100, 8200, PRIMARY + [8226, 8237]),
+        True, PRIMARY + [8226, 8237, 5008, 5008, 5011],
+    ),
+}
+
+
+def check(catalog: PerkCatalog) -> bool:
+    """Check every case; returns True if all match"""
+    ok = True
+    for name, (runes, invalid, expected) in CASES.items():
+        problems = catalog.validate(runes)
+        repaired, fixes = catalog.repair(runes)
+        errors = []
+        if bool(problems) != invalid:
+            errors.append(f"validate: {problems or 'valid'}")
+        if repaired.selected_perks != expected:
+            errors.append(f"repair: {repaired.selected_perks} != {expected}")
+        if bool(fixes) != invalid:
+            errors.append(f"repair fixes: {fixes or 'none'}")
+        if not invalid and repaired is not runes:
+            errors.append("repair rebuilt a valid page")
+        if catalog.validate(repaired):
+            errors.append(f"repaired page invalid: {catalog.validate(repaired)}")
+
+        status = "FAIL" if errors else "PASS"
+        print(f"  {status}  {name:<28} {'; '.join(fixes) if fixes else '-'}")
+        for error in errors:
+            print(f"        {error}")
+        ok = ok and not errors
+    return ok
+
+
+def run(args):
+    catalog = PerkCatalog.bundled()
+    print(f"Catalog: {len(catalog)} perks ({catalog.source})")
+    ok = check(catalog)
+
+    pages = [runes for runes, _, _ in CASES.values()]
+    for label, method in (('validate', catalog.validate), ('repair', catalog.repair)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for runes in pages:
+                method(runes)
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<9} {elapsed / (args.repeat * len(pages)) * 1e6:6.2f} us/page")
+
+    if not ok:
+        print("[FAILED] validate() and repair() don't match the expected pages")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rune page validation/repair benchmark")
+    parser.add_argument('--repeat', type=int, default=20000, help="timing passes over the pages")
+    run(parser.parse_args())
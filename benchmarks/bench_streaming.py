@@ -0,0 +1,104 @@
+"""
+Benchmark: streaming scrape vs reading the whole page before parsing
+Serves a synthetic U.GG-shaped page from a local server at a throttled rate
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from providers.http import HTTPClient
+from providers.ugg_scraper import UGGScraperProvider
+from providers.ugg_extractor import UGGExtractor, StreamingExtractor
+from bench_extractor import make_page
+
+CHUNK = 8 * 1024
+BYTES_PER_SEC = 2 * 1024 * 1024  # Simulated download speed
+
+
+def check_chunk_boundaries(html: str) -> bool:
+    """Streamed results must match a full scan no matter where chunks split"""
+    expected = UGGExtractor().extract(html)
+    for size in (1, 7, 64, 100, 1000, 4096):
+        stream = StreamingExtractor()
+        for start in range(0, len(html), size):
+            if stream.feed(html[start:start + size]):
+                break
+        result = stream.finish()
+        if (result.trees, result.shards, result.items, result.spells) != \
+                (expected.trees, expected.shards, expected.items, expected.spells):
+            print(f"  [FAILED] mismatch with {size}-char chunks")
+            return False
+    return True
+
+
+async def serve(body: bytes):
+    """Start a local server that trickles `body` out at BYTES_PER_SEC"""
+    sent = {'bytes': 0}
+
+    async def handler(request):
+        response = web.StreamResponse(headers={'Content-Type': 'text/html; charset=utf-8'})
+        await response.prepare(request)
+        try:
+            for start in range(0, len(body), CHUNK):
+                await response.write(body[start:start + CHUNK])
+                sent['bytes'] += min(CHUNK, len(body) - start)
+                await asyncio.sleep(CHUNK / BYTES_PER_SEC)
+            await response.write_eof()
+        except (ConnectionResetError, ConnectionError):
+            pass
+        return response
+
+    app = web.Application()
+    app.router.add_get('/lol/champions/{name}/build', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port, sent
+
+
+async def time_scrape(streaming: bool, port: int, sent: dict) -> tuple:
+    http = HTTPClient()
+    provider = UGGScraperProvider(http=http, streaming=streaming,
+                                  base_url=f"http://127.0.0.1:{port}")
+    sent['bytes'] = 0
+
+    start = time.perf_counter()
+    build = await provider.get_build(103, 'middle', '16.3')
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.2)  # Let the server notice the closed connection
+    await http.close()
+    return elapsed, sent['bytes'], build
+
+
+async def main():
+    for size_kb in (100, 400, 800):
+        html = make_page(size_kb)
+        body = html.encode()
+        print(f"Page size: {len(body) / 1024:.0f} KB at {BYTES_PER_SEC // 1024} KB/s")
+        print(f"  chunk boundaries handled: {check_chunk_boundaries(html)}")
+
+        runner, port, sent = await serve(body)
+        try:
+            full_time, full_bytes, full_build = await time_scrape(False, port, sent)
+            stream_time, stream_bytes, stream_build = await time_scrape(True, port, sent)
+        finally:
+            await runner.cleanup()
+
+        print(f"  full read:  {full_time * 1000:7.1f} ms, {full_bytes / 1024:6.0f} KB sent")
+        print(f"  streaming:  {stream_time * 1000:7.1f} ms, {stream_bytes / 1024:6.0f} KB sent")
+        print(f"  same build: {full_build.to_dict() == stream_build.to_dict()}")
+        print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
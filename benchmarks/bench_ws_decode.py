@@ -0,0 +1,126 @@
+"""
+Benchmark: LCU WebSocket frame decoding
+Feeds champ select frames through LCUWebSocket._handle_message with each
+available JSON decoder, with and without the pre-decode topic/URI filter.
+
+Usage: python benchmarks/bench_ws_decode.py [--recording FILE] [--repeat 20]
+Without --recording, a synthetic draft champ select (mock_lcu.py) is used.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import load_recording, make_champ_select_recording
+from lcu.decoder import DECODERS, FrameDecoder
+from lcu.websocket import LCUWebSocket, ALL_EVENTS, event_topic
+
+
+def to_frame(topic: str, event: dict) -> str:
+    # The client sends payload keys in this order (uri last)
+    return json.dumps([8, topic, {'data': event['data'], 'eventType': event['eventType'],
+                                  'uri': event['uri']}], separators=(',', ':'))
+
+
+def noise_events(count: int, seed: int = 0) -> list:
+    """Chat, presence, loot and patcher traffic seen on the full event stream"""
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        kind = rng.choice(('chat', 'presence', 'loot', 'patcher'))
+        if kind == 'chat':
+            uri = f"/lol-chat/v1/conversations/{rng.getrandbits(32):x}/messages"
+            data = [{'body': 'x' * rng.randint(10, 200), 'fromId': f"{rng.getrandbits(64):x}",
+                     'timestamp': '2026-01-01T00:00:00Z', 'type': 'chat'}]
+        elif kind == 'presence':
+            uri = f"/lol-chat/v1/friends/{rng.getrandbits(64):x}"
+            data = {'availability': 'chat', 'gameName': 'Friend', 'lol': {
+                'gameStatus': 'outOfGame', 'level': str(rng.randint(1, 500)),
+                'regalia': json.dumps({'bannerType': 2, 'crestType': 1}),
+                'championId': str(rng.randint(1, 900))}, 'statusMessage': ''}
+        elif kind == 'loot':
+            uri = '/lol-loot/v1/player-loot-map'
+            data = {f"CHAMPION_{i}": {'count': 1, 'lootName': f"CHAMPION_{i}", 'type': 'CHAMPION',
+                                      'value': rng.randint(450, 6300)} for i in range(40)}
+        else:
+            uri = '/patcher/v1/products/league_of_legends/state'
+            data = {'action': 'Idle', 'components': [{'id': 'game', 'progress': None}],
+                    'isUpToDate': True, 'percentPatched': 100.0}
+        events.append({'uri': uri, 'eventType': 'Update', 'data': data})
+    return events
+
+
+async def bench(label: str, ws: LCUWebSocket, frames: list, repeat: int):
+    total_bytes = sum(len(frame) for frame in frames) * repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            await ws._handle_message(frame)
+    elapsed = time.perf_counter() - start
+
+    per_frame = elapsed / (len(frames) * repeat) * 1e6
+    print(f"  {label:<34} {per_frame:8.2f} us/frame {total_bytes / elapsed / 2**20:8.1f} MB/s "
+          f"({ws.frames_skipped // repeat} skipped per pass)")
+    return elapsed
+
+
+def make_socket(decoder: str, paths, prefilter: bool = True) -> LCUWebSocket:
+    # Handlers run inline so the timings cover decode and dispatch only
+    ws = LCUWebSocket(0, 'bench', decoder=FrameDecoder(decoder), queue_size=0)
+
+    async def handler(data):
+        pass
+
+    for path in paths:
+        ws.on(path, handler)
+    if not prefilter:
+        ws._wanted = lambda message: True
+    return ws
+
+
+async def main(args):
+    recording = load_recording(args.recording) if args.recording \
+        else make_champ_select_recording(103, 'middle', seed=1)
+    events = recording['events']
+
+    # Per-endpoint topics: only champ select and gameflow frames arrive
+    subscribed = [to_frame(event_topic(event['uri']), event) for event in events]
+    # Full stream: the same frames interleaved with unrelated client traffic
+    noise = [to_frame(ALL_EVENTS, event) for event in noise_events(len(events) * 3)]
+    firehose = [to_frame(ALL_EVENTS, event) for event in events] + noise
+    random.Random(1).shuffle(firehose)
+
+    size = sum(len(frame) for frame in subscribed) / len(subscribed)
+    print(f"Recording: {recording.get('name')} - {len(events)} frames, {size / 1024:.1f} KB avg")
+    print(f"Decoders available: {', '.join(DECODERS)}")
+    print()
+
+    exact = ('/lol-champ-select/v1/session', '/lol-gameflow/v1/gameflow-phase')
+    print(f"Per-endpoint topics ({len(subscribed)} frames, all wanted):")
+    for name in DECODERS:
+        await bench(name, make_socket(name, exact), subscribed, args.repeat)
+    print()
+
+    wildcard = ('/lol-champ-select/*', '/lol-gameflow/v1/gameflow-phase')
+    print(f"Full OnJsonApiEvent stream ({len(firehose)} frames, "
+          f"{len(noise)} with no handler):")
+    for name in DECODERS:
+        await bench(f"{name}, decode everything", make_socket(name, wildcard, prefilter=False),
+                    firehose, args.repeat)
+        await bench(f"{name}, uri prefilter", make_socket(name, wildcard), firehose, args.repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LCU frame decode benchmark")
+    parser.add_argument('--recording', help="recording from record_lcu.py")
+    parser.add_argument('--repeat', type=int, default=20, help="passes over the frames")
+    asyncio.run(main(parser.parse_args()))
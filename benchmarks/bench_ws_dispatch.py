@@ -0,0 +1,102 @@
+"""
+Benchmark: WebSocket dispatch with a slow handler
+Publishes a burst of champ select session events from the mock League client
+to a deliberately slow session handler, interleaved with gameflow events for a
+fast handler, and compares running handlers inline on the reader with the
+bounded per-handler queues.
+
+Usage: python benchmarks/bench_ws_dispatch.py [--events 200] [--handler-time 0.05]
+                                              [--queue-size 64]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import MockLCU, PHASE_URI, SESSION_URI
+from lcu.dispatch import COALESCE, DROP_OLDEST
+from lcu.websocket import LCUWebSocket
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def run_mode(lcu: MockLCU, label: str, args, queue_size: int, overflow: str = COALESCE):
+    ws = LCUWebSocket(lcu.port, lcu.token, queue_size=queue_size, overflow=overflow)
+    published = {}
+    phase_latencies = []
+    session_calls = 0
+
+    async def on_session(data):
+        nonlocal session_calls
+        session_calls += 1
+        await asyncio.sleep(args.handler_time)  # e.g. waiting on a build fetch
+
+    async def on_phase(data):
+        phase_latencies.append((time.monotonic() - published[data]) * 1000)
+
+    ws.on(SESSION_URI, on_session)
+    ws.on(PHASE_URI, on_phase)
+    if not await ws.connect():
+        print(f"  {label:<24} [FAILED] could not connect")
+        return
+    listener = asyncio.create_task(ws.listen())
+    while len(lcu.subscriptions()) < 2:
+        await asyncio.sleep(0.01)
+
+    start = time.monotonic()
+    for index in range(args.events):
+        await lcu.publish(SESSION_URI, 'Update', {'timer': index, 'localPlayerCellId': 0})
+        if index % 10 == 0:
+            phase = f"Phase{index}"
+            published[phase] = time.monotonic()
+            await lcu.publish(PHASE_URI, 'Update', phase)
+        await asyncio.sleep(args.interval)
+
+    # Let the reader catch up, then wait for the queues to empty
+    while len(phase_latencies) < len(published) and time.monotonic() - start < 60:
+        await asyncio.sleep(0.01)
+    while not queue_size and session_calls < args.events and time.monotonic() - start < 60:
+        await asyncio.sleep(0.01)
+    await ws.drain(timeout=60)
+    elapsed = time.monotonic() - start
+
+    print(f"  {label:<24} gameflow p50 {percentile(phase_latencies, 0.5):8.1f} ms  "
+          f"p99 {percentile(phase_latencies, 0.99):8.1f} ms  "
+          f"session handler runs {session_calls:4}/{args.events}  done in {elapsed:5.2f} s")
+    for name, stats in ws.dispatch_stats().items():
+        print(f"      {name}: {stats}")
+
+    await ws.disconnect()
+    listener.cancel()
+
+
+async def main(args):
+    lcu = MockLCU()
+    await lcu.start()
+    print(f"{args.events} session events every {args.interval * 1000:.0f} ms, "
+          f"session handler takes {args.handler_time * 1000:.0f} ms")
+    try:
+        await run_mode(lcu, "inline", args, queue_size=0)
+        await run_mode(lcu, "queued, drop oldest", args, args.queue_size, DROP_OLDEST)
+        await run_mode(lcu, "queued, coalesce", args, args.queue_size, COALESCE)
+    finally:
+        await lcu.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="WebSocket dispatch benchmark")
+    parser.add_argument('--events', type=int, default=200, help="session events to publish")
+    parser.add_argument('--interval', type=float, default=0.002, help="seconds between events")
+    parser.add_argument('--handler-time', type=float, default=0.05,
+                        help="seconds the session handler takes")
+    parser.add_argument('--queue-size', type=int, default=64, help="events queued per handler")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,89 @@
+"""
+Capture live U.GG build pages into the offline corpus
+Saves each page gzipped under benchmarks/corpus/ and adds a "captured" entry
+to manifest.json, with expected values taken from the current parser.
+
+Usage: python benchmarks/capture_corpus.py CHAMPION_ID ROLE [CHAMPION_ID ROLE ...]
+       (ROLE is top/jungle/middle/bottom/support or aram)
+
+Check each new entry's expected build against the page on u.gg before
+committing it - the point of the corpus is to catch the parser being wrong.
+"""
+
+import asyncio
+import gzip
+import json
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from corpus import CORPUS_DIR, MANIFEST_PATH
+from providers.http import close_http_client
+from providers.ugg_scraper import UGGScraperProvider, CHAMPION_NAMES, SCRAPE_TIMEOUT
+
+
+async def capture(provider: UGGScraperProvider, champion_id: int, role: str) -> dict:
+    """Download one page and build its manifest entry"""
+    champion_name = CHAMPION_NAMES[champion_id]
+    if role == 'aram':
+        url = f"{provider.base_url}/{champion_name}/build?queueType=normal_aram"
+    else:
+        url = f"{provider.base_url}/{champion_name}/build?role={role}"
+
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    async with provider.http.get(url, headers=headers, timeout=SCRAPE_TIMEOUT) as response:
+        response.raise_for_status()
+        html = await response.text()
+
+    name = f"{champion_name}_{role}"
+    file_name = f"{name}.html.gz"
+    with gzip.open(CORPUS_DIR / file_name, 'wt', encoding='utf-8') as f:
+        f.write(html)
+
+    runes = provider._extract_runes_from_html(html)
+    items = provider._extract_items_from_html(html)
+    if runes is None:
+        print(f"[FAILED] {name}: no runes parsed, fill in expected runes by hand")
+
+    print(f"[OK] {name}: {len(html) // 1024} KB")
+    return {
+        'name': name,
+        'champion_id': champion_id,
+        'role': role,
+        'source': 'captured',
+        'file': file_name,
+        'expected': {
+            'runes': runes.to_dict() if runes else None,
+            'items': items.to_dict() if items else None,
+            'spells': provider._extract_summoner_spells(html, champion_id),
+        },
+    }
+
+
+async def main(targets):
+    with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    provider = UGGScraperProvider()
+    try:
+        for champion_id, role in targets:
+            entry = await capture(provider, champion_id, role)
+            manifest['pages'] = [page for page in manifest['pages'] if page['name'] != entry['name']]
+            manifest['pages'].append(entry)
+    finally:
+        await close_http_client()
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.write('\n')
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if not args or len(args) % 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    asyncio.run(main([(int(args[i]), args[i + 1]) for i in range(0, len(args), 2)]))
@@ -0,0 +1,202 @@
+"""
+Offline U.GG page corpus
+Loads the pages listed in corpus/manifest.json, with the build each one should parse to
+
+Each manifest entry is one of:
+  - "captured": a real U.GG page saved by capture_corpus.py as corpus/<file>
+                (gzipped HTML), expected values checked by hand
+  - "handwritten": a small adversarial page written by hand as corpus/<file>
+                   (plain HTML): alternative rune pages, greyed-out runes,
+                   blocks in an unusual order. Expected values are written
+                   from what the page shows, not from a parser run
+  - "synthetic": a smoke test page rendered here from the entry's expected
+                 build, laid out like a U.GG build page (rune page, spells
+                 and items near the top, then matchups, tables and a large
+                 script payload)
+
+Synthetic pages are rendered from the very values they are checked against,
+so they only catch parsers misreading the layout render_page() produces:
+they are smoke tests (one per role, plus the known gaps), not regression
+pages. Captured and handwritten pages are the regression set; add captured
+pages when you can reach u.gg.
+"""
+
+import gzip
+import json
+import random
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from providers.base import RuneData, ItemBuild
+from providers.ugg_extractor import RUNE_NAME_TO_ID, TREE_NAME_TO_ID, SPELL_NAME_TO_ID
+
+CORPUS_DIR = Path(__file__).parent / 'corpus'
+MANIFEST_PATH = CORPUS_DIR / 'manifest.json'
+
+# Sources whose pages are smoke tests rather than regression pages
+SMOKE_SOURCES = ('synthetic',)
+
+DDRAGON = "https://ddragon.leagueoflegends.com/cdn"
+PATCH = "16.3.1"
+
+RUNE_ID_TO_NAME = {rune_id: name for name, rune_id in RUNE_NAME_TO_ID.items()}
+TREE_ID_TO_NAME = {tree_id: name for name, tree_id in TREE_NAME_TO_ID.items()}
+SPELL_ID_TO_NAME = {spell_id: name for name, spell_id in SPELL_NAME_TO_ID.items()}
+# Spells U.GG shows that the parser has no ID for yet
+EXTRA_SPELL_NAMES = {32: "SummonerSnowball", 13: "SummonerMana", 2202: "SummonerCherryFlash"}
+
+
+class CorpusPage:
+    """One page plus the build it should parse to"""
+
+    def __init__(self, entry: dict, html: str):
+        self.name = entry['name']
+        self.champion_id = entry['champion_id']
+        self.role = entry['role']
+        self.source = entry['source']
+        self.smoke = self.source in SMOKE_SOURCES
+        self.xfail: Optional[str] = entry.get('xfail')  # Known parser gap, if any
+        # Known gap in the multi-scan baseline only (UGGExtractor must still pass)
+        self.baseline_xfail: Optional[str] = entry.get('baseline_xfail')
+        self.html = html
+        self.size = len(html.encode('utf-8'))
+
+        expected = entry['expected']
+        self.runes = RuneData.from_dict(expected['runes'])
+        self.items = ItemBuild.from_dict(expected['items']) if expected.get('items') else None
+        self.spells: List[int] = list(expected['spells'])
+
+
+def load_corpus(manifest_path: Path = MANIFEST_PATH) -> List[CorpusPage]:
+    """
+    Load every page in the manifest
+
+    Args:
+        manifest_path: Path to manifest.json
+
+    Returns:
+        List of CorpusPage in manifest order
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    pages = []
+    for entry in manifest['pages']:
+        if entry['source'] == 'captured':
+            with gzip.open(manifest_path.parent / entry['file'], 'rt', encoding='utf-8') as f:
+                html = f.read()
+        elif entry['source'] == 'handwritten':
+            with open(manifest_path.parent / entry['file'], 'r', encoding='utf-8') as f:
+                html = f.read()
+        else:
+            html = render_page(entry)
+        pages.append(CorpusPage(entry, html))
+    return pages
+
+
+def _perk_img(tree_name: str, rune_id: int) -> str:
+    name = RUNE_ID_TO_NAME[rune_id]
+    return (f'<div class="perk perk-active"><img alt="{name}" '
+            f'src="{DDRAGON}/img/perk-images/Styles/{tree_name}/{name}/{name}.png"></div>')
+
+
+def _shard_img(shard_id: int) -> str:
+    name = RUNE_ID_TO_NAME[shard_id]
+    return (f'<div class="shard shard-active"><img alt="{name}" '
+            f'src="{DDRAGON}/img/perk-images/StatMods/{name}.png"></div>')
+
+
+def _item_img(item_id: int) -> str:
+    return f'<div class="item-img"><img src="{DDRAGON}/{PATCH}/img/item/{item_id}.png"></div>'
+
+
+def _spell_img(spell_id: int) -> str:
+    name = SPELL_ID_TO_NAME.get(spell_id) or EXTRA_SPELL_NAMES[spell_id]
+    return f'<img class="summoner-spell" src="{DDRAGON}/{PATCH}/img/spell/{name}.png">'
+
+
+def render_page(entry: dict) -> str:
+    """
+    Render a synthetic build page for a manifest entry
+
+    Deterministic for a given entry (filler is seeded by entry['seed']).
+    The build section includes the noise real pages have: potions and wards
+    among the starting items, items repeated between sections, champion and
+    ability icons.
+    """
+    rng = random.Random(entry['seed'])
+    expected = entry['expected']
+    runes = expected['runes']
+    perks = runes['selectedPerkIds']
+    primary = TREE_ID_TO_NAME[runes['primaryStyleId']]
+    secondary = TREE_ID_TO_NAME[runes['subStyleId']]
+    champion = entry['name'].split('_')[0].capitalize()
+
+    parts = [
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">',
+        f'<title>{champion} Build - U.GG</title>',
+        ''.join(f'<link rel="preload" href="/static/js/chunk-{rng.getrandbits(32):08x}.js">'
+                for _ in range(40)),
+        '</head><body><div id="root">',
+        '<nav class="site-nav">' + ''.join(
+            f'<a href="/lol/{section}">{section}</a>'
+            for section in ('champions', 'tier-list', 'leaderboards', 'multisearch') * 30
+        ) + '</nav>',
+        f'<div class="champion-header"><img src="{DDRAGON}/{PATCH}/img/champion/{champion}.png">',
+        ''.join(f'<img src="{DDRAGON}/{PATCH}/img/spell/{champion}{key}.png">' for key in 'QWER'),
+        '</div>',
+    ]
+
+    # Rune page
+    parts.append(f'<div class="rune-tree primary-tree" data-tree="{primary}">')
+    parts.extend(_perk_img(primary, rune_id) for rune_id in perks[:4])
+    parts.append(f'</div><div class="rune-tree secondary-tree" data-tree="{secondary}">')
+    parts.extend(_perk_img(secondary, rune_id) for rune_id in perks[4:6])
+    parts.append('</div><div class="stat-shards">')
+    parts.extend(_shard_img(shard_id) for shard_id in perks[6:9])
+    parts.append('</div>')
+
+    # Summoner spells
+    parts.append('<div class="summoner-spells">')
+    parts.extend(_spell_img(spell_id) for spell_id in expected['spells'])
+    parts.append('</div>')
+
+    # Items: starting (with consumables), core, then situational
+    items = expected.get('items') or {}
+    starting = items.get('starting_items', [])
+    core = items.get('core_items', [])
+    situational = items.get('situational_items', [])
+    parts.append('<div class="starting-items">')
+    parts.extend(_item_img(item_id) for item_id in starting[:1] + [2003, 3340] + starting[1:])
+    parts.append('</div><div class="core-items">')
+    parts.extend(_item_img(item_id) for item_id in core)
+    parts.append('</div><div class="situational-items">')
+    parts.extend(_item_img(item_id) for item_id in situational + core[:1])
+    parts.append('</div>')
+
+    # Everything below the build: matchups, stat tables, script payload
+    size = sum(len(part) for part in parts)
+    target = entry.get('size_kb', 300) * 1024
+    rows = []
+    while size < target * 0.4:
+        row = (f'<tr class="matchup"><td><img src="{DDRAGON}/{PATCH}/img/champion/'
+               f'Champ{rng.randint(1, 170)}.png"></td><td>{rng.uniform(40, 60):.2f}%</td>'
+               f'<td>{rng.randint(100, 90000):,}</td></tr>')
+        rows.append(row)
+        size += len(row)
+    parts.append('<table class="matchups">' + ''.join(rows) + '</table>')
+
+    payload = []
+    while size < target:
+        chunk = (f'{{"id":{rng.randint(1, 10**6)},"winRate":{rng.random():.6f},'
+                 f'"matches":{rng.randint(0, 10**5)},"tier":"{rng.choice("SABCD")}"}},')
+        payload.append(chunk)
+        size += len(chunk)
+    parts.append('</div><script>window.__SSR_DATA__={"stats":[' + ''.join(payload) + ']}</script>')
+    parts.append('</body></html>')
+    return ''.join(parts)
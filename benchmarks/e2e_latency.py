@@ -0,0 +1,139 @@
+"""
+End-to-end latency: champion locked in -> rune page applied
+Runs the real LeagueHelper against the mock League client (mock_lcu.py) and
+the mock U.GG server (mock_server.py), replays champ selects and reports
+p50/p99 of the time from the lock-in event to the rune page write. The page
+is staged while the champion is hovered, so in draft this should be one LCU
+round trip; in ARAM the champion is assigned (hover and lock-in are the same
+event), so it includes the build fetch.
+
+Exits with status 1 unless every replayed champ select locked in, was
+followed by a rune page write and was reported applied by the app.
+
+Usage: python benchmarks/e2e_latency.py [--iterations 30] [--speed 20]
+                                        [--lcu-latency 0.002] [--ugg-latency 0.05]
+                                        [--aram] [--verbose]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import MockLCU, make_champ_select_recording
+from mock_server import MockConfig, MockServer
+from cache.build_cache import BuildCache
+from lcu.connector import LCUConnector
+from main import LeagueHelper
+from providers.base import ROLES
+from providers.http import HTTPClient
+from providers.ugg_scraper import UGGScraperProvider, CHAMPION_NAMES
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def measure(lcu: MockLCU, app: LeagueHelper, champions, args, prefetch: bool):
+    """
+    Replay one champ select per champion
+
+    Returns:
+        (lock-in -> page write latencies in ms, lock-ins seen, pages the app applied)
+    """
+    latencies = []
+    lock_ins = 0
+    applied_before = app.stager.stats.applied
+    for index, champion_id in enumerate(champions):
+        role = ROLES[index % len(ROLES)]
+        if prefetch:
+            # ARAM sessions have no assigned position; the app looks up 'middle'
+            await app.provider.get_build(champion_id, 'middle' if args.aram else role,
+                                         app.current_patch)
+
+        recording = make_champ_select_recording(champion_id, role, aram=args.aram, seed=index)
+        lock_ins_before = len(lcu.lock_ins)
+        replay = asyncio.create_task(lcu.replay(recording, args.speed))
+        while len(lcu.lock_ins) == lock_ins_before and not replay.done():
+            await asyncio.sleep(0.001)
+
+        if len(lcu.lock_ins) > lock_ins_before:
+            lock_ins += 1
+            locked_at = lcu.lock_ins[lock_ins_before][0]
+            written_at = await lcu.wait_for_page_write(locked_at, timeout=10)
+            if written_at is not None:
+                latencies.append((written_at - locked_at) * 1000)
+        await replay
+    await app.websocket.drain()
+    return latencies, lock_ins, app.stager.stats.applied - applied_before
+
+
+async def run(args):
+    lcu = MockLCU(latency=args.lcu_latency)
+    lcu.phase = 'Matchmaking'  # Not idle, so the cache warmer stays paused
+    port = await lcu.start()
+    ugg = MockServer(MockConfig(latency=args.ugg_latency, seed=1))
+    ugg_url = await ugg.start()
+    http = HTTPClient()
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = BuildCache(db_path=str(Path(tmp) / 'e2e.db'))
+        provider = UGGScraperProvider(cache=cache, http=http, base_url=ugg_url, ddragon_url=ugg_url)
+        app = LeagueHelper(connector=LCUConnector(port=port, token=lcu.token),
+                           build_cache=cache, provider=provider)
+        with quiet:
+            app_task = asyncio.create_task(app.start())
+            while not lcu.subscriptions():
+                await asyncio.sleep(0.01)
+
+        champions = sorted(CHAMPION_NAMES)
+        n = args.iterations
+        try:
+            with quiet:
+                cold = await measure(lcu, app, champions[:n], args, prefetch=False)
+                warm = await measure(lcu, app, champions[n:2 * n], args, prefetch=True)
+        finally:
+            with quiet:
+                await app.stop()
+                app_task.cancel()
+                await http.close()
+                await ugg.stop()
+                await lcu.stop()
+
+    mode = 'ARAM' if args.aram else 'draft'
+    print(f"Lock-in -> rune page applied ({mode}, LCU latency {args.lcu_latency * 1000:.0f} ms, "
+          f"U.GG latency {args.ugg_latency * 1000:.0f} ms, replay {args.speed}x)")
+    ok = True
+    for label, (latencies, lock_ins, applied) in (("cold cache", cold), ("warm cache", warm)):
+        if latencies:
+            print(f"  {label:<11} n={len(latencies):<4} p50 {percentile(latencies, 0.5):7.1f} ms  "
+                  f"p99 {percentile(latencies, 0.99):7.1f} ms  "
+                  f"mean {statistics.mean(latencies):7.1f} ms")
+        if not lock_ins == len(latencies) == applied == n:
+            ok = False
+            print(f"  {label:<11} [FAILED] {n} champ selects, {lock_ins} lock-ins, "
+                  f"{len(latencies)} page writes, {applied} applied")
+    print(f"  LCU REST requests: {lcu.requests}  staging: {app.stager.stats.to_dict()}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lock-in -> rune page latency")
+    parser.add_argument('--iterations', type=int, default=30, help="champ selects per mode")
+    parser.add_argument('--speed', type=float, default=20, help="replay speed multiplier")
+    parser.add_argument('--lcu-latency', type=float, default=0.002, help="mock LCU seconds/request")
+    parser.add_argument('--ugg-latency', type=float, default=0.05, help="mock U.GG seconds/request")
+    parser.add_argument('--aram', action='store_true', help="replay ARAM selects")
+    parser.add_argument('--verbose', action='store_true', help="show app output")
+    asyncio.run(run(parser.parse_args()))
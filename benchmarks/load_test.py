@@ -0,0 +1,99 @@
+"""
+Load test for the U.GG fetch pipeline against the mock server
+Phase 1 runs the cache warmer over every champion x role (plus ARAM);
+phase 2 replays a champ select burst of concurrent get_build calls.
+
+Usage: python benchmarks/load_test.py [--concurrency 16] [--latency 0.02]
+                                      [--error-rate 0.02] [--bytes-per-sec 0]
+                                      [--rate-limit 0] [--burst 500] [--verbose]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_server import MockConfig, MockServer
+from cache.build_cache import BuildCache
+from cache.warmer import CacheWarmer
+from providers.base import ROLES
+from providers.http import HTTPClient
+from providers.ugg_scraper import UGGScraperProvider, CHAMPION_NAMES
+
+
+async def run(args):
+    server = MockServer(MockConfig(latency=args.latency, jitter=args.latency / 2,
+                                   error_rate=args.error_rate,
+                                   bytes_per_sec=args.bytes_per_sec,
+                                   rate_limit=args.rate_limit, seed=1))
+    url = await server.start()
+    http = HTTPClient(limit_per_host=args.concurrency)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = BuildCache(db_path=str(Path(tmp) / 'load_test.db'))
+        provider = UGGScraperProvider(cache=cache, http=http, base_url=url, ddragon_url=url)
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+
+        try:
+            with quiet:
+                patch = await provider.get_current_patch()
+            print(f"Mock server at {url}, patch {patch}")
+
+            # Phase 1: warm the whole matrix
+            warmer = CacheWarmer(provider, cache, CHAMPION_NAMES.keys(),
+                                 concurrency=args.concurrency, delay=0)
+            start = time.perf_counter()
+            with quiet:
+                await warmer.run(patch)
+            elapsed = time.perf_counter() - start
+            requests = server.stats_dict()['requests']
+            print(f"Warm: {warmer.done} builds in {elapsed:.2f}s "
+                  f"({warmer.done / elapsed:.0f} builds/s), {requests} requests, "
+                  f"{len(cache)} cached")
+
+            # Phase 2: champ select burst - many concurrent lookups over a few champions
+            rng = random.Random(2)
+            champions = rng.sample(sorted(CHAMPION_NAMES), 10)
+            calls = [(rng.choice(champions), rng.choice(ROLES)) for _ in range(args.burst)]
+            cache.stats.reset()
+            start = time.perf_counter()
+            with quiet:
+                await asyncio.gather(*(provider.get_build(champion_id, role, patch)
+                                       for champion_id, role in calls))
+            elapsed = time.perf_counter() - start
+            print(f"Burst: {args.burst} get_build calls in {elapsed * 1000:.0f} ms, "
+                  f"cache {cache.stats}")
+
+            stats = server.stats_dict()
+            print(f"Server: {stats['requests']} requests {stats['statuses']}, "
+                  f"{stats['bytes_sent'] / (1024 * 1024):.1f} MB sent, "
+                  f"max {stats['max_in_flight']} in flight")
+            print(f"Provider: {provider.negative_cache.skips} negative cache skips, "
+                  f"{provider.in_flight.shared} coalesced scrapes, "
+                  f"{len(provider.refresher)} refreshes queued")
+        finally:
+            await provider.refresher.stop()
+            await http.close()
+            await server.stop()
+            cache.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the fetch pipeline")
+    parser.add_argument('--concurrency', type=int, default=16, help="warmer workers")
+    parser.add_argument('--latency', type=float, default=0.02, help="mock latency (seconds)")
+    parser.add_argument('--error-rate', type=float, default=0.02, help="mock 5xx rate")
+    parser.add_argument('--bytes-per-sec', type=int, default=0, help="mock body throttle")
+    parser.add_argument('--rate-limit', type=float, default=0, help="mock requests/sec limit")
+    parser.add_argument('--burst', type=int, default=500, help="concurrent get_build calls")
+    parser.add_argument('--verbose', action='store_true', help="show provider debug output")
+    asyncio.run(run(parser.parse_args()))
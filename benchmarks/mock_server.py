@@ -0,0 +1,292 @@
+"""
+Mock U.GG / Data Dragon server
+Serves corpus pages and build JSON locally with configurable latency, errors
+and throttling, so the fetch pipeline can be load-tested without network.
+
+Usage: python benchmarks/mock_server.py [--port 8700] [--latency 0.05] [--jitter 0.02]
+                                        [--error-rate 0.01] [--bytes-per-sec 2000000]
+                                        [--rate-limit 50]
+Then point the app at it:
+    UGG_BASE_URL=http://127.0.0.1:8700 UGG_STATS_BASE_URL=http://127.0.0.1:8700
+    DDRAGON_BASE_URL=http://127.0.0.1:8700 python src/main.py
+
+Routes (one host stands in for all three sites):
+    /lol/champions/{name}/build?role=... | ?queueType=normal_aram   (u.gg HTML)
+    /lol/1.5/overview/{patch}/{queue}/{champion_id}[/{role}]/1.5.0.json (stats2 JSON)
+    /lol/1.5/current_patch.json, /api/versions.json
+    /__stats                                                          (request counters)
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from aiohttp import web
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from corpus import CorpusPage, load_corpus
+from providers.ugg_scraper import CHAMPION_NAMES
+
+PATCH = "16.3.1"
+CHUNK_SIZE = 8 * 1024
+
+
+class MockConfig:
+    """Fault and speed settings, read on every request (safe to change while running)"""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_statuses: Tuple[int, ...] = (500, 502, 503), bytes_per_sec: int = 0,
+                 rate_limit: float = 0, rate_limit_status: int = 403,
+                 seed: Optional[int] = None):
+        """
+        Initialize MockConfig
+
+        Args:
+            latency: Seconds before the response starts
+            jitter: Extra random delay, uniform in [0, jitter] seconds
+            error_rate: Fraction of requests answered with a random error status
+            error_statuses: Statuses to pick errors from
+            bytes_per_sec: Body throttle (0 = unthrottled)
+            rate_limit: Requests per second allowed before answering
+                        rate_limit_status (0 = no limit); bursts up to one
+                        second's worth are allowed
+            rate_limit_status: Status for throttled requests (u.gg answers 403)
+            seed: Random seed for reproducible runs
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.bytes_per_sec = bytes_per_sec
+        self.rate_limit = rate_limit
+        self.rate_limit_status = rate_limit_status
+        self.rng = random.Random(seed)
+
+
+class MockServer:
+    """aiohttp app serving the corpus as u.gg, stats2.u.gg and Data Dragon"""
+
+    def __init__(self, config: Optional[MockConfig] = None):
+        """
+        Initialize MockServer
+
+        Args:
+            config: Fault and speed settings (defaults: no latency, no errors)
+        """
+        self.config = config or MockConfig()
+        self.pages = load_corpus()
+        self._by_name: Dict[str, CorpusPage] = {page.name: page for page in self.pages}
+        self._known_names = set(CHAMPION_NAMES.values())
+
+        self.statuses: Counter = Counter()
+        self.bytes_sent = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._tokens = 0.0
+        self._refilled_at = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+
+        self.app = web.Application(middlewares=[self._faults])
+        self.app.router.add_get('/lol/champions/{name}/build', self.build_page)
+        self.app.router.add_get('/lol/1.5/overview/{patch}/{queue}/{champion_id}/{role}/1.5.0.json',
+                                self.build_json)
+        self.app.router.add_get('/lol/1.5/overview/{patch}/{queue}/{champion_id}/1.5.0.json',
+                                self.build_json)
+        self.app.router.add_get('/lol/1.5/current_patch.json', self.current_patch)
+        self.app.router.add_get('/api/versions.json', self.versions)
+        self.app.router.add_get('/__stats', self.stats)
+
+    # === Lifecycle ===
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+
+        Returns:
+            Base URL, e.g. http://127.0.0.1:8700
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://{host}:{port}"
+
+    async def stop(self):
+        """Stop serving"""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # === Faults ===
+
+    def _take_token(self) -> bool:
+        """Token bucket for the rate limit"""
+        rate = self.config.rate_limit
+        if rate <= 0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(rate, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler):
+        """Apply latency, rate limiting and random errors, and count results"""
+        if request.path == '/__stats':
+            return await handler(request)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            config = self.config
+            delay = config.latency + config.rng.uniform(0, config.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if not self._take_token():
+                response = web.Response(status=config.rate_limit_status, text="Too many requests")
+            elif config.rng.random() < config.error_rate:
+                status = config.rng.choice(config.error_statuses)
+                response = web.Response(status=status, text=f"Mock error {status}")
+            else:
+                response = await handler(request)
+
+            self.statuses[response.status] += 1
+            return response
+        finally:
+            self.in_flight -= 1
+
+    async def _send(self, request: web.Request, body: bytes, content_type: str) -> web.StreamResponse:
+        """Write a body, throttled to config.bytes_per_sec"""
+        rate = self.config.bytes_per_sec
+        if rate <= 0:
+            self.bytes_sent += len(body)
+            return web.Response(body=body, content_type=content_type, charset='utf-8')
+
+        response = web.StreamResponse()
+        response.content_type = content_type
+        response.charset = 'utf-8'
+        response.content_length = len(body)
+        await response.prepare(request)
+        try:
+            for start in range(0, len(body), CHUNK_SIZE):
+                chunk = body[start:start + CHUNK_SIZE]
+                await response.write(chunk)
+                self.bytes_sent += len(chunk)
+                await asyncio.sleep(len(chunk) / rate)
+            await response.write_eof()
+        except ConnectionError:
+            pass  # Client stopped reading (e.g., streaming parse finished early)
+        return response
+
+    # === Routes ===
+
+    def _page_for(self, name: str, role: str) -> CorpusPage:
+        """Corpus page for champion + role, or a stand-in page picked by name"""
+        page = self._by_name.get(f"{name}_{role}")
+        if page is None:
+            page = self.pages[sum(map(ord, name + role)) % len(self.pages)]
+        return page
+
+    async def build_page(self, request: web.Request) -> web.StreamResponse:
+        name = request.match_info['name']
+        if name not in self._known_names:
+            return web.Response(status=404, text="Champion not found")
+
+        if request.query.get('queueType') == 'normal_aram':
+            role = 'aram'
+        else:
+            role = request.query.get('role', 'middle')
+        page = self._page_for(name, role)
+        return await self._send(request, page.html.encode('utf-8'), 'text/html')
+
+    async def build_json(self, request: web.Request) -> web.StreamResponse:
+        champion_id = int(request.match_info['champion_id'])
+        name = CHAMPION_NAMES.get(champion_id)
+        if name is None:
+            return web.Response(status=404, text="Not found")
+
+        role = 'aram' if request.match_info['queue'] == 'normal_aram' \
+            else request.match_info.get('role', 'middle')
+        page = self._page_for(name, role)
+        items = page.items.to_dict() if page.items else {}
+        data = {
+            'runes': [{
+                'primaryStyle': page.runes.primary_style,
+                'subStyle': page.runes.sub_style,
+                'perks': page.runes.selected_perks,
+            }],
+            'items': {'item_builds': [{
+                'starting_items': items.get('starting_items', []),
+                'core_items': items.get('core_items', []),
+                'item_options': items.get('situational_items', []),
+            }]},
+            'summoner_spells': [{'spells': page.spells}],
+        }
+        return await self._send(request, json.dumps(data).encode('utf-8'), 'application/json')
+
+    async def current_patch(self, request: web.Request) -> web.Response:
+        major, minor = PATCH.split('.')[:2]
+        return web.json_response({'patch': f"{major}_{minor}"})
+
+    async def versions(self, request: web.Request) -> web.Response:
+        return web.json_response([PATCH, "16.2.1", "16.1.1"])
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats_dict())
+
+    def stats_dict(self) -> dict:
+        """Request counters since start"""
+        return {
+            'requests': sum(self.statuses.values()),
+            'statuses': {str(status): count for status, count in sorted(self.statuses.items())},
+            'bytes_sent': self.bytes_sent,
+            'max_in_flight': self.max_in_flight,
+        }
+
+
+async def serve_forever(args):
+    config = MockConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        bytes_per_sec=args.bytes_per_sec, rate_limit=args.rate_limit,
+                        seed=args.seed)
+    server = MockServer(config)
+    url = await server.start(args.host, args.port)
+    print(f"[OK] Mock server running at {url} ({len(server.pages)} corpus pages)")
+    print(f"  UGG_BASE_URL={url} UGG_STATS_BASE_URL={url} DDRAGON_BASE_URL={url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock U.GG / Data Dragon server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8700)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds before responding")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random delay (seconds)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of 5xx responses")
+    parser.add_argument('--bytes-per-sec', type=int, default=0, help="body throttle (0 = off)")
+    parser.add_argument('--rate-limit', type=float, default=0, help="requests/sec before 403")
+    parser.add_argument('--seed', type=int, default=None)
+    try:
+        asyncio.run(serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
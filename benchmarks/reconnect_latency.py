@@ -0,0 +1,105 @@
+"""
+Reconnect latency: League client restart -> events flowing again
+Restarts the mock League client (mock_lcu.py) on a new port with a new token,
+rewriting its lockfile each time, and measures how long LCUSupervisor takes to
+rediscover it, reconnect and resubscribe.
+
+Usage: python benchmarks/reconnect_latency.py [--restarts 10] [--downtime 2.0]
+                                              [--startup 0.3]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(src_path))
+
+from mock_lcu import MockLCU, SESSION_URI
+from lcu.connector import LCUConnector
+from lcu.supervisor import LCUSupervisor, Observer
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+async def start_client(lockfile: Path, index: int, startup: float) -> MockLCU:
+    """Write the lockfile, then start serving `startup` seconds later (like the real client)"""
+    lcu = MockLCU(token=f"mock-token-{index}")
+    # Bind first to learn the port, but refuse logins until "started up"
+    real_token, lcu.token = lcu.token, 'starting'
+    port = await lcu.start()
+    lockfile.write_text(f"LeagueClient:{os.getpid()}:{port}:{real_token}:https")
+    await asyncio.sleep(startup)
+    lcu.token = real_token
+    return lcu
+
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        lockfile = Path(tmp) / 'lockfile'
+        supervisor = LCUSupervisor(LCUConnector(lockfile_paths=[lockfile]))
+        received = asyncio.Event()
+
+        async def on_session(data):
+            received.set()
+
+        supervisor.websocket.on(SESSION_URI, on_session)
+        quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+
+        lcu = await start_client(lockfile, 0, 0)
+        runner = asyncio.create_task(supervisor.run())
+        latencies = []
+        try:
+            with quiet:
+                while not lcu.subscriptions():
+                    await asyncio.sleep(0.01)
+
+                for index in range(1, args.restarts + 1):
+                    # Client quits: socket drops and the lockfile goes away
+                    await lcu.stop()
+                    lockfile.unlink()
+                    await asyncio.sleep(args.downtime)
+
+                    started = time.monotonic()
+                    lcu = await start_client(lockfile, index, args.startup)
+                    while not lcu.subscriptions():
+                        await asyncio.sleep(0.001)
+
+                    received.clear()
+                    await lcu.publish(SESSION_URI, 'Update', {'timer': index})
+                    await asyncio.wait_for(received.wait(), 5)
+                    latencies.append((time.monotonic() - started - args.startup) * 1000)
+        finally:
+            await supervisor.stop()
+            await lcu.stop()
+            runner.cancel()
+
+    watcher = "watchdog notifications" if Observer is not None else \
+        f"lockfile polling every {supervisor.watcher.poll_interval * 1000:.0f} ms"
+    print(f"Client restart -> first event delivered ({args.restarts} restarts, "
+          f"{args.downtime:.1f} s down, {args.startup * 1000:.0f} ms startup, {watcher})")
+    print(f"  beyond startup: p50 {percentile(latencies, 0.5):7.1f} ms  "
+          f"p99 {percentile(latencies, 0.99):7.1f} ms  "
+          f"mean {statistics.mean(latencies):7.1f} ms")
+    print(f"  WebSocket connects: {supervisor.connects}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Client restart -> reconnect latency")
+    parser.add_argument('--restarts', type=int, default=10, help="client restarts")
+    parser.add_argument('--downtime', type=float, default=2.0, help="seconds the client is down")
+    parser.add_argument('--startup', type=float, default=0.3,
+                        help="seconds between lockfile write and the API answering")
+    parser.add_argument('--verbose', action='store_true', help="show supervisor output")
+    asyncio.run(run(parser.parse_args()))
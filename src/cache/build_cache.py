@@ -0,0 +1,490 @@
+"""
+Build Cache
+Two-tier cache for provider build data: in-process LRU in front of SQLite
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from providers.base import BuildData
+from cache.memory import LRUCache, DEFAULT_MAX_ENTRIES, DEFAULT_MAX_BYTES
+
+
+# Default database location: <project root>/data/build_cache.db
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / 'data' / 'build_cache.db'
+
+# Number of patch generations kept on disk (active + fallbacks)
+DEFAULT_MAX_GENERATIONS = 3
+
+# Entry lifetimes: past the soft TTL an entry is served stale and refreshed in
+# the background, past the hard TTL it is treated as a miss
+DEFAULT_SOFT_TTL = 12 * 60 * 60       # 12 hours
+DEFAULT_HARD_TTL = 14 * 24 * 60 * 60  # 14 days
+
+# Bump when the on-disk layout changes; older databases are discarded on open
+SCHEMA_VERSION = 2
+
+
+class CacheStats:
+    """Hit/miss counters for a cache"""
+
+    def __init__(self):
+        self.hits = 0
+        self.memory_hits = 0
+        self.stale_hits = 0
+        self.fallback_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups"""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from cache (0.0 - 1.0)"""
+        if not self.lookups:
+            return 0.0
+        return self.hits / self.lookups
+
+    @property
+    def disk_hits(self) -> int:
+        """Hits that had to be read from SQLite"""
+        return self.hits - self.memory_hits
+
+    def reset(self):
+        """Reset all counters to zero"""
+        self.hits = 0
+        self.memory_hits = 0
+        self.stale_hits = 0
+        self.fallback_hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (for logging/display)"""
+        return {
+            'hits': self.hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'stale_hits': self.stale_hits,
+            'fallback_hits': self.fallback_hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'hit_rate': round(self.hit_rate, 4)
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.hits} hits ({self.memory_hits} memory, {self.disk_hits} disk, "
+                f"{self.stale_hits} stale), {self.misses} misses ({self.hit_rate:.1%} hit rate)")
+
+
+class CacheEntry:
+    """A cached build with its freshness deadlines"""
+
+    def __init__(self, build: BuildData, fetched_at: float,
+                 soft_expires_at: float, hard_expires_at: float):
+        self.build = build
+        self.fetched_at = fetched_at
+        self.soft_expires_at = soft_expires_at
+        self.hard_expires_at = hard_expires_at
+
+    @property
+    def is_stale(self) -> bool:
+        """Past the soft TTL: still usable, but should be refreshed"""
+        return time.time() >= self.soft_expires_at
+
+    @property
+    def is_expired(self) -> bool:
+        """Past the hard TTL: must not be served"""
+        return time.time() >= self.hard_expires_at
+
+
+class BuildCache:
+    """
+    Two-tier cache of BuildData, scoped to patch generations
+
+    Each patch gets its own generation: a row in the `generations` table plus a
+    `builds_g<id>` table holding that patch's builds as JSON, keyed by
+    (provider, champion_id, role, queue). Retiring a patch is a single
+    DROP TABLE rather than a row-by-row delete. When a new patch becomes active
+    the previous generations are kept as fallbacks (see get_fallback) until
+    retire_old_generations() is called once the new one is warm.
+
+    Every entry carries a soft and a hard expiry (see CacheEntry). lookup()
+    returns stale entries so callers can serve them while refreshing; entries
+    past the hard expiry count as misses.
+
+    A bounded LRU of deserialized entries sits in front of SQLite:
+    reads go memory -> disk and populate memory on a disk hit (read-through).
+    Writes go to disk and only refresh the memory copy if there is one, so a
+    bulk writer like the cache warmer doesn't evict builds that were just read.
+
+    The connection is shared between threads (the GUI entry points construct
+    the app on the main thread but run the event loop on a worker thread), so
+    all database access goes through a lock.
+    """
+
+    def __init__(self, db_path: Optional[str] = None,
+                 memory_entries: int = DEFAULT_MAX_ENTRIES,
+                 memory_bytes: int = DEFAULT_MAX_BYTES,
+                 max_generations: int = DEFAULT_MAX_GENERATIONS,
+                 soft_ttl: float = DEFAULT_SOFT_TTL,
+                 hard_ttl: float = DEFAULT_HARD_TTL):
+        """
+        Initialize BuildCache
+
+        Args:
+            db_path: Path to the SQLite database file, or ':memory:'
+                     If None, uses data/build_cache.db in the project root
+            memory_entries: Maximum number of builds kept in the in-memory tier
+            memory_bytes: Maximum serialized size of builds kept in memory
+            max_generations: Maximum number of patch generations kept on disk
+            soft_ttl: Default seconds until an entry is stale
+            hard_ttl: Default seconds until an entry is no longer served
+        """
+        self.db_path = str(db_path or DEFAULT_CACHE_PATH)
+        self.max_generations = max_generations
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.stats = CacheStats()
+        self.memory = LRUCache(max_entries=memory_entries, max_bytes=memory_bytes)
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}  # patch -> generation id
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._create_schema()
+
+    def _create_schema(self):
+        """Create tables if they don't exist and load known generations"""
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._drop_all_tables()
+                self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS generations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    patch TEXT NOT NULL UNIQUE,
+                    active INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.commit()
+            rows = self._conn.execute('SELECT patch, id FROM generations').fetchall()
+        self._generations = dict(rows)
+
+    def _drop_all_tables(self):
+        """Drop every table (lock held) - it's a cache, so no migrations"""
+        tables = self._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        ).fetchall()
+        for (table,) in tables:
+            self._conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+
+    # === Patch Generations ===
+
+    @property
+    def active_patch(self) -> Optional[str]:
+        """Patch of the active generation, or None if no patch has been set"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT patch FROM generations WHERE active = 1'
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_patch(self, patch: str) -> bool:
+        """
+        Make a patch the active generation
+
+        The previously active generation is kept as a fallback. Generations
+        beyond max_generations are retired, oldest first.
+
+        Args:
+            patch: Patch version (e.g., '16.3.1')
+
+        Returns:
+            True if the active patch changed
+        """
+        if self.active_patch == patch:
+            return False
+
+        with self._lock:
+            generation_id = self._create_generation(patch)
+            self._conn.execute('UPDATE generations SET active = (id = ?)', (generation_id,))
+            self._conn.commit()
+            excess = self._conn.execute(
+                'SELECT patch FROM generations WHERE active = 0 ORDER BY id DESC LIMIT -1 OFFSET ?',
+                (max(self.max_generations - 1, 0),)
+            ).fetchall()
+
+        for (old_patch,) in excess:
+            self.retire_generation(old_patch)
+
+        print(f"Build cache: active patch is now {patch}")
+        return True
+
+    def retire_generation(self, patch: str):
+        """
+        Drop every cached build for a patch in one operation
+
+        Args:
+            patch: Patch version to retire
+        """
+        generation_id = self._generations.pop(patch, None)
+        if generation_id is None:
+            return
+
+        with self._lock:
+            self._conn.execute(f'DROP TABLE IF EXISTS builds_g{generation_id}')
+            self._conn.execute('DELETE FROM generations WHERE id = ?', (generation_id,))
+            self._conn.commit()
+
+        # Memory keys include the patch; retiring is rare so just start over
+        self.memory.clear()
+
+    def retire_old_generations(self):
+        """Retire every generation except the active one (call once it is warm)"""
+        active = self.active_patch
+        for patch in list(self._generations):
+            if patch != active:
+                self.retire_generation(patch)
+
+    def generation_size(self, patch: Optional[str] = None) -> int:
+        """
+        Count builds cached for a patch
+
+        Args:
+            patch: Patch version, defaults to the active patch
+
+        Returns:
+            Number of cached builds in that generation
+        """
+        generation_id = self._generations.get(patch or self.active_patch)
+        if generation_id is None:
+            return 0
+        with self._lock:
+            return self._conn.execute(
+                f'SELECT COUNT(*) FROM builds_g{generation_id}'
+            ).fetchone()[0]
+
+    def _create_generation(self, patch: str) -> int:
+        """Get or create the generation for a patch (lock held)"""
+        generation_id = self._generations.get(patch)
+        if generation_id is not None:
+            return generation_id
+
+        cursor = self._conn.execute(
+            'INSERT INTO generations (patch, created_at) VALUES (?, ?)',
+            (patch, time.time())
+        )
+        generation_id = cursor.lastrowid
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS builds_g{generation_id} (
+                provider TEXT NOT NULL,
+                champion_id INTEGER NOT NULL,
+                role TEXT NOT NULL,
+                queue TEXT NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                soft_expires_at REAL NOT NULL,
+                hard_expires_at REAL NOT NULL,
+                PRIMARY KEY (provider, champion_id, role, queue)
+            ) WITHOUT ROWID
+        """)
+        self._conn.commit()
+        self._generations[patch] = generation_id
+        return generation_id
+
+    # === Builds ===
+
+    def lookup(self, provider: str, champion_id: int, role: str, queue: str,
+               patch: str) -> Optional[CacheEntry]:
+        """
+        Look up a cached build along with its freshness
+
+        Args:
+            provider: Provider name (e.g., 'U.GG')
+            champion_id: Champion ID
+            role: Normalized role (e.g., 'middle', 'aram')
+            queue: Queue type (e.g., 'ranked_solo_5x5', 'normal_aram')
+            patch: Patch version the build was requested for
+
+        Returns:
+            CacheEntry (possibly stale) or None on a miss or hard expiry
+        """
+        entry = self.memory.get((provider, champion_id, role, queue, patch))
+        from_memory = entry is not None
+        if entry is None:
+            entry = self._read(patch, provider, champion_id, role, queue)
+
+        if entry is None or entry.is_expired:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        if from_memory:
+            self.stats.memory_hits += 1
+        if entry.is_stale:
+            self.stats.stale_hits += 1
+        return entry
+
+    def get(self, provider: str, champion_id: int, role: str, queue: str,
+            patch: str) -> Optional[BuildData]:
+        """
+        Look up a cached build (fresh or stale)
+
+        Returns:
+            BuildData or None on a miss
+        """
+        entry = self.lookup(provider, champion_id, role, queue, patch)
+        return entry.build if entry else None
+
+    def peek(self, provider: str, champion_id: int, role: str, queue: str,
+             patch: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry without touching stats or the memory tier (for the warmer)
+
+        Reads disk only, so a pass over every key doesn't reorder or evict
+        the LRU (disk is always current: writes go to disk first).
+
+        Returns:
+            CacheEntry regardless of freshness, or None if not cached
+        """
+        return self._read(patch, provider, champion_id, role, queue, remember=False)
+
+    def get_fallback(self, provider: str, champion_id: int, role: str, queue: str,
+                     patch: str) -> Optional[BuildData]:
+        """
+        Look up a build from an older generation than the requested patch
+
+        Used when the requested patch has no entry and a fresh fetch failed:
+        last patch's build beats the hardcoded fallback builds.
+
+        Returns:
+            BuildData from the newest other generation that has one, or None
+        """
+        requested_id = self._generations.get(patch)
+        candidates = sorted(
+            (generation_id, other_patch)
+            for other_patch, generation_id in self._generations.items()
+            if other_patch != patch and (requested_id is None or generation_id < requested_id)
+        )
+
+        for _, other_patch in reversed(candidates):
+            entry = self._read(other_patch, provider, champion_id, role, queue)
+            if entry is not None:
+                self.stats.fallback_hits += 1
+                return entry.build
+
+        return None
+
+    def _read(self, patch: str, provider: str, champion_id: int, role: str,
+              queue: str, remember: bool = True) -> Optional[CacheEntry]:
+        """Read an entry from a generation table (and populate the memory tier if `remember`)"""
+        generation_id = self._generations.get(patch)
+        if generation_id is None:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, fetched_at, soft_expires_at, hard_expires_at '
+                f'FROM builds_g{generation_id} WHERE provider = ? '
+                'AND champion_id = ? AND role = ? AND queue = ?',
+                (provider, champion_id, role, queue)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        try:
+            entry = CacheEntry(BuildData.from_dict(json.loads(row[0])), *row[1:])
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Discarding corrupt cache entry: {e}")
+            self.delete(provider, champion_id, role, queue, patch)
+            return None
+
+        if remember:
+            self.memory.put((provider, champion_id, role, queue, patch), entry, size=len(row[0]))
+        return entry
+
+    def put(self, provider: str, champion_id: int, role: str, queue: str,
+            patch: str, build: BuildData, soft_ttl: Optional[float] = None,
+            hard_ttl: Optional[float] = None, remember: bool = True):
+        """
+        Store a build, replacing any existing entry for the same key
+
+        Args:
+            provider: Provider name
+            champion_id: Champion ID
+            role: Normalized role
+            queue: Queue type
+            patch: Patch version (its generation is created if needed)
+            build: Build data to store
+            soft_ttl: Seconds until stale (defaults to the cache's soft_ttl)
+            hard_ttl: Seconds until expired (defaults to the cache's hard_ttl)
+            remember: Also write the build to the memory tier. Background
+                      writes (warming, refreshes) pass False so they don't
+                      evict builds in use; a copy already in memory is still
+                      replaced so it doesn't go stale.
+        """
+        now = time.time()
+        entry = CacheEntry(
+            build,
+            fetched_at=now,
+            soft_expires_at=now + (self.soft_ttl if soft_ttl is None else soft_ttl),
+            hard_expires_at=now + (self.hard_ttl if hard_ttl is None else hard_ttl)
+        )
+        data = json.dumps(build.to_dict(), separators=(',', ':'))
+        key = (provider, champion_id, role, queue, patch)
+        if remember or key in self.memory:
+            self.memory.put(key, entry, size=len(data))
+        with self._lock:
+            generation_id = self._create_generation(patch)
+            self._conn.execute(
+                f'INSERT OR REPLACE INTO builds_g{generation_id} '
+                '(provider, champion_id, role, queue, data, fetched_at, '
+                'soft_expires_at, hard_expires_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (provider, champion_id, role, queue, data, now,
+                 entry.soft_expires_at, entry.hard_expires_at)
+            )
+            self._conn.commit()
+        self.stats.writes += 1
+
+    def delete(self, provider: str, champion_id: int, role: str, queue: str, patch: str):
+        """Remove a single entry"""
+        self.memory.pop((provider, champion_id, role, queue, patch))
+        generation_id = self._generations.get(patch)
+        if generation_id is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                f'DELETE FROM builds_g{generation_id} WHERE provider = ? '
+                'AND champion_id = ? AND role = ? AND queue = ?',
+                (provider, champion_id, role, queue)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached builds and generations"""
+        for patch in list(self._generations):
+            self.retire_generation(patch)
+        self.memory.clear()
+
+    def __len__(self) -> int:
+        return sum(self.generation_size(patch) for patch in list(self._generations))
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
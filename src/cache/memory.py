@@ -0,0 +1,105 @@
+"""
+In-Memory LRU Cache
+Bounded in-process cache tier that sits in front of the SQLite store
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+# Default bounds: ~all champions x all roles fits comfortably
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024  # 4MB
+
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by entry count and total size
+
+    Sizes are supplied by the caller on put() (the build cache passes the
+    length of the serialized JSON), so no per-object size estimation is done.
+    Entries are evicted from the least recently used end until both limits hold.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize LRUCache
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size (sum of sizes passed to put)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a value and mark it as most recently used
+
+        Returns:
+            The cached value or None if not present
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int = 1):
+        """
+        Insert or replace a value
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size of the value in bytes (used for the max_bytes bound)
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+
+            # Values larger than the whole budget are not cached at all
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            self._evict()
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove a key, returning its value if present"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self.total_bytes -= entry[1]
+            return entry[0]
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def _evict(self):
+        """Drop least recently used entries until both bounds hold (lock held)"""
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self.total_bytes > self.max_bytes):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
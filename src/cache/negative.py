@@ -0,0 +1,92 @@
+"""
+Negative Cache
+Remembers recent failed fetches so repeated lookups skip the network
+"""
+
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+# Failure classes
+FAILURE_NOT_FOUND = 'not_found'  # HTTP 404
+FAILURE_FORBIDDEN = 'forbidden'  # HTTP 403 (blocked / rate limited)
+FAILURE_PARSE = 'parse'          # Page fetched but no build could be extracted
+FAILURE_TIMEOUT = 'timeout'      # Request timed out
+FAILURE_ERROR = 'error'          # Any other HTTP status or connection error
+
+# Seconds a failure is remembered, per class
+DEFAULT_NEGATIVE_TTLS = {
+    FAILURE_NOT_FOUND: 30 * 60,
+    FAILURE_FORBIDDEN: 5 * 60,
+    FAILURE_PARSE: 10 * 60,
+    FAILURE_TIMEOUT: 30,
+    FAILURE_ERROR: 60,
+}
+
+
+class NegativeCache:
+    """
+    In-memory map of key -> (failure class, expiry)
+
+    Entries are short-lived and process-local: a failure only means "don't
+    retry this for a little while", so nothing is persisted.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None):
+        """
+        Initialize NegativeCache
+
+        Args:
+            ttls: Per-failure-class TTLs in seconds, merged over the defaults
+        """
+        self.ttls = dict(DEFAULT_NEGATIVE_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.skips = 0  # Lookups answered from the negative cache
+        self._entries: Dict[Hashable, Tuple[str, float]] = {}
+
+    def check(self, key: Hashable) -> Optional[str]:
+        """
+        Check whether a key recently failed
+
+        Args:
+            key: Cache key of the request
+
+        Returns:
+            The failure class if a failure is still remembered, else None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        failure, expires_at = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self.skips += 1
+        return failure
+
+    def record(self, key: Hashable, failure: str):
+        """
+        Remember a failure
+
+        Args:
+            key: Cache key of the request
+            failure: Failure class (one of the FAILURE_* constants)
+        """
+        ttl = self.ttls.get(failure, self.ttls[FAILURE_ERROR])
+        if ttl > 0:
+            self._entries[key] = (failure, time.time() + ttl)
+
+    def clear(self, key: Optional[Hashable] = None):
+        """
+        Forget a failure (e.g., after a successful fetch)
+
+        Args:
+            key: Key to forget, or None to forget everything
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -0,0 +1,255 @@
+"""
+Session Prefetch
+Warms the build cache during champ select for every champion the local
+player could still end up on, most likely first
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+# (champion_id, role) -> build for that selection (e.g., provider.get_build)
+BuildResolver = Callable[[int, str], Awaitable[object]]
+
+# (champion_id, role)
+PrefetchKey = Tuple[int, str]
+
+# How likely each source is to become the local player's champion (or role)
+LIKELIHOOD_SELECTED = 1.0         # Current pick / pick intent
+LIKELIHOOD_OFFERED = 0.9          # Trade or position swap offered to (or by) us
+LIKELIHOOD_BENCH_PRIORITY = 0.7   # ARAM bench champion marked priority
+LIKELIHOOD_BENCH = 0.5            # Any other ARAM bench champion
+LIKELIHOOD_AVAILABLE = 0.4        # Trade or position swap we could request
+LIKELIHOOD_REROLL = 0.2           # Teammate's ARAM champion, benched if they reroll
+
+# Swap/trade states worth prefetching for
+OFFERED_STATES = ('RECEIVED', 'SENT')
+AVAILABLE_STATES = ('AVAILABLE',)
+
+
+def _swap_likelihood(state: Optional[str]) -> float:
+    """Likelihood for a trade / position swap in `state` (0 = not possible)"""
+    if state in OFFERED_STATES:
+        return LIKELIHOOD_OFFERED
+    if state in AVAILABLE_STATES:
+        return LIKELIHOOD_AVAILABLE
+    return 0.0
+
+
+def _unavailable_champions(session: dict) -> Set[int]:
+    """Champions the local player can no longer pick: banned or picked by the enemy"""
+    bans = session.get('bans') or {}
+    unavailable = set(bans.get('myTeamBans', [])) | set(bans.get('theirTeamBans', []))
+    for group in session.get('actions', []):
+        for action in group:
+            if action.get('type') == 'ban' and action.get('completed'):
+                unavailable.add(action.get('championId', 0))
+    for player in session.get('theirTeam', []):
+        unavailable.add(player.get('championId', 0))
+    unavailable.discard(0)
+    return unavailable
+
+
+def prefetch_candidates(session: Optional[dict], default_role: str = 'middle',
+                        limit: int = 8) -> List[Tuple[float, int, str]]:
+    """
+    Rank the (champion, role) pairs the local player could end up on
+
+    Sources: the current pick / pick intent, champion trades (their champion,
+    our role), position swaps (our champion, their role), the ARAM bench, and
+    teammates' ARAM champions, which go to the bench when they reroll. Pick
+    order swaps don't change the champion, so they add nothing. A pick intent
+    that has since been banned or picked by the enemy is left out.
+
+    Args:
+        session: Champ select session event data
+        default_role: Role used when no position is assigned (ARAM, blind)
+        limit: Maximum number of candidates returned
+
+    Returns:
+        [(likelihood, champion_id, role), ...], most likely first
+    """
+    if not session:
+        return []
+
+    cell_id = session.get('localPlayerCellId')
+    my_team = session.get('myTeam', [])
+    by_cell = {player.get('cellId'): player for player in my_team}
+    local = by_cell.get(cell_id)
+    if local is None:
+        return []
+
+    role = local.get('assignedPosition', '').lower() or default_role
+    champion_id = local.get('championId', 0)
+    if not champion_id:
+        # Only an intent so far: it can still be banned or taken by the enemy
+        champion_id = local.get('championPickIntent', 0)
+        if champion_id in _unavailable_champions(session):
+            champion_id = 0
+    scores: Dict[PrefetchKey, float] = {}
+
+    def add(candidate_id: int, candidate_role: str, likelihood: float):
+        if not candidate_id or likelihood <= 0:
+            return
+        key = (candidate_id, candidate_role)
+        scores[key] = max(scores.get(key, 0.0), likelihood)
+
+    add(champion_id, role, LIKELIHOOD_SELECTED)
+
+    # Trades: we'd get their champion and keep our role
+    for trade in session.get('trades', []):
+        teammate = by_cell.get(trade.get('cellId'))
+        if teammate is not None:
+            add(teammate.get('championId', 0), role, _swap_likelihood(trade.get('state')))
+
+    # Position swaps: we'd keep our champion in their role
+    for swap in session.get('positionSwaps', []):
+        teammate = by_cell.get(swap.get('cellId'))
+        if teammate is not None:
+            their_role = teammate.get('assignedPosition', '').lower() or default_role
+            add(champion_id, their_role, _swap_likelihood(swap.get('state')))
+
+    if session.get('benchEnabled'):
+        for bench in session.get('benchChampions', []):
+            add(bench.get('championId', 0), role,
+                LIKELIHOOD_BENCH_PRIORITY if bench.get('isPriority') else LIKELIHOOD_BENCH)
+        if session.get('allowRerolling'):
+            for teammate in my_team:
+                if teammate is not local:
+                    add(teammate.get('championId', 0), role, LIKELIHOOD_REROLL)
+
+    ranked = sorted(((likelihood, key[0], key[1]) for key, likelihood in scores.items()),
+                    key=lambda candidate: -candidate[0])
+    return ranked[:limit]
+
+
+class PrefetchStats:
+    """Counts of champ select prefetch work"""
+
+    def __init__(self):
+        self.sessions = 0      # Session updates that changed the candidates
+        self.scheduled = 0     # Candidates queued
+        self.fetched = 0       # Builds resolved (from cache or network)
+        self.dropped = 0       # Queued candidates that stopped being possible
+        self.failed = 0
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (for logging/display)"""
+        return {
+            'sessions': self.sessions,
+            'scheduled': self.scheduled,
+            'fetched': self.fetched,
+            'dropped': self.dropped,
+            'failed': self.failed
+        }
+
+
+class SessionPrefetcher:
+    """
+    Champ select counterpart to the CacheWarmer
+
+    Each session update re-ranks the candidates from prefetch_candidates();
+    workers resolve the most likely one not yet fetched, at most `concurrency`
+    at a time, so a swap or bench grab is answered from the cache. Candidates
+    that drop out (a bench champion someone else took, a cancelled trade) are
+    dropped from the queue; fetches already running finish. Workers are plain
+    tasks started on demand, like RefreshQueue's.
+    """
+
+    def __init__(self, resolve: BuildResolver, default_role: str = 'middle',
+                 concurrency: int = 2, limit: int = 8):
+        """
+        Initialize SessionPrefetcher
+
+        Args:
+            resolve: Async (champion_id, role) -> build; should fill the build cache
+            default_role: Role used when no position is assigned (match the app's)
+            concurrency: Maximum number of fetches in flight
+            limit: Maximum candidates per session
+        """
+        self.resolve = resolve
+        self.default_role = default_role
+        self.concurrency = concurrency
+        self.limit = limit
+        self.stats = PrefetchStats()
+        self._pending: Dict[PrefetchKey, float] = {}   # key -> likelihood
+        self._started: Set[PrefetchKey] = set()        # In flight or done this champ select
+        self._workers: Set[asyncio.Task] = set()
+        # Last session ranked and its candidates (interest() and the handler
+        # both see each event; rank it once)
+        self._ranked_session: Optional[dict] = None
+        self._ranked: List[Tuple[float, int, str]] = []
+
+    def interest(self, session: Optional[dict]) -> tuple:
+        """Interest key for the session handler: only re-rank when the candidates change"""
+        return tuple(self._candidates(session))
+
+    def _candidates(self, session: Optional[dict]) -> List[Tuple[float, int, str]]:
+        """prefetch_candidates() for a session, reused while the same event object is passed"""
+        if session is not self._ranked_session:
+            self._ranked = prefetch_candidates(session, self.default_role, self.limit)
+            self._ranked_session = session
+        return self._ranked
+
+    async def handle_session_event(self, data):
+        """WebSocket handler for /lol-champ-select/v1/session"""
+        if not data:
+            self.reset()  # Champ select ended
+            return
+        self.on_session(data)
+
+    def on_session(self, session: dict):
+        """
+        Re-rank the candidates for a session update and start fetching
+
+        Args:
+            session: Champ select session data
+        """
+        self.stats.sessions += 1
+        candidates = self._candidates(session)
+        wanted = {(champion_id, role): likelihood for likelihood, champion_id, role in candidates}
+
+        for key in list(self._pending):
+            if key not in wanted:
+                del self._pending[key]
+                self.stats.dropped += 1
+
+        for key, likelihood in wanted.items():
+            if key not in self._started and key not in self._pending:
+                self.stats.scheduled += 1
+            if key not in self._started:
+                self._pending[key] = likelihood
+
+        while self._pending and len(self._workers) < self.concurrency:
+            worker = asyncio.ensure_future(self._drain())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def _drain(self):
+        """Resolve the most likely pending candidate until none are left"""
+        while self._pending:
+            key = max(self._pending, key=self._pending.get)
+            del self._pending[key]
+            self._started.add(key)
+            try:
+                await self.resolve(*key)
+                self.stats.fetched += 1
+            except Exception as e:
+                self.stats.failed += 1
+                print(f"Prefetch failed for {key}: {e}")
+
+    def reset(self):
+        """Forget this champ select's candidates (queued fetches are dropped)"""
+        self._pending.clear()
+        self._started.clear()
+
+    async def stop(self):
+        """Drop queued fetches and cancel running ones"""
+        self.reset()
+        workers = list(self._workers)
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._pending)
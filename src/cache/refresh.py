@@ -0,0 +1,77 @@
+"""
+Refresh Queue
+Background re-fetching of stale cache entries, deduplicated by key
+"""
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Hashable, Set, Tuple
+
+
+class RefreshQueue:
+    """
+    Runs refresh coroutines in the background, at most `concurrency` at a time
+
+    A key that is already queued or being refreshed is not queued again, so a
+    burst of lookups for the same stale build triggers a single re-fetch.
+    Workers are plain tasks started on demand, so the queue isn't tied to one
+    event loop (the tray UI restarts its loop on Stop/Start).
+    """
+
+    def __init__(self, concurrency: int = 1):
+        """
+        Initialize RefreshQueue
+
+        Args:
+            concurrency: Maximum number of refreshes running at once
+        """
+        self.concurrency = concurrency
+        self._jobs: Deque[Tuple[Hashable, Callable[[], Awaitable]]] = deque()
+        self._pending: Set[Hashable] = set()
+        self._workers: Set[asyncio.Task] = set()
+
+    def schedule(self, key: Hashable, refresh: Callable[[], Awaitable]) -> bool:
+        """
+        Queue a refresh unless one is already pending for this key
+
+        Args:
+            key: Dedup key (e.g., the cache key)
+            refresh: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            True if the refresh was queued, False if it was a duplicate
+        """
+        if key in self._pending:
+            return False
+
+        self._pending.add(key)
+        self._jobs.append((key, refresh))
+
+        if len(self._workers) < self.concurrency:
+            worker = asyncio.ensure_future(self._drain())
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+        return True
+
+    async def _drain(self):
+        """Run queued refreshes until none are left"""
+        while self._jobs:
+            key, refresh = self._jobs.popleft()
+            try:
+                await refresh()
+            except Exception as e:
+                print(f"Background refresh failed for {key}: {e}")
+            finally:
+                self._pending.discard(key)
+
+    async def stop(self):
+        """Drop queued refreshes and cancel running ones"""
+        self._jobs.clear()
+        self._pending.clear()
+        workers = list(self._workers)
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._pending)
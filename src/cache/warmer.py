@@ -0,0 +1,256 @@
+"""
+Cache Warmer
+Fills the build cache for every champion x role (plus ARAM) while the client is idle
+"""
+
+import asyncio
+import time
+from typing import Iterable, List, Optional, Tuple
+
+from cache.build_cache import BuildCache
+from cache.negative import FAILURE_FORBIDDEN
+from providers.base import BaseProvider, ROLES, RANKED_QUEUE, ARAM_QUEUE
+
+
+# Gameflow phases during which the warmer is allowed to fetch
+IDLE_PHASES = ('None', 'Lobby')
+
+# Retire older patch generations once this fraction of the matrix is cached
+RETIRE_COVERAGE = 0.9
+
+# Seconds every worker waits after U.GG answers 403 (it throttles all requests)
+THROTTLE_PAUSE = 5 * 60
+
+# (champion_id, role) - role 'aram' means the ARAM build
+WarmJob = Tuple[int, str]
+
+
+class CacheWarmer:
+    """
+    Background task that pre-fetches builds into the cache
+
+    Jobs are ordered by priority: recently played champions first, then the
+    user's mains (highest mastery), then every other champion. A fixed number
+    of workers pull from the job queue, so at most `concurrency` scrapes run at
+    once. Workers wait whenever the warmer is paused; it pauses itself as soon
+    as the gameflow phase leaves IDLE_PHASES (e.g. champ select starts) and
+    resumes when the client is idle again. A 403 from U.GG means it is
+    throttling every request, so all workers back off for THROTTLE_PAUSE.
+    """
+
+    def __init__(self, provider: BaseProvider, cache: BuildCache,
+                 champion_ids: Iterable[int], concurrency: int = 2,
+                 delay: float = 0.5, throttle_pause: float = THROTTLE_PAUSE):
+        """
+        Initialize CacheWarmer
+
+        Args:
+            provider: Provider used to fetch builds (writes into `cache`)
+            cache: Build cache to fill
+            champion_ids: Every champion ID to warm
+            concurrency: Maximum number of fetches in flight
+            delay: Pause in seconds after each fetch, per worker
+            throttle_pause: Seconds all workers wait after a 403
+        """
+        self.provider = provider
+        self.cache = cache
+        self.champion_ids = list(champion_ids)
+        self.concurrency = concurrency
+        self.delay = delay
+        self.throttle_pause = throttle_pause
+        self.throttled_until = 0.0  # time.monotonic() before which nothing is fetched
+        self.recent: List[int] = []
+        self.mains: List[int] = []
+
+        self.total = 0
+        self.done = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    # === Priority ===
+
+    def set_priorities(self, recent: Iterable[int] = (), mains: Iterable[int] = ()):
+        """
+        Set champions to warm first
+
+        Args:
+            recent: Recently played champion IDs, most recent first
+            mains: Most played / highest mastery champion IDs
+        """
+        self.recent = list(recent)
+        self.mains = [champion_id for champion_id in mains if champion_id not in self.recent]
+
+    async def load_priorities(self, api):
+        """
+        Load recent champions and mains from the League client
+
+        Args:
+            api: Connected LCUAPI instance
+        """
+        try:
+            recent = await api.get_recent_champion_ids()
+            mains = await api.get_mastery_champion_ids()
+            self.set_priorities(recent, mains)
+        except Exception as e:
+            print(f"Cache warmer: could not load champion priorities: {e}")
+
+    def _jobs(self) -> List[WarmJob]:
+        """Build the full champion x role matrix in priority order"""
+        known = set(self.champion_ids)
+        ordered = [champion_id for champion_id in self.recent + self.mains if champion_id in known]
+        ordered += [champion_id for champion_id in self.champion_ids if champion_id not in ordered]
+
+        return [(champion_id, role)
+                for champion_id in ordered
+                for role in ROLES + ('aram',)]
+
+    # === Pause / Resume ===
+
+    @property
+    def paused(self) -> bool:
+        """True while the warmer is waiting for the client to become idle"""
+        return not self._idle.is_set()
+
+    def pause(self):
+        """Stop starting new fetches (in-flight fetches finish)"""
+        self._idle.clear()
+
+    def resume(self):
+        """Allow fetches again"""
+        self._idle.set()
+
+    def on_gameflow_phase(self, phase: Optional[str]):
+        """
+        Pause or resume based on the client's gameflow phase
+
+        Args:
+            phase: Gameflow phase (e.g., 'Lobby', 'ChampSelect')
+        """
+        if phase in IDLE_PHASES:
+            if self.paused:
+                print("Cache warmer: client idle, resuming")
+            self.resume()
+        else:
+            if not self.paused:
+                print(f"Cache warmer: paused ({phase})")
+            self.pause()
+
+    async def handle_gameflow_event(self, data):
+        """WebSocket handler for /lol-gameflow/v1/gameflow-phase"""
+        if isinstance(data, str):
+            self.on_gameflow_phase(data)
+
+    # === Running ===
+
+    def start(self, patch: str) -> asyncio.Task:
+        """
+        Start warming in the background
+
+        Args:
+            patch: Patch version to key cache entries with
+
+        Returns:
+            The background task
+        """
+        if self._task and not self._task.done():
+            return self._task
+        self._task = asyncio.create_task(self.run(patch))
+        return self._task
+
+    async def stop(self):
+        """Cancel the background task"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def run(self, patch: str):
+        """
+        Warm every (champion, role) pair for a patch
+
+        Args:
+            patch: Patch version to key cache entries with
+        """
+        jobs = self._jobs()
+        self.total = len(jobs)
+        self.done = 0
+        self._queue = asyncio.Queue()
+        for job in jobs:
+            self._queue.put_nowait(job)
+
+        print(f"Cache warmer: warming {self.total} builds for patch {patch}")
+        workers = [asyncio.create_task(self._worker(patch)) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        cached = self.cache.generation_size(patch)
+        print(f"Cache warmer: done, {cached}/{self.total} builds cached for patch {patch}")
+        if patch == self.cache.active_patch and cached >= self.total * RETIRE_COVERAGE:
+            self.cache.retire_old_generations()
+
+    async def _worker(self, patch: str):
+        """Pull jobs off the queue until it is empty"""
+        while True:
+            try:
+                champion_id, role = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            await self._idle.wait()
+            await self._wait_for_throttle()
+            try:
+                fetched = await self._warm(champion_id, role, patch)
+            except Exception as e:
+                print(f"Cache warmer: failed to warm {champion_id} {role}: {e}")
+                fetched = True
+            self.done += 1
+
+            if fetched:
+                await asyncio.sleep(self.delay)
+
+    async def _wait_for_throttle(self):
+        """Sleep until a U.GG throttle pause (shared by all workers) is over"""
+        while True:
+            remaining = self.throttled_until - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
+
+    def _check_throttled(self, champion_id: int, role: str, queue: str):
+        """Pause every worker if the last fetch was answered with a 403"""
+        negative_cache = getattr(self.provider, 'negative_cache', None)
+        if negative_cache is None:
+            return
+        if negative_cache.check((self.provider.name, champion_id, role, queue)) \
+                == FAILURE_FORBIDDEN:
+            if time.monotonic() >= self.throttled_until:
+                print(f"Cache warmer: U.GG is throttling (403), pausing for "
+                      f"{self.throttle_pause:.0f}s")
+            self.throttled_until = time.monotonic() + self.throttle_pause
+
+    async def _warm(self, champion_id: int, role: str, patch: str) -> bool:
+        """
+        Fetch one build unless a fresh copy is already cached
+
+        Returns:
+            True if a network fetch was made
+        """
+        queue = ARAM_QUEUE if role == 'aram' else RANKED_QUEUE
+        entry = self.cache.peek(self.provider.name, champion_id, role, queue, patch)
+        if entry and not entry.is_stale:
+            return False
+
+        if role == 'aram':
+            await self.provider.get_aram_build(champion_id, patch, refresh=True)
+        else:
+            await self.provider.get_build(champion_id, role, patch, refresh=True)
+        self._check_throttled(champion_id, role, queue)
+        return True
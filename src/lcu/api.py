@@ -3,15 +3,95 @@ LCU API Wrapper
 Provides convenient methods for interacting with League Client API
 """
 
+import asyncio
 from typing import Optional, List, Dict
 from lcu.connector import LCUConnector
 
 
+# Pages whose names start with these look auto-generated (by us or similar tools)
+HELPER_PAGE_PREFIXES = ('U.GG', 'OP.GG', 'Lolalytics', 'Auto')
+
+# Rune page DELETEs in flight at once during cleanup
+CLEANUP_CONCURRENCY = 4
+
+# Session updates arriving this close together are coalesced (seconds)
+SESSION_COALESCE_WINDOW = 0.05
+
+
+def local_player_selection(session: Optional[dict]) -> Optional[tuple]:
+    """
+    The local player's (championId, championPickIntent, assignedPosition, locked)
+
+    Used as the interest key for champ select session handlers, so timer
+    ticks and other players' hovers and trades don't invoke them.
+
+    Args:
+        session: Champ select session event data
+
+    Returns:
+        Selection tuple, or None if the local player isn't in the session
+    """
+    if not session:
+        return None
+    cell_id = session.get('localPlayerCellId')
+    for player in session.get('myTeam', []):
+        if player.get('cellId') == cell_id:
+            return (player.get('championId', 0), player.get('championPickIntent', 0),
+                    player.get('assignedPosition', ''), local_pick_locked(session))
+    return None
+
+
+def local_pick_locked(session: Optional[dict]) -> bool:
+    """
+    Whether the local player's champion is locked in
+
+    In draft modes that's a completed 'pick' action for the local cell. Modes
+    without pick actions (ARAM, where champions are assigned) count any
+    champion as locked, since there's nothing left to confirm.
+
+    Args:
+        session: Champ select session event data
+
+    Returns:
+        True if the local player's champion is final
+    """
+    if not session:
+        return False
+    cell_id = session.get('localPlayerCellId')
+    has_pick = False
+    for group in session.get('actions', []):
+        for action in group:
+            if action.get('actorCellId') != cell_id or action.get('type') != 'pick':
+                continue
+            if action.get('completed'):
+                return True
+            has_pick = True
+    if has_pick:
+        return False
+
+    for player in session.get('myTeam', []):
+        if player.get('cellId') == cell_id:
+            return player.get('championId', 0) != 0
+    return False
+
+
 class LCUAPI:
     """High-level API wrapper for common LCU operations"""
 
-    def __init__(self, connector: LCUConnector):
+    def __init__(self, connector: LCUConnector, managed_page: bool = True):
+        """
+        Initialize LCUAPI
+
+        Args:
+            connector: Connected LCU connector
+            managed_page: Apply rune pages by updating one page the helper owns
+                          (one PUT) instead of cleaning up and creating a new page
+        """
         self.connector = connector
+        self.managed_page = managed_page
+        self.managed_page_id: Optional[int] = None
+        self.last_created_id: Optional[int] = None  # Page applied by the last POST
+        self._cleanup: Optional[asyncio.Task] = None
 
     # === Summoner Info ===
 
@@ -29,6 +109,14 @@ class LCUAPI:
         """Get currently selected rune page"""
         return await self.connector.get('/lol-perks/v1/currentpage')
 
+    async def get_perks(self) -> Optional[List[dict]]:
+        """Get every perk (rune and stat shard) the client knows"""
+        return await self.connector.get('/lol-perks/v1/perks')
+
+    async def get_perk_styles(self) -> Optional[List[dict]]:
+        """Get rune trees with their slot rows"""
+        return await self.connector.get('/lol-perks/v1/styles')
+
     async def create_rune_page(self, rune_page: dict) -> Optional[dict]:
         """
         Create a new rune page
@@ -48,6 +136,20 @@ class LCUAPI:
         """
         return await self.connector.post('/lol-perks/v1/pages', json=rune_page)
 
+    async def update_rune_page(self, page_id: int, rune_page: dict) -> Optional[dict]:
+        """
+        Overwrite an existing rune page
+
+        Args:
+            page_id: ID of the page to update
+            rune_page: Rune page data (same format as create_rune_page)
+
+        Returns:
+            Updated rune page ({} when the client answers 204 No Content)
+            or None if failed (e.g., the page was deleted)
+        """
+        return await self.connector.put(f'/lol-perks/v1/pages/{page_id}', json=rune_page)
+
     async def delete_rune_page(self, page_id: int) -> bool:
         """
         Delete a rune page
@@ -61,6 +163,27 @@ class LCUAPI:
         result = await self.connector.delete(f'/lol-perks/v1/pages/{page_id}')
         return result is not None
 
+    async def delete_rune_pages(self, page_ids: List[int],
+                                concurrency: int = CLEANUP_CONCURRENCY) -> int:
+        """
+        Delete several rune pages, `concurrency` requests at a time
+
+        Args:
+            page_ids: IDs of the pages to delete
+            concurrency: Maximum DELETEs in flight
+
+        Returns:
+            Number of pages deleted
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete(page_id: int) -> bool:
+            async with semaphore:
+                return await self.delete_rune_page(page_id)
+
+        results = await asyncio.gather(*(delete(page_id) for page_id in page_ids))
+        return sum(results)
+
     async def apply_rune_page(self, name: str, primary_style: int, sub_style: int,
                              selected_perks: List[int]) -> Optional[dict]:
         """
@@ -73,12 +196,17 @@ class LCUAPI:
             selected_perks: List of 9 perk IDs [keystone, slot1, slot2, slot3, sub1, sub2, shard1, shard2, shard3]
 
         Returns:
-            Created rune page or None if failed
+            Created or updated rune page or None if failed
         """
-        # First, try to delete old temporary pages to avoid hitting the 25 page limit
-        await self._cleanup_temp_pages()
-
-        rune_page = {
+        rune_page = self.build_rune_page(name, primary_style, sub_style, selected_perks)
+        await self.ensure_managed_page()
+        return await self.write_rune_page(rune_page)
+
+    @staticmethod
+    def build_rune_page(name: str, primary_style: int, sub_style: int,
+                        selected_perks: List[int]) -> dict:
+        """Request body for creating or updating a rune page (made active when written)"""
+        return {
             "name": name,
             "primaryStyleId": primary_style,
             "subStyleId": sub_style,
@@ -86,34 +214,100 @@ class LCUAPI:
             "current": True  # Set as active page
         }
 
-        return await self.create_rune_page(rune_page)
-
-    async def _cleanup_temp_pages(self):
+    async def ensure_managed_page(self) -> Optional[int]:
         """
-        Delete temporary rune pages created by the app
-        Keeps only permanent user pages
-        """
-        pages = await self.get_rune_pages()
-        if not pages:
-            return
+        Find the helper page to update in place (one GET, only until one is known)
+
+        Takes over an existing helper page if there is one; otherwise the next
+        write creates it. Other leftover helper pages are deleted in the background.
 
-        # Delete pages that look like they were auto-generated
-        # (you can customize this logic based on your naming convention)
-        temp_prefixes = ['U.GG', 'OP.GG', 'Lolalytics', 'Auto']
+        Returns:
+            The managed page ID, or None if there isn't one yet
+        """
+        if not self.managed_page or self.managed_page_id is not None:
+            return self.managed_page_id
 
+        pages = await self.get_rune_pages() or []
         for page in pages:
-            # Skip if it's the only page (can't delete all pages)
-            if len(pages) <= 1:
+            if self._is_helper_page(page) and page.get('isEditable', True):
+                self.managed_page_id = page['id']
                 break
 
-            # Skip if it's a default page
-            if page.get('isDefaultPage', False):
-                continue
+        if self._stale_page_ids(pages):
+            self.schedule_cleanup()
+        return self.managed_page_id
+
+    async def write_rune_page(self, rune_page: dict) -> Optional[dict]:
+        """
+        Send a prepared rune page: a single PUT to the managed page when there
+        is one, otherwise a POST
+
+        Args:
+            rune_page: Body from build_rune_page()
+
+        Returns:
+            Created or updated rune page ({} for a 204 update) or None if failed
+        """
+        if self.managed_page and self.managed_page_id is not None:
+            result = await self.update_rune_page(self.managed_page_id, rune_page)
+            if result is not None:
+                return result
+            self.managed_page_id = None  # Deleted by the user (or a different account)
+
+        result = await self.create_rune_page(rune_page)
+        if result is None:
+            # Probably the page limit: clear out old temporary pages and retry once
+            await self._cleanup_temp_pages()
+            result = await self.create_rune_page(rune_page)
+
+        if result is not None:
+            if self.managed_page:
+                self.managed_page_id = result.get('id')
+            else:
+                self.last_created_id = result.get('id')  # Spared by the cleanup
+                self.schedule_cleanup()
+        return result
+
+    @staticmethod
+    def _is_helper_page(page: dict) -> bool:
+        """True for deletable pages that look auto-generated"""
+        if page.get('isDefaultPage', False) or not page.get('isDeletable', True):
+            return False
+        return page.get('name', '').startswith(HELPER_PAGE_PREFIXES)
+
+    def _stale_page_ids(self, pages: List[dict]) -> List[int]:
+        """
+        Helper pages that can go: everything but the managed page and the
+        page just applied, always leaving at least one page (the client can't
+        have none)
+        """
+        keep = {self.managed_page_id, self.last_created_id} - {None}
+        stale = [page['id'] for page in pages
+                 if self._is_helper_page(page) and page.get('id') not in keep]
+        return stale[:max(0, len(pages) - 1)]
+
+    def schedule_cleanup(self):
+        """Delete stale helper pages in the background (one cleanup at a time)"""
+        if self._cleanup is not None and not self._cleanup.done():
+            return
+        self._cleanup = asyncio.ensure_future(self._cleanup_temp_pages())
+
+    async def _cleanup_temp_pages(self) -> int:
+        """
+        Delete temporary rune pages created by the app, concurrently
+        Keeps only permanent user pages and the managed page
+
+        Returns:
+            Number of pages deleted
+        """
+        pages = await self.get_rune_pages()
+        if not pages:
+            return 0
 
-            # Delete if it matches our naming pattern
-            page_name = page.get('name', '')
-            if any(page_name.startswith(prefix) for prefix in temp_prefixes):
-                await self.delete_rune_page(page['id'])
+        stale = self._stale_page_ids(pages)
+        if not stale:
+            return 0
+        return await self.delete_rune_pages(stale)
 
     # === Champion Select ===
 
@@ -185,6 +379,49 @@ class LCUAPI:
         phase = await self.get_gameflow_phase()
         return phase == 'ChampSelect'
 
+    # === Match History / Mastery ===
+
+    async def get_recent_champion_ids(self, count: int = 20) -> List[int]:
+        """
+        Get champions from the local player's recent games, most recent first
+
+        Args:
+            count: Number of recent games to look at
+
+        Returns:
+            Unique champion IDs in order of last play
+        """
+        result = await self.connector.get(
+            f'/lol-match-history/v1/products/lol/current-summoner/matches?begIndex=0&endIndex={count}'
+        )
+        if not result:
+            return []
+
+        champion_ids = []
+        for game in result.get('games', {}).get('games', []):
+            for participant in game.get('participants', []):
+                champion_id = participant.get('championId', 0)
+                if champion_id and champion_id not in champion_ids:
+                    champion_ids.append(champion_id)
+        return champion_ids
+
+    async def get_mastery_champion_ids(self, count: int = 10) -> List[int]:
+        """
+        Get the local player's highest-mastery champions ("mains")
+
+        Args:
+            count: Number of champions to return
+
+        Returns:
+            Champion IDs sorted by mastery points, highest first
+        """
+        result = await self.connector.get('/lol-champion-mastery/v1/local-player/champion-mastery')
+        if not isinstance(result, list):
+            return []
+
+        result.sort(key=lambda entry: entry.get('championPoints', 0), reverse=True)
+        return [entry['championId'] for entry in result[:count] if entry.get('championId')]
+
     # === Summoner Spells ===
 
     async def get_summoner_spells(self) -> Optional[List[dict]]:
@@ -4,34 +4,55 @@ Handles connection to the League of Legends client
 """
 
 import os
-import re
 import base64
-import psutil
 import aiohttp
 import ssl
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from pathlib import Path
+from lcu.discovery import CredentialDiscovery
+
+
+# Where the client writes its lockfile (LeagueClient:PID:PORT:TOKEN:PROTOCOL)
+LOCKFILE_PATHS = [
+    Path("C:/Riot Games/League of Legends/lockfile"),
+    Path.home() / "Riot Games/League of Legends/lockfile",
+]
 
 
 class LCUConnector:
     """Manages connection to the League Client API"""
 
-    def __init__(self):
+    def __init__(self, port: Optional[int] = None, token: Optional[str] = None,
+                 lockfile_paths: Optional[List[Path]] = None):
+        """
+        Initialize LCUConnector
+
+        Args:
+            port: Client port; with `token`, skips credential discovery
+                  (e.g., to connect to a mock client in tests)
+            token: Remoting auth token
+            lockfile_paths: Lockfile locations to check (default: LOCKFILE_PATHS)
+        """
+        self.lockfile_paths = lockfile_paths or LOCKFILE_PATHS
+        self.discovery = CredentialDiscovery(self.lockfile_paths)
         self.port: Optional[int] = None
         self.token: Optional[str] = None
         self.base_url: Optional[str] = None
         self.auth_header: Optional[str] = None
         self.session: Optional[aiohttp.ClientSession] = None
+        self._credentials: Optional[Tuple[int, str]] = (port, token) if port and token else None
 
     async def connect(self) -> bool:
         """
         Attempt to connect to the League client
         Returns True if successful, False otherwise
         """
-        credentials = self._find_lcu_credentials()
+        credentials = self._credentials or self._find_lcu_credentials()
         if not credentials:
             return False
 
+        await self.disconnect()  # Reconnecting: don't leak the previous session
+
         self.port, self.token = credentials
         self.base_url = f"https://127.0.0.1:{self.port}"
 
@@ -58,9 +79,12 @@ class LCUConnector:
                 if response.status == 200:
                     return True
         except Exception:
-            await self.disconnect()
-            return False
+            pass
 
+        await self.disconnect()
+        if not self._credentials:
+            # Stale lockfile or a client that has since exited: look again next time
+            self.discovery.forget()
         return False
 
     async def disconnect(self):
@@ -71,67 +95,10 @@ class LCUConnector:
 
     def _find_lcu_credentials(self) -> Optional[Tuple[int, str]]:
         """
-        Find LCU port and auth token from running League client process
+        Find LCU port and auth token from the lockfile or the running client process
         Returns (port, token) or None if not found
         """
-        # Try lockfile method first (most reliable)
-        lockfile_creds = self._read_lockfile()
-        if lockfile_creds:
-            return lockfile_creds
-
-        # Fallback to process command line
-        return self._read_from_process()
-
-    def _read_lockfile(self) -> Optional[Tuple[int, str]]:
-        """
-        Read credentials from lockfile
-        Located at: C:/Riot Games/League of Legends/lockfile
-        """
-        possible_paths = [
-            Path("C:/Riot Games/League of Legends/lockfile"),
-            Path.home() / "Riot Games/League of Legends/lockfile",
-        ]
-
-        for lockfile_path in possible_paths:
-            if lockfile_path.exists():
-                try:
-                    with open(lockfile_path, 'r') as f:
-                        content = f.read()
-
-                    # Format: LeagueClient:PID:PORT:TOKEN:PROTOCOL
-                    parts = content.split(':')
-                    if len(parts) >= 4:
-                        port = int(parts[2])
-                        token = parts[3]
-                        return (port, token)
-                except Exception:
-                    continue
-
-        return None
-
-    def _read_from_process(self) -> Optional[Tuple[int, str]]:
-        """
-        Read credentials from LeagueClientUx process command line
-        Fallback method if lockfile is not accessible
-        """
-        try:
-            for process in psutil.process_iter(['name', 'cmdline']):
-                if process.info['name'] in ['LeagueClientUx.exe', 'LeagueClient.exe']:
-                    cmdline = ' '.join(process.info['cmdline'])
-
-                    # Extract port
-                    port_match = re.search(r'--app-port=(\d+)', cmdline)
-                    # Extract token
-                    token_match = re.search(r'--remoting-auth-token=([\w-]+)', cmdline)
-
-                    if port_match and token_match:
-                        port = int(port_match.group(1))
-                        token = token_match.group(1)
-                        return (port, token)
-        except Exception:
-            pass
-
-        return None
+        return self.discovery.find()
 
     async def request(self, method: str, endpoint: str, **kwargs) -> Optional[dict]:
         """
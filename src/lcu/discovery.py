@@ -0,0 +1,183 @@
+"""
+LCU Credential Discovery
+Finds the client's port and auth token, remembering where it found them so
+repeated connect attempts don't rescan every process on the machine
+"""
+
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import psutil
+
+
+# Client processes whose command line carries the port and token
+CLIENT_PROCESS_NAMES = frozenset({'LeagueClientUx.exe', 'LeagueClient.exe'})
+
+PORT_ARG = '--app-port='
+TOKEN_ARG = '--remoting-auth-token='
+
+
+class DiscoveryStats:
+    """Counts of where credentials came from"""
+
+    def __init__(self):
+        self.lockfile_hits = 0
+        self.cached_hits = 0    # Cached process still running
+        self.scans = 0          # Full process scans
+        self.scan_hits = 0
+        self.misses = 0
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (for logging/display)"""
+        return {
+            'lockfile_hits': self.lockfile_hits,
+            'cached_hits': self.cached_hits,
+            'scans': self.scans,
+            'scan_hits': self.scan_hits,
+            'misses': self.misses
+        }
+
+
+def parse_client_args(cmdline: Iterable[str]) -> Optional[Tuple[int, str]]:
+    """
+    Pull (port, token) out of a client command line
+
+    Args:
+        cmdline: Process arguments
+
+    Returns:
+        (port, token) or None if either is missing
+    """
+    port = token = None
+    for arg in cmdline:
+        if arg.startswith(PORT_ARG):
+            try:
+                port = int(arg[len(PORT_ARG):])
+            except ValueError:
+                return None
+        elif arg.startswith(TOKEN_ARG):
+            token = arg[len(TOKEN_ARG):]
+    if port is None or not token:
+        return None
+    return port, token
+
+
+class CredentialDiscovery:
+    """
+    Locates the running client's (port, token)
+
+    Order of attempts:
+      1. The lockfile (re-parsed only when it changes)
+      2. The last client process found, if it is still running (same PID
+         and start time, so a recycled PID isn't trusted)
+      3. A full process scan that filters on process name before reading
+         any command line
+    """
+
+    def __init__(self, lockfile_paths: List[Path],
+                 process_names: Iterable[str] = CLIENT_PROCESS_NAMES):
+        """
+        Initialize CredentialDiscovery
+
+        Args:
+            lockfile_paths: Lockfile locations to check, in order
+            process_names: Client process names to look for
+        """
+        self.lockfile_paths = lockfile_paths
+        self.process_names = frozenset(process_names)
+        self.stats = DiscoveryStats()
+        self._lockfile: Optional[Tuple[Tuple, Tuple[int, str]]] = None  # (signature, creds)
+        # (pid, create time, port, token) of the last client process found
+        self._process: Optional[Tuple[int, float, int, str]] = None
+
+    def find(self) -> Optional[Tuple[int, str]]:
+        """
+        Find the client's credentials
+
+        Returns:
+            (port, token) or None if the client isn't running
+        """
+        credentials = self._from_lockfile()
+        if credentials is not None:
+            self.stats.lockfile_hits += 1
+            return credentials
+
+        credentials = self._from_cached_process()
+        if credentials is not None:
+            self.stats.cached_hits += 1
+            return credentials
+
+        credentials = self._scan_processes()
+        if credentials is not None:
+            self.stats.scan_hits += 1
+            return credentials
+
+        self.stats.misses += 1
+        return None
+
+    def forget(self):
+        """Drop everything cached (e.g., after the credentials were rejected)"""
+        self._lockfile = None
+        self._process = None
+
+    def _from_lockfile(self) -> Optional[Tuple[int, str]]:
+        """Read credentials from the first readable lockfile"""
+        for path in self.lockfile_paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            signature = (str(path), stat.st_mtime_ns, stat.st_size)
+            if self._lockfile is not None and self._lockfile[0] == signature:
+                return self._lockfile[1]
+
+            try:
+                # Format: LeagueClient:PID:PORT:TOKEN:PROTOCOL
+                parts = path.read_text().split(':')
+                if len(parts) < 4:
+                    continue
+                credentials = (int(parts[2]), parts[3])
+            except (OSError, ValueError):
+                continue
+
+            self._lockfile = (signature, credentials)
+            return credentials
+
+        self._lockfile = None
+        return None
+
+    def _from_cached_process(self) -> Optional[Tuple[int, str]]:
+        """Credentials of the last client process found, if it's still the same process"""
+        if self._process is None:
+            return None
+
+        pid, create_time, port, token = self._process
+        try:
+            if psutil.Process(pid).create_time() == create_time:
+                return port, token
+        except (psutil.Error, OSError):
+            pass
+
+        self._process = None
+        return None
+
+    def _scan_processes(self) -> Optional[Tuple[int, str]]:
+        """Scan for a client process, fetching command lines only for name matches"""
+        self.stats.scans += 1
+        try:
+            for process in psutil.process_iter(['name']):
+                if process.info['name'] not in self.process_names:
+                    continue
+                try:
+                    credentials = parse_client_args(process.cmdline())
+                    if credentials is None:
+                        continue
+                    self._process = (process.pid, process.create_time()) + credentials
+                except (psutil.Error, OSError):
+                    continue
+                return credentials
+        except Exception:
+            pass
+
+        return None
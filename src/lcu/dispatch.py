@@ -0,0 +1,149 @@
+"""
+Handler Queues
+Bounded per-handler event queues, so a slow handler doesn't stall the
+WebSocket reader or the other handlers
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple
+
+
+# Overflow policies: what a queue does with a new event
+DROP_OLDEST = 'drop_oldest'  # When full, discard the oldest queued event
+COALESCE = 'coalesce'        # Always replace the queued event for the same path;
+                             # when full with other paths, drop the oldest
+OVERFLOW_POLICIES = (DROP_OLDEST, COALESCE)
+
+
+class DispatchStats:
+    """Depth and lag counters for a handler queue"""
+
+    def __init__(self):
+        self.queued = 0
+        self.processed = 0
+        self.dropped = 0       # Events discarded to make room
+        self.coalesced = 0     # Queued events replaced by a newer one for the same path
+        self.max_depth = 0
+        self.total_lag = 0.0   # Seconds from queueing to the handler starting
+        self.max_lag = 0.0
+
+    @property
+    def average_lag(self) -> float:
+        """Mean seconds an event waited before its handler started"""
+        if not self.processed:
+            return 0.0
+        return self.total_lag / self.processed
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (for logging/display)"""
+        return {
+            'queued': self.queued,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'coalesced': self.coalesced,
+            'max_depth': self.max_depth,
+            'average_lag_ms': round(self.average_lag * 1000, 2),
+            'max_lag_ms': round(self.max_lag * 1000, 2)
+        }
+
+
+class HandlerQueue:
+    """
+    Runs one handler's events in arrival order, at most `maxsize` waiting
+
+    put() never blocks, so the reader keeps draining the socket however slow
+    the handler is. With COALESCE at most one event per path waits, since a
+    newer event for the path replaces the queued one; when the queue is full
+    of other paths the oldest is dropped. The worker is a plain task started
+    on demand that exits once the queue is empty, so the queue isn't tied to
+    one event loop.
+    """
+
+    def __init__(self, run: Callable[[Any], Awaitable], maxsize: int = 64,
+                 overflow: str = COALESCE):
+        """
+        Initialize HandlerQueue
+
+        Args:
+            run: Coroutine function called with each event's data
+            maxsize: Maximum number of events waiting for the handler
+            overflow: DROP_OLDEST or COALESCE
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow} "
+                             f"(available: {', '.join(OVERFLOW_POLICIES)})")
+        self.run = run
+        self.maxsize = max(1, maxsize)
+        self.overflow = overflow
+        self.stats = DispatchStats()
+        self._events: Deque[Tuple[str, Any, float]] = deque()  # (path, data, queued at)
+        self._worker: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def put(self, event_path: str, event_data: Any):
+        """
+        Queue an event for the handler, applying the overflow policy
+
+        Args:
+            event_path: Event path (used to coalesce)
+            event_data: Event data passed to the handler
+        """
+        if self._closed:
+            return
+        event = (event_path, event_data, time.perf_counter())
+        self.stats.queued += 1
+
+        if self.overflow == COALESCE and self._replace(event):
+            self.stats.coalesced += 1
+            return
+        if len(self._events) >= self.maxsize:
+            self._events.popleft()
+            self.stats.dropped += 1
+
+        self._events.append(event)
+        self.stats.max_depth = max(self.stats.max_depth, len(self._events))
+
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._drain())
+
+    def _replace(self, event: Tuple[str, Any, float]) -> bool:
+        """Replace the queued event for the same path, keeping its place"""
+        for index in range(len(self._events) - 1, -1, -1):
+            if self._events[index][0] == event[0]:
+                self._events[index] = event
+                return True
+        return False
+
+    async def _drain(self):
+        """Run queued events until none are left"""
+        try:
+            while self._events and not self._closed:
+                event_path, event_data, queued_at = self._events.popleft()
+                lag = time.perf_counter() - queued_at
+                self.stats.total_lag += lag
+                self.stats.max_lag = max(self.stats.max_lag, lag)
+                self.stats.processed += 1
+                try:
+                    await self.run(event_data)
+                except Exception as e:
+                    print(f"Error in queued handler for {event_path}: {e}")
+        finally:
+            self._worker = None
+
+    def close(self):
+        """Drop queued events and stop the worker (safe to call from the handler itself)"""
+        self._closed = True
+        self._events.clear()
+        worker = self._worker
+        if worker is not None and worker is not asyncio.current_task():
+            worker.cancel()
+
+    @property
+    def busy(self) -> bool:
+        """True while events are queued or the handler is running"""
+        return self._worker is not None
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,266 @@
+"""
+LCU Connection Supervisor
+Keeps the REST connection and WebSocket up across client restarts, retrying
+with exponential backoff and waking early when the lockfile changes
+"""
+
+import asyncio
+import random
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, Optional, Tuple
+
+from lcu.connector import LCUConnector, LOCKFILE_PATHS
+from lcu.websocket import LCUWebSocket
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional dependency - the lockfile is polled without it
+    FileSystemEventHandler = object
+    Observer = None
+
+
+# Seconds between lockfile checks when watchdog isn't installed
+POLL_INTERVAL = 0.25
+
+# Longest wait between connection attempts. Only the LOCKFILE_PATHS are
+# watched, so a client installed elsewhere (found by the process scan) is
+# only noticed on a retry; this bounds how long that takes.
+MAX_RETRY_DELAY = 5.0
+
+
+class Backoff:
+    """Exponential backoff with jitter"""
+
+    def __init__(self, initial: float = 0.25, maximum: float = MAX_RETRY_DELAY,
+                 factor: float = 2.0, jitter: float = 0.5,
+                 rng: Optional[random.Random] = None):
+        """
+        Initialize Backoff
+
+        Args:
+            initial: First delay in seconds
+            maximum: Delay cap in seconds
+            factor: Growth per attempt
+            jitter: Fraction of each delay that is randomised away (0 - 1)
+            rng: Random source (for reproducible delays)
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.attempts = 0
+
+    def next(self) -> float:
+        """Delay before the next attempt"""
+        delay = min(self.maximum, self.initial * self.factor ** self.attempts)
+        self.attempts += 1
+        return delay * (1 - self.jitter * self.rng.random())
+
+    def reset(self):
+        """Start again from the initial delay (after a success)"""
+        self.attempts = 0
+
+
+class _LockfileEvents(FileSystemEventHandler):
+    """Forwards watchdog events for the lockfiles to the event loop"""
+
+    def __init__(self, watcher: 'LockfileWatcher', loop: asyncio.AbstractEventLoop):
+        self.watcher = watcher
+        self.loop = loop
+
+    def on_any_event(self, event):
+        paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+        if any(path is not None and Path(path) in self.watcher.paths for path in paths):
+            self.loop.call_soon_threadsafe(self.watcher._changed.set)
+
+
+class LockfileWatcher:
+    """
+    Waits for the client's lockfile to be created, replaced or removed
+
+    Uses filesystem notifications when watchdog is installed; otherwise
+    stats the lockfiles every POLL_INTERVAL seconds, which is still far
+    cheaper than a process scan.
+    """
+
+    def __init__(self, paths: Optional[Iterable[Path]] = None,
+                 poll_interval: float = POLL_INTERVAL):
+        """
+        Initialize LockfileWatcher
+
+        Args:
+            paths: Lockfile locations (default: LOCKFILE_PATHS)
+            poll_interval: Seconds between checks when polling
+        """
+        self.paths = [Path(path) for path in (paths or LOCKFILE_PATHS)]
+        self.poll_interval = poll_interval
+        self._changed: Optional[asyncio.Event] = None
+        self._observer = None
+
+    def signature(self) -> Tuple:
+        """(path, mtime, size) of every lockfile that exists"""
+        found = []
+        for path in self.paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            found.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(found)
+
+    def _start_observer(self) -> bool:
+        """Start watching the lockfile directories; False if watchdog can't be used"""
+        if self._observer is not None:
+            return True
+        if Observer is None:
+            return False
+        directories = {path.parent for path in self.paths if path.parent.is_dir()}
+        if not directories:
+            return False
+
+        self._changed = asyncio.Event()
+        observer = Observer()
+        handler = _LockfileEvents(self, asyncio.get_running_loop())
+        for directory in directories:
+            observer.schedule(handler, str(directory), recursive=False)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        return True
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """
+        Wait until a lockfile changes
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if a lockfile changed, False on timeout
+        """
+        before = self.signature()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        if self._start_observer():
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self.signature() != before
+
+        while loop.time() < deadline:
+            await asyncio.sleep(min(self.poll_interval, deadline - loop.time()))
+            if self.signature() != before:
+                return True
+        return False
+
+    def close(self):
+        """Stop watching"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+
+class LCUSupervisor:
+    """
+    Connects to the client and keeps the WebSocket listening until stopped
+
+    Handlers are registered on `websocket` once; it is reconnected in place
+    after a drop or a client restart, and connect() resubscribes to every
+    registered path, so subscriptions resume without the handlers knowing.
+    """
+
+    def __init__(self, connector: LCUConnector, websocket: Optional[LCUWebSocket] = None,
+                 backoff: Optional[Backoff] = None, watcher: Optional[LockfileWatcher] = None):
+        """
+        Initialize LCUSupervisor
+
+        Args:
+            connector: LCU connector (credentials are rediscovered on each connect)
+            websocket: WebSocket to keep connected (default: a new LCUWebSocket)
+            backoff: Retry delays (default: 0.25 s doubling up to 5 s, with jitter)
+            watcher: Lockfile watcher that cuts retry waits short
+        """
+        self.connector = connector
+        self.websocket = websocket or LCUWebSocket(connector.port, connector.token)
+        self.backoff = backoff or Backoff()
+        self.watcher = watcher or LockfileWatcher(connector.lockfile_paths)
+        self.stopping = False
+        self.connects = 0  # Successful WebSocket connections, including the first
+        self._stopped: Optional[asyncio.Event] = None
+
+    @property
+    def connected(self) -> bool:
+        """True while the REST session is open"""
+        return self.connector.session is not None
+
+    async def connect_client(self) -> bool:
+        """
+        Connect to the client's REST API, retrying until it succeeds
+
+        Returns:
+            True once connected, False if stopped first
+        """
+        if self._stopped is None:
+            self._stopped = asyncio.Event()
+
+        while not self.stopping:
+            if self.connected or await self.connector.connect():
+                return True
+            await self._wait_before_retry()
+        return False
+
+    async def run(self, on_connect: Optional[Callable[[], Awaitable]] = None,
+                  on_disconnect: Optional[Callable[[], Awaitable]] = None):
+        """
+        Keep the WebSocket connected and listening until stop()
+
+        Args:
+            on_connect: Called after every successful (re)connect
+            on_disconnect: Called after every drop
+        """
+        while await self.connect_client():
+            self.websocket.port = self.connector.port
+            self.websocket.token = self.connector.token
+            if not await self.websocket.connect():
+                await self.connector.disconnect()
+                await self._wait_before_retry()
+                continue
+
+            self.backoff.reset()
+            self.connects += 1
+            if on_connect is not None:
+                await on_connect()
+
+            await self.websocket.listen()  # Returns when the connection drops
+
+            await self.websocket.disconnect()
+            await self.connector.disconnect()
+            if self.stopping:
+                break
+            print("[WARN] Lost connection to League client, reconnecting...")
+            if on_disconnect is not None:
+                await on_disconnect()
+
+    async def _wait_before_retry(self):
+        """Sleep for the next backoff delay, waking early on a lockfile change or stop()"""
+        delay = self.backoff.next()
+        waits = [asyncio.ensure_future(self.watcher.wait_for_change(delay)),
+                 asyncio.ensure_future(self._stopped.wait())]
+        done, pending = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        if waits[0] in done and waits[0].result():
+            self.backoff.reset()  # Client (re)started - retry quickly while it comes up
+
+    async def stop(self):
+        """Stop reconnecting and close the WebSocket"""
+        self.stopping = True
+        if self._stopped is not None:
+            self._stopped.set()
+        self.watcher.close()
+        await self.websocket.disconnect()
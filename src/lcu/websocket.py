@@ -5,21 +5,98 @@ Listens for real-time events from the League client
 
 import asyncio
 import json
+import re
 import ssl
 import websockets
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple
 from websockets.client import WebSocketClientProtocol
+from lcu.decoder import FrameDecoder
+from lcu.dispatch import COALESCE, HandlerQueue
+
+
+# WAMP opcodes
+SUBSCRIBE = 5
+UNSUBSCRIBE = 6
+EVENT = 8
+
+# Topic carrying every client event
+ALL_EVENTS = "OnJsonApiEvent"
+
+# Resolved routes remembered per event path (cleared when handlers change)
+MAX_CACHED_ROUTES = 1024
+
+# Events waiting per handler before the overflow policy applies
+DEFAULT_QUEUE_SIZE = 64
+
+# (registered path, handler, is wildcard, interest key function or None)
+Route = Tuple[str, Callable, bool, Optional[Callable]]
+
+# Interest key not computed yet for a handler
+_UNSEEN = object()
+
+
+def event_topic(event_path: str) -> str:
+    """
+    WAMP topic for a single endpoint's events
+
+    Example: '/lol-champ-select/v1/session' -> 'OnJsonApiEvent_lol-champ-select_v1_session'
+    """
+    return ALL_EVENTS + event_path.replace('/', '_')
+
+
+def compile_wildcard(event_path: str) -> Pattern:
+    """
+    Compile a wildcard handler path; '*' matches any run of characters and
+    the pattern is matched from the start of the event path
+
+    Example: '/lol-champ-select/*' matches '/lol-champ-select/v1/session'
+    """
+    return re.compile('.*'.join(re.escape(part) for part in event_path.split('*')))
 
 
 class LCUWebSocket:
     """Manages WebSocket connection to League Client for real-time events"""
 
-    def __init__(self, port: int, token: str):
+    def __init__(self, port: int, token: str, decoder: Optional[FrameDecoder] = None,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, overflow: str = COALESCE):
+        """
+        Initialize LCUWebSocket
+
+        Args:
+            port: Client port
+            token: Remoting auth token
+            decoder: Frame decoder (default: orjson if installed, else stdlib json)
+            queue_size: Events queued per handler (0 runs handlers inline on the reader)
+            overflow: What a handler queue does with a new event
+                      (dispatch.COALESCE or dispatch.DROP_OLDEST)
+        """
         self.port = port
         self.token = token
+        self.decoder = decoder or FrameDecoder()
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.frames_skipped = 0  # Frames dropped before decoding (no handler)
         self.ws: Optional[WebSocketClientProtocol] = None
         self.running = False
         self.event_handlers: Dict[str, list] = {}
+        self.subscriptions: Set[str] = set()  # Topics currently subscribed on the socket
+        self._pending_sends: Set[asyncio.Task] = set()
+        self._wildcards: List[Tuple[str, Pattern]] = []
+        self._topic_paths: Dict[str, str] = {}  # Per-endpoint topic -> exact handler path
+        self._routes: Dict[str, Tuple[Route, ...]] = {}
+        self._interests: Dict[Tuple[str, Callable], Callable] = {}
+        self._interest_keys: Dict[Tuple[str, Callable], Any] = {}
+        # Coalescing: event path -> window, key function, last key, last dispatch
+        # time, latest held payload
+        self.coalesce_windows: Dict[str, float] = {}
+        self._coalesce_keys: Dict[str, Callable] = {}
+        self._event_keys: Dict[str, Any] = {}
+        self.events_coalesced = 0  # Events replaced by a newer one before dispatch
+        self.handlers_skipped = 0  # Handler calls skipped (interest key unchanged)
+        self._last_dispatch: Dict[str, float] = {}
+        self._held_events: Dict[str, Any] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._queues: Dict[Tuple[str, Callable], HandlerQueue] = {}
 
     async def connect(self) -> bool:
         """
@@ -39,8 +116,14 @@ class LCUWebSocket:
                 ssl=ssl_context
             )
 
-            # Subscribe to all events
-            await self.ws.send(json.dumps([5, "OnJsonApiEvent"]))
+            # A new connection may be a restarted client: let every handler see
+            # the first event again
+            self._interest_keys.clear()
+            self._event_keys.clear()
+
+            # Subscribe only to the endpoints that have handlers
+            self.subscriptions = self._wanted_topics()
+            await self._send_all([[SUBSCRIBE, topic] for topic in sorted(self.subscriptions)])
 
             self.running = True
             return True
@@ -52,21 +135,165 @@ class LCUWebSocket:
     async def disconnect(self):
         """Close WebSocket connection"""
         self.running = False
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        self._held_events.clear()
+        for queue in self._queues.values():
+            queue.close()
+        self._queues.clear()
         if self.ws:
             await self.ws.close()
             self.ws = None
+        self.subscriptions = set()
 
-    def on(self, event_path: str, handler: Callable):
+    def on(self, event_path: str, handler: Callable, interest: Optional[Callable] = None):
         """
         Register an event handler
 
+        The socket subscribes to the path's topic if it isn't already, so
+        the client only sends events something is listening for.
+
         Args:
             event_path: Event path to listen for (e.g., '/lol-champ-select/v1/session')
             handler: Async function to call when event occurs
+            interest: Optional function mapping event data to the fields the
+                      handler cares about; the handler is only called when
+                      that key differs from the previous event's
         """
         if event_path not in self.event_handlers:
             self.event_handlers[event_path] = []
         self.event_handlers[event_path].append(handler)
+        if interest is not None:
+            self._interests[(event_path, handler)] = interest
+            self._interest_keys.pop((event_path, handler), None)
+        self._handlers_changed()
+
+    def off(self, event_path: str, handler: Callable):
+        """
+        Remove an event handler (unsubscribing once the path has none left)
+
+        Args:
+            event_path: Event path the handler was registered for
+            handler: Handler passed to on()
+        """
+        handlers = self.event_handlers.get(event_path)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if handler not in handlers:
+                self._interests.pop((event_path, handler), None)
+                self._interest_keys.pop((event_path, handler), None)
+                queue = self._queues.pop((event_path, handler), None)
+                if queue is not None:
+                    queue.close()
+            if not handlers:
+                del self.event_handlers[event_path]
+            self._handlers_changed()
+
+    def coalesce(self, event_path: str, window: float, key: Optional[Callable] = None):
+        """
+        Coalesce bursts of events for one endpoint
+
+        The first event after a quiet period is dispatched straight away.
+        Events arriving within `window` seconds of the last dispatch are held,
+        each replacing the one before, and only the latest is dispatched when
+        the window ends. Events for an endpoint are still dispatched in order.
+
+        With `key`, only repeats are held: an event whose key differs from the
+        previous event's (a new hover, a lock-in) is dispatched straight away,
+        replacing anything held.
+
+        Args:
+            event_path: Exact event path (e.g., '/lol-champ-select/v1/session')
+            window: Window in seconds (0 turns coalescing off)
+            key: Optional function mapping event data to the fields that must
+                 never wait for the window (e.g., local_player_selection)
+        """
+        self._event_keys.pop(event_path, None)
+        if window > 0:
+            self.coalesce_windows[event_path] = window
+        else:
+            self.coalesce_windows.pop(event_path, None)
+        if window > 0 and key is not None:
+            self._coalesce_keys[event_path] = key
+        else:
+            self._coalesce_keys.pop(event_path, None)
+
+    def _handlers_changed(self):
+        """Rebuild the route table and subscriptions after on() / off()"""
+        self._wildcards = [(path, compile_wildcard(path))
+                           for path in self.event_handlers if '*' in path]
+        self._topic_paths = {event_topic(path): path
+                             for path in self.event_handlers if '*' not in path}
+        self._routes.clear()
+        self._update_subscriptions()
+
+    def _route(self, event_path: str) -> Tuple[Route, ...]:
+        """
+        Handlers for an event path: exact-match handlers, then wildcard handlers
+
+        Resolved once per distinct path; later events for the same path are a
+        dict lookup.
+        """
+        route = self._routes.get(event_path)
+        if route is not None:
+            return route
+
+        route = tuple((event_path, handler, False, self._interests.get((event_path, handler)))
+                      for handler in self.event_handlers.get(event_path, ()))
+        route += tuple((path, handler, True, self._interests.get((path, handler)))
+                       for path, pattern in self._wildcards if pattern.match(event_path)
+                       for handler in self.event_handlers[path])
+
+        if len(self._routes) >= MAX_CACHED_ROUTES:
+            self._routes.clear()
+        self._routes[event_path] = route
+        return route
+
+    # === Subscriptions ===
+
+    def _wanted_topics(self) -> Set[str]:
+        """
+        Topics needed for the registered handlers
+
+        The client has no wildcard topics, so any wildcard handler
+        (e.g., '/lol-champ-select/*') needs the full OnJsonApiEvent stream;
+        per-endpoint topics would then deliver every event twice.
+        """
+        paths = [path for path, handlers in self.event_handlers.items() if handlers]
+        if any('*' in path for path in paths):
+            return {ALL_EVENTS}
+        return {event_topic(path) for path in paths}
+
+    def _update_subscriptions(self):
+        """Subscribe / unsubscribe so the socket's topics match the handlers"""
+        if not self.ws:
+            return  # connect() subscribes to whatever is registered by then
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        wanted = self._wanted_topics()
+        added = wanted - self.subscriptions
+        removed = self.subscriptions - wanted
+        if not added and not removed:
+            return
+
+        self.subscriptions = wanted
+        # Subscribe before unsubscribing so switching topics never drops events
+        messages = [[SUBSCRIBE, topic] for topic in sorted(added)]
+        messages += [[UNSUBSCRIBE, topic] for topic in sorted(removed)]
+        task = loop.create_task(self._send_all(messages))
+        self._pending_sends.add(task)
+        task.add_done_callback(self._pending_sends.discard)
+
+    async def _send_all(self, messages: List[list]):
+        """Send WAMP messages, ignoring a socket that has just closed"""
+        try:
+            for message in messages:
+                await self.ws.send(json.dumps(message))
+        except Exception as e:
+            print(f"WebSocket subscription update failed: {e}")
 
     async def listen(self):
         """
@@ -94,53 +321,191 @@ class LCUWebSocket:
         """
         Parse and handle incoming WebSocket message
 
-        Message format: [opcode, event_type, event_data]
-        Example: [8, "OnJsonApiEvent", {"uri": "/lol-champ-select/v1/session", "data": {...}}]
+        Message format: [opcode, topic, event_data]
+        Example: [8, "OnJsonApiEvent_lol-champ-select_v1_session",
+                  {"uri": "/lol-champ-select/v1/session", "data": {...}}]
         """
         try:
-            data = json.loads(message)
+            if not self._wanted(message):
+                self.frames_skipped += 1
+                return
+
+            data = self.decoder.loads(message)
 
-            # Format: [opcode, event_name, event_data]
-            if len(data) >= 3 and data[1] == "OnJsonApiEvent":
+            # Format: [opcode, topic, event_data]
+            if len(data) >= 3 and data[0] == EVENT and data[1].startswith(ALL_EVENTS):
                 event_info = data[2]
                 event_path = event_info.get('uri', '')
                 event_data = event_info.get('data', {})
 
                 # Dispatch to registered handlers
-                await self._dispatch_event(event_path, event_data)
+                window = self.coalesce_windows.get(event_path)
+                if window is not None:
+                    await self._coalesce_event(event_path, event_data, window)
+                else:
+                    await self._dispatch_event(event_path, event_data)
 
-        except json.JSONDecodeError:
+        except ValueError:  # Invalid JSON (json and orjson errors both subclass it)
             pass
         except Exception as e:
             print(f"Error handling message: {e}")
 
+    def _wanted(self, message: str) -> bool:
+        """
+        Cheap check, before decoding, for whether any handler wants a frame
+
+        A per-endpoint topic is wanted if an exact handler registered it.
+        On the full OnJsonApiEvent stream the event URI is peeked from the raw
+        text; when that's ambiguous the frame is decoded to be safe.
+        """
+        if not isinstance(message, str):
+            return True  # Binary frame: nothing to peek at, let the decoder handle it
+        topic = self.decoder.peek_topic(message)
+        if topic is None:
+            return True
+        if topic != ALL_EVENTS:
+            return topic in self._topic_paths
+        uri = self.decoder.peek_uri(message)
+        return uri is None or bool(self._route(uri))
+
     async def _dispatch_event(self, event_path: str, event_data: dict):
         """
-        Call all registered handlers for a given event path
+        Hand an event to all registered handlers for its path
+
+        Each handler has its own queue and worker, so this returns without
+        waiting for handlers (unless queue_size is 0, when they run inline).
 
         Args:
             event_path: The event path (e.g., '/lol-champ-select/v1/session')
             event_data: The event data payload
         """
-        # Check for exact match
-        if event_path in self.event_handlers:
-            for handler in self.event_handlers[event_path]:
-                try:
-                    await handler(event_data)
-                except Exception as e:
-                    print(f"Error in event handler for {event_path}: {e}")
-
-        # Also check for wildcard handlers (e.g., '/lol-champ-select/*')
-        for registered_path, handlers in self.event_handlers.items():
-            if '*' in registered_path:
-                pattern = registered_path.replace('*', '.*')
-                import re
-                if re.match(pattern, event_path):
-                    for handler in handlers:
-                        try:
-                            await handler(event_data)
-                        except Exception as e:
-                            print(f"Error in wildcard handler for {registered_path}: {e}")
+        for route in self._route(event_path):
+            if not self.queue_size:
+                await self._run_handler(route, event_data)
+                continue
+
+            key = (route[0], route[1])
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = HandlerQueue(lambda data, route=route: self._run_handler(route, data),
+                                     maxsize=self.queue_size, overflow=self.overflow)
+                self._queues[key] = queue
+            queue.put(event_path, event_data)
+
+    async def _run_handler(self, route: Route, event_data: dict):
+        """Call one handler, unless its interest key is unchanged"""
+        registered_path, handler, wildcard, interest = route
+        try:
+            if interest is not None and not self._interest_changed(
+                    registered_path, handler, interest, event_data):
+                self.handlers_skipped += 1
+                return
+            await handler(event_data)
+        except Exception as e:
+            kind = "wildcard handler" if wildcard else "event handler"
+            print(f"Error in {kind} for {registered_path}: {e}")
+
+    def _interest_changed(self, registered_path: str, handler: Callable,
+                          interest: Callable, event_data: Any) -> bool:
+        """Record a handler's interest key for this event; True if it changed"""
+        key = interest(event_data)
+        state = (registered_path, handler)
+        if self._interest_keys.get(state, _UNSEEN) == key:
+            return False
+        self._interest_keys[state] = key
+        return True
+
+    # === Handler queues ===
+
+    @property
+    def queue_depth(self) -> int:
+        """Events waiting across all handler queues"""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def dispatch_stats(self) -> Dict[str, dict]:
+        """
+        Queue depth and lag per handler
+
+        Returns:
+            {'<path> <handler name>': {'depth': ..., 'max_depth': ..., ...}}
+        """
+        stats = {}
+        for (path, handler), queue in self._queues.items():
+            name = getattr(handler, '__qualname__', repr(handler))
+            stats[f"{path} {name}"] = {'depth': len(queue), **queue.stats.to_dict()}
+        return stats
+
+    async def drain(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until every handler queue is empty and idle
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if drained, False on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while self._flush_tasks or any(queue.busy for queue in self._queues.values()):
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
+        return True
+
+    # === Coalescing ===
+
+    async def _coalesce_event(self, event_path: str, event_data: Any, window: float):
+        """
+        Dispatch now if the endpoint has been quiet or the event's key changed,
+        otherwise hold the latest event
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        last = self._last_dispatch.get(event_path)
+        changed = False
+        key_func = self._coalesce_keys.get(event_path)
+        if key_func is not None:
+            key = key_func(event_data)
+            changed = self._event_keys.get(event_path, _UNSEEN) != key
+            self._event_keys[event_path] = key
+
+        if changed or (event_path not in self._flush_tasks
+                       and (last is None or now - last >= window)):
+            # A held event is older than this one: drop it (the flush task stops)
+            if self._held_events.pop(event_path, _UNSEEN) is not _UNSEEN:
+                self.events_coalesced += 1
+            self._last_dispatch[event_path] = now
+            await self._dispatch_event(event_path, event_data)
+            return
+
+        if event_path in self._held_events:
+            self.events_coalesced += 1
+        self._held_events[event_path] = event_data
+        if event_path not in self._flush_tasks:
+            self._flush_tasks[event_path] = loop.create_task(self._flush_events(event_path))
+
+    async def _flush_events(self, event_path: str):
+        """
+        Dispatch held events for an endpoint at the end of each window
+
+        Runs until nothing is held; events arriving while a handler runs are
+        held for the next window rather than dispatched concurrently.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while event_path in self._held_events:
+                window = self.coalesce_windows.get(event_path, 0)
+                delay = self._last_dispatch[event_path] + window - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                event_data = self._held_events.pop(event_path, _UNSEEN)
+                if event_data is _UNSEEN:
+                    break  # Superseded by an event dispatched straight away
+                self._last_dispatch[event_path] = loop.time()
+                await self._dispatch_event(event_path, event_data)
+        finally:
+            self._flush_tasks.pop(event_path, None)
 
     async def wait_for_event(self, event_path: str, timeout: float = 30.0) -> Optional[dict]:
         """
@@ -172,5 +537,4 @@ class LCUWebSocket:
             return None
         finally:
             # Clean up temporary handler
-            if event_path in self.event_handlers:
-                self.event_handlers[event_path].remove(handler)
+            self.off(event_path, handler)
@@ -9,10 +9,16 @@ import sys
 from typing import Optional
 
 from lcu.connector import LCUConnector
+from lcu.supervisor import LCUSupervisor
 from lcu.websocket import LCUWebSocket
-from lcu.api import LCUAPI
+from lcu.api import LCUAPI, SESSION_COALESCE_WINDOW, local_pick_locked, local_player_selection
+from cache.build_cache import BuildCache
+from cache.prefetch import SessionPrefetcher
+from cache.warmer import CacheWarmer
+from providers.http import close_http_client
 from providers.ugg_scraper import UGGScraperProvider
 from runes.manager import RuneManager
+from runes.staging import RunePageStager
 from items.writer import ItemSetWriter
 
 
@@ -29,12 +35,28 @@ CHAMPION_NAMES = {k: v.title().replace("Khazix", "Kha'Zix").replace("Kogmaw", "K
 class LeagueHelper:
     """Main application class"""
 
-    def __init__(self):
-        self.connector = LCUConnector()
+    def __init__(self, connector: Optional[LCUConnector] = None,
+                 build_cache: Optional[BuildCache] = None,
+                 provider: Optional[UGGScraperProvider] = None):
+        """
+        Initialize LeagueHelper
+
+        Args:
+            connector: LCU connector (default: discovers the running client)
+            build_cache: Build cache (default: data/build_cache.db)
+            provider: Build provider (default: U.GG scraper using build_cache)
+        """
+        self.connector = connector or LCUConnector()
         self.api: Optional[LCUAPI] = None
         self.websocket: Optional[LCUWebSocket] = None
-        self.provider = UGGScraperProvider()
+        self.supervisor: Optional[LCUSupervisor] = None
+        self.build_cache = build_cache if build_cache is not None else BuildCache()
+        self.provider = provider or UGGScraperProvider(cache=self.build_cache)
+        self.warmer: Optional[CacheWarmer] = None
+        self.prefetcher: Optional[SessionPrefetcher] = None
         self.rune_manager: Optional[RuneManager] = None
+        self.stager: Optional[RunePageStager] = None
+        self._last_champion = None
         self.item_writer = ItemSetWriter()
         self.running = False
         self.current_patch = "14_1"  # Will be updated on startup
@@ -46,10 +68,12 @@ class LeagueHelper:
         print("=" * 50)
         print()
 
-        # Connect to League client
+        # Connect to League client (retries with backoff, waking when the lockfile appears)
         print("Waiting for League of Legends client...")
-        while not await self.connector.connect():
-            await asyncio.sleep(5)
+        self.supervisor = LCUSupervisor(self.connector)
+        self.websocket = self.supervisor.websocket
+        if not await self.supervisor.connect_client():
+            return
 
         print("[OK] Connected to League client")
         print()
@@ -57,6 +81,11 @@ class LeagueHelper:
         # Initialize components
         self.api = LCUAPI(self.connector)
         self.rune_manager = RuneManager(self.api, provider_name="U.GG")
+        await self.rune_manager.load_catalog(self.provider.get_runes_reforged)
+        self.stager = RunePageStager(
+            self.rune_manager,
+            lambda champion_id, role: self.provider.get_build(champion_id, role, self.current_patch)
+        )
 
         # Get summoner info
         summoner = await self.api.get_current_summoner()
@@ -71,44 +100,87 @@ class LeagueHelper:
             print(f"Current patch: {patch}")
             print()
 
-        # Setup WebSocket
-        self.websocket = LCUWebSocket(self.connector.port, self.connector.token)
-        if await self.websocket.connect():
-            print("[OK] WebSocket connected")
-            print()
-
-            # Register event handler for champion select
-            self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select)
-
-            # Start listening for events
-            self.running = True
-            print("Listening for champion selections...")
-            print("(Press Ctrl+C to exit)")
-            print()
+        # Start background cache warmer (only fetches while the client is idle)
+        if not self.warmer:
+            self.warmer = CacheWarmer(self.provider, self.build_cache, CHAMPION_ID_MAP.keys())
+            await self.warmer.load_priorities(self.api)
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+            self.warmer.start(self.current_patch)
+
+        # During champ select, warm builds for trades, swaps and the ARAM bench instead
+        if self.prefetcher is None:
+            self.prefetcher = SessionPrefetcher(
+                lambda champion_id, role: self.provider.get_build(champion_id, role,
+                                                                  self.current_patch),
+                default_role='middle'
+            )
 
-            await self.websocket.listen()
+        # Register event handler for champion select (kept across reconnects)
+        self.websocket.coalesce('/lol-champ-select/v1/session', SESSION_COALESCE_WINDOW,
+                                key=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select,
+                          interest=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.prefetcher.handle_session_event,
+                          interest=self.prefetcher.interest)
+        self.websocket.on('/lol-gameflow/v1/gameflow-phase', self.warmer.handle_gameflow_event)
+
+        # Listen for events, reconnecting if the client restarts
+        self.running = True
+        await self.supervisor.run(on_connect=self.on_connected)
+
+    async def on_connected(self):
+        """Called each time the WebSocket (re)connects"""
+        self._last_champion = None  # The client may have restarted mid champ select
+        self.stager.reset()
+        self.prefetcher.reset()
+        if self.warmer is not None:
+            # Phase changes while disconnected never arrive as events
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+        print("[OK] WebSocket connected")
+        print()
+        print("Listening for champion selections...")
+        print("(Press Ctrl+C to exit)")
+        print()
 
     async def stop(self):
         """Stop the application"""
         print("\nShutting down...")
         self.running = False
 
-        if self.websocket:
-            await self.websocket.disconnect()
+        if self.warmer:
+            await self.warmer.stop()
+            self.warmer = None
+
+        if self.prefetcher is not None:
+            await self.prefetcher.stop()
+            self.prefetcher = None
+
+        await self.provider.refresher.stop()
+        await close_http_client()
+
+        if self.supervisor:
+            await self.supervisor.stop()
 
         if self.connector:
             await self.connector.disconnect()
 
+        print(f"Build cache: {self.build_cache.stats}")
+        self.build_cache.close()
+
         print("Goodbye!")
 
     async def on_champion_select(self, data: dict):
         """
         Handle champion selection event
 
+        Hovers stage the rune page in the background; lock-in applies it.
+
         Args:
             data: Champion select session data
         """
         if not data:
+            self.stager.reset()  # Champ select ended
+            self._last_champion = None
             return
 
         try:
@@ -120,7 +192,7 @@ class LeagueHelper:
             my_team = data.get('myTeam', [])
             for player in my_team:
                 if player.get('cellId') == cell_id:
-                    champion_id = player.get('championId', 0)
+                    champion_id = player.get('championId', 0) or player.get('championPickIntent', 0)
                     if champion_id == 0:
                         return  # No champion selected yet
 
@@ -128,8 +200,14 @@ class LeagueHelper:
                     if not role:
                         role = 'middle'  # Default
 
+                    champion_name = CHAMPION_NAMES.get(champion_id, f"Champion{champion_id}")
+                    if not local_pick_locked(data):
+                        # Hovered: get the page ready so lock-in is a single request
+                        self.stager.hover(champion_id, role, champion_name)
+                        return
+
                     # Check if we've already processed this selection
-                    if hasattr(self, '_last_champion') and self._last_champion == (champion_id, role):
+                    if self._last_champion == (champion_id, role):
                         return
 
                     self._last_champion = (champion_id, role)
@@ -155,25 +233,10 @@ class LeagueHelper:
         print(f"Champion selected: {champion_name} ({role})")
         print(f"{'=' * 50}")
 
-        # Fetch build data
-        print("Fetching build data from U.GG...")
-        build_data = await self.provider.get_build(champion_id, role, self.current_patch)
-
-        if not build_data:
-            print("[FAILED] Failed to fetch build data")
-            return
-
-        print("[OK] Build data retrieved")
-
-        # Apply runes
-        if build_data.runes:
-            success = await self.rune_manager.apply_runes(
-                build_data.runes,
-                champion_name,
-                role
-            )
-            if not success:
-                print("[FAILED] Failed to apply runes")
+        # Apply runes (staged on hover, so usually just the one write)
+        success = await self.stager.lock_in(champion_id, role, champion_name)
+        if not success:
+            print("[FAILED] Failed to apply runes")
 
         # Create item set (optional - requires champion key)
         # This would need Data Dragon integration for proper champion keys
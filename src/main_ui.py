@@ -10,10 +10,16 @@ import threading
 from typing import Optional
 
 from lcu.connector import LCUConnector
+from lcu.supervisor import LCUSupervisor
 from lcu.websocket import LCUWebSocket
-from lcu.api import LCUAPI
+from lcu.api import LCUAPI, SESSION_COALESCE_WINDOW, local_pick_locked, local_player_selection
+from cache.build_cache import BuildCache
+from cache.prefetch import SessionPrefetcher
+from cache.warmer import CacheWarmer
+from providers.http import close_http_client
 from providers.ugg_scraper import UGGScraperProvider, CHAMPION_NAMES as CHAMPION_ID_MAP
 from runes.manager import RuneManager
+from runes.staging import RunePageStager
 from items.writer import ItemSetWriter
 from ui.tray import TrayUI
 
@@ -32,8 +38,14 @@ class LeagueHelperWithUI:
         self.connector = LCUConnector()
         self.api: Optional[LCUAPI] = None
         self.websocket: Optional[LCUWebSocket] = None
-        self.provider = UGGScraperProvider()
+        self.supervisor: Optional[LCUSupervisor] = None
+        self.build_cache: Optional[BuildCache] = BuildCache()
+        self.provider = UGGScraperProvider(cache=self.build_cache)
+        self.warmer: Optional[CacheWarmer] = None
+        self.prefetcher: Optional[SessionPrefetcher] = None
         self.rune_manager: Optional[RuneManager] = None
+        self.stager: Optional[RunePageStager] = None
+        self._last_champion = None
         self.item_writer = ItemSetWriter()
         self.running = False
         self.current_patch = "14_1"
@@ -47,13 +59,20 @@ class LeagueHelperWithUI:
         print("=" * 50)
         print()
 
+        # Reopen the build cache if a previous stop() closed it
+        if self.build_cache is None:
+            self.build_cache = BuildCache()
+            self.provider = UGGScraperProvider(cache=self.build_cache)
+
         # Connect to League client
         print("Waiting for League of Legends client...")
         if self.tray_ui:
             self.tray_ui.update_status(False, "Waiting for League client...")
 
-        while not await self.connector.connect():
-            await asyncio.sleep(5)
+        self.supervisor = LCUSupervisor(self.connector)
+        self.websocket = self.supervisor.websocket
+        if not await self.supervisor.connect_client():
+            return
 
         print("[OK] Connected to League client")
         if self.tray_ui:
@@ -62,6 +81,11 @@ class LeagueHelperWithUI:
         # Initialize components
         self.api = LCUAPI(self.connector)
         self.rune_manager = RuneManager(self.api, provider_name="U.GG")
+        await self.rune_manager.load_catalog(self.provider.get_runes_reforged)
+        self.stager = RunePageStager(
+            self.rune_manager,
+            lambda champion_id, role: self.provider.get_build(champion_id, role, self.current_patch)
+        )
 
         # Get summoner info
         summoner = await self.api.get_current_summoner()
@@ -77,42 +101,93 @@ class LeagueHelperWithUI:
             self.current_patch = patch
             print(f"Current patch: {patch}")
 
-        # Setup WebSocket
-        self.websocket = LCUWebSocket(self.connector.port, self.connector.token)
-        if await self.websocket.connect():
-            print("[OK] WebSocket connected")
-            print()
-
-            # Register event handler
-            self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select)
+        # Start background cache warmer (only fetches while the client is idle)
+        if not self.warmer:
+            self.warmer = CacheWarmer(self.provider, self.build_cache, CHAMPION_ID_MAP.keys())
+            await self.warmer.load_priorities(self.api)
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+            self.warmer.start(self.current_patch)
+
+        # During champ select, warm builds for trades, swaps and the ARAM bench instead
+        if self.prefetcher is None:
+            self.prefetcher = SessionPrefetcher(
+                lambda champion_id, role: self.provider.get_build(champion_id, role,
+                                                                  self.current_patch),
+                default_role='middle'
+            )
 
-            # Start listening
-            self.running = True
-            print("Listening for champion selections...")
-            print("Use the system tray to control the app.")
-            print()
+        # Register event handler (kept across reconnects)
+        self.websocket.coalesce('/lol-champ-select/v1/session', SESSION_COALESCE_WINDOW,
+                                key=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select,
+                          interest=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.prefetcher.handle_session_event,
+                          interest=self.prefetcher.interest)
+        self.websocket.on('/lol-gameflow/v1/gameflow-phase', self.warmer.handle_gameflow_event)
+
+        # Start listening, reconnecting if the client restarts
+        self.running = True
+        await self.supervisor.run(on_connect=self.on_connected, on_disconnect=self.on_disconnected)
+
+    async def on_connected(self):
+        """Called each time the WebSocket (re)connects"""
+        self._last_champion = None
+        self.stager.reset()
+        self.prefetcher.reset()
+        if self.warmer is not None:
+            # Phase changes while disconnected never arrive as events
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+        print("[OK] WebSocket connected")
+        print()
+        print("Listening for champion selections...")
+        print("Use the system tray to control the app.")
+        print()
+        if self.tray_ui:
+            self.tray_ui.update_status(True, "Connected")
 
-            await self.websocket.listen()
+    async def on_disconnected(self):
+        """Called when the connection to the client drops"""
+        if self.tray_ui:
+            self.tray_ui.update_status(False, "Waiting for League client...")
 
     async def stop(self):
         """Stop the application"""
         print("\n[UI] Stopping application...")
         self.running = False
 
-        if self.websocket:
-            await self.websocket.disconnect()
+        if self.warmer:
+            await self.warmer.stop()
+            self.warmer = None
+
+        if self.prefetcher is not None:
+            await self.prefetcher.stop()
+            self.prefetcher = None
+
+        await self.provider.refresher.stop()
+        await close_http_client()
+
+        if self.supervisor:
+            await self.supervisor.stop()
 
         if self.connector:
             await self.connector.disconnect()
 
+        print(f"Build cache: {self.build_cache.stats}")
+        self.build_cache.close()
+        self.build_cache = None
+
         if self.tray_ui:
             self.tray_ui.update_status(False, "Stopped")
 
         print("[OK] Stopped")
 
     async def on_champion_select(self, data: dict):
-        """Handle champion selection event"""
-        if not data or not self.running:
+        """Handle champion selection event (hovers stage the rune page, lock-in applies it)"""
+        if not data:
+            self.stager.reset()  # Champ select ended
+            self._last_champion = None
+            return
+        if not self.running:
             return
 
         try:
@@ -123,7 +198,7 @@ class LeagueHelperWithUI:
             my_team = data.get('myTeam', [])
             for player in my_team:
                 if player.get('cellId') == cell_id:
-                    champion_id = player.get('championId', 0)
+                    champion_id = player.get('championId', 0) or player.get('championPickIntent', 0)
                     if champion_id == 0:
                         return
 
@@ -131,8 +206,13 @@ class LeagueHelperWithUI:
                     if not role:
                         role = 'middle'
 
+                    champion_name = CHAMPION_NAMES.get(champion_id, f"Champion{champion_id}")
+                    if not local_pick_locked(data):
+                        self.stager.hover(champion_id, role, champion_name)
+                        return
+
                     # Prevent duplicate processing
-                    if hasattr(self, '_last_champion') and self._last_champion == (champion_id, role):
+                    if self._last_champion == (champion_id, role):
                         return
 
                     self._last_champion = (champion_id, role)
@@ -151,35 +231,18 @@ class LeagueHelperWithUI:
         print(f"{'=' * 50}")
 
         if self.tray_ui:
-            self.tray_ui.update_status(True, f"{champion_name} - Fetching...")
+            self.tray_ui.update_status(True, f"{champion_name} - Applying...")
 
-        # Fetch build data
-        print("Fetching build data from U.GG...")
-        build_data = await self.provider.get_build(champion_id, role, self.current_patch)
+        # Apply runes (staged on hover, so usually just the one write)
+        success = await self.stager.lock_in(champion_id, role, champion_name)
 
-        if not build_data:
-            print("[FAILED] Failed to fetch build data")
+        if success:
             if self.tray_ui:
-                self.tray_ui.update_status(True, f"{champion_name} - Failed")
-            return
-
-        print("[OK] Build data retrieved")
-
-        # Apply runes
-        if build_data.runes:
-            success = await self.rune_manager.apply_runes(
-                build_data.runes,
-                champion_name,
-                role
-            )
-
-            if success:
-                if self.tray_ui:
-                    self.tray_ui.update_status(True, f"{champion_name} - Applied!")
-            else:
-                print("[FAILED] Failed to apply runes")
-                if self.tray_ui:
-                    self.tray_ui.update_status(True, f"{champion_name} - Error")
+                self.tray_ui.update_status(True, f"{champion_name} - Applied!")
+        else:
+            print("[FAILED] Failed to apply runes")
+            if self.tray_ui:
+                self.tray_ui.update_status(True, f"{champion_name} - Error")
 
         print()
 
@@ -9,10 +9,16 @@ import threading
 from typing import Optional
 
 from lcu.connector import LCUConnector
+from lcu.supervisor import LCUSupervisor
 from lcu.websocket import LCUWebSocket
-from lcu.api import LCUAPI
+from lcu.api import LCUAPI, SESSION_COALESCE_WINDOW, local_pick_locked, local_player_selection
+from cache.build_cache import BuildCache
+from cache.prefetch import SessionPrefetcher
+from cache.warmer import CacheWarmer
+from providers.http import close_http_client
 from providers.ugg_scraper import UGGScraperProvider, CHAMPION_NAMES as CHAMPION_ID_MAP
 from runes.manager import RuneManager
+from runes.staging import RunePageStager
 from items.writer import ItemSetWriter
 from ui.main_window import RuneDisplayWindow
 
@@ -32,8 +38,14 @@ class VisualLeagueHelper:
         self.connector = LCUConnector()
         self.api: Optional[LCUAPI] = None
         self.websocket: Optional[LCUWebSocket] = None
-        self.provider = UGGScraperProvider()
+        self.supervisor: Optional[LCUSupervisor] = None
+        self.build_cache = BuildCache()
+        self.provider = UGGScraperProvider(cache=self.build_cache)
+        self.warmer: Optional[CacheWarmer] = None
+        self.prefetcher: Optional[SessionPrefetcher] = None
         self.rune_manager: Optional[RuneManager] = None
+        self.stager: Optional[RunePageStager] = None
+        self._last_champion = None
         self.item_writer = ItemSetWriter()
         self.running = False
         self.current_patch = "14_1"
@@ -50,8 +62,10 @@ class VisualLeagueHelper:
 
         # Connect to League client
         print("Waiting for League of Legends client...")
-        while not await self.connector.connect():
-            await asyncio.sleep(5)
+        self.supervisor = LCUSupervisor(self.connector)
+        self.websocket = self.supervisor.websocket
+        if not await self.supervisor.connect_client():
+            return
 
         print("[OK] Connected to League client")
         self.gui.update_status("Connected to League client", '#4ecca3')
@@ -59,6 +73,11 @@ class VisualLeagueHelper:
         # Initialize components
         self.api = LCUAPI(self.connector)
         self.rune_manager = RuneManager(self.api, provider_name="U.GG")
+        await self.rune_manager.load_catalog(self.provider.get_runes_reforged)
+        self.stager = RunePageStager(
+            self.rune_manager,
+            lambda champion_id, role: self.provider.get_build(champion_id, role, self.current_patch)
+        )
 
         # Get summoner info
         summoner = await self.api.get_current_summoner()
@@ -76,46 +95,85 @@ class VisualLeagueHelper:
         except Exception as e:
             print(f"Could not get patch: {e}")
 
-        # WebSocket loop with auto-reconnect
+        # Start background cache warmer (only fetches while the client is idle)
+        if not self.warmer:
+            self.warmer = CacheWarmer(self.provider, self.build_cache, CHAMPION_ID_MAP.keys())
+            await self.warmer.load_priorities(self.api)
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+            self.warmer.start(self.current_patch)
+
+        # During champ select, warm builds for trades, swaps and the ARAM bench instead
+        if self.prefetcher is None:
+            self.prefetcher = SessionPrefetcher(
+                lambda champion_id, role: self.provider.get_build(champion_id, role,
+                                                                  self.current_patch),
+                default_role='top'
+            )
+
+        # Handlers stay registered across reconnects
+        self.websocket.coalesce('/lol-champ-select/v1/session', SESSION_COALESCE_WINDOW,
+                                key=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select,
+                          interest=local_player_selection)
+        self.websocket.on('/lol-champ-select/v1/session', self.prefetcher.handle_session_event,
+                          interest=self.prefetcher.interest)
+        self.websocket.on('/lol-gameflow/v1/gameflow-phase', self.warmer.handle_gameflow_event)
+
+        # WebSocket loop with auto-reconnect (backoff, woken early by the lockfile)
         self.running = True
-        while self.running:
-            try:
-                self.websocket = LCUWebSocket(self.connector.port, self.connector.token)
-                if await self.websocket.connect():
-                    print("[OK] WebSocket connected")
-                    self._last_champion = None  # Reset on reconnect
-                    self.websocket.on('/lol-champ-select/v1/session', self.on_champion_select)
-                    print("Listening for champion selections...")
-                    self.gui.update_status("Waiting for champion selection...", 'white')
-                    await self.websocket.listen()  # Blocks until connection drops
-                    print("[WARN] WebSocket disconnected, reconnecting in 3s...")
-                    self.gui.update_status("Reconnecting...", '#ffd93d')
-                else:
-                    print("[WARN] WebSocket failed to connect, retrying in 5s...")
-                    self.gui.update_status("Reconnecting to League client...", '#ffd93d')
-                await asyncio.sleep(3)
-            except Exception as e:
-                print(f"[WARN] WebSocket error: {e}, reconnecting in 5s...")
-                self.gui.update_status("Reconnecting...", '#ffd93d')
-                await asyncio.sleep(5)
+        await self.supervisor.run(on_connect=self.on_connected, on_disconnect=self.on_disconnected)
+
+    async def on_connected(self):
+        """Called each time the WebSocket (re)connects"""
+        print("[OK] WebSocket connected")
+        self._last_champion = None  # Reset on reconnect
+        self.stager.reset()
+        self.prefetcher.reset()
+        if self.warmer is not None:
+            # Phase changes while disconnected never arrive as events
+            self.warmer.on_gameflow_phase(await self.api.get_gameflow_phase())
+        print("Listening for champion selections...")
+        self.gui.update_status("Waiting for champion selection...", 'white')
+
+    async def on_disconnected(self):
+        """Called when the connection to the client drops"""
+        self.gui.update_status("Reconnecting to League client...", '#ffd93d')
 
     async def stop(self):
         """Stop the application"""
         print("\n[APP] Stopping...")
         self.running = False
 
-        if self.websocket:
-            await self.websocket.disconnect()
+        if self.warmer:
+            await self.warmer.stop()
+            self.warmer = None
+
+        if self.prefetcher is not None:
+            await self.prefetcher.stop()
+            self.prefetcher = None
+
+        await self.provider.refresher.stop()
+        await close_http_client()
+
+        if self.supervisor:
+            await self.supervisor.stop()
 
         if self.connector:
             await self.connector.disconnect()
 
+        print(f"Build cache: {self.build_cache.stats}")
+        self.build_cache.close()
+
         self.gui.update_status("Stopped", '#ff6b6b')
         print("[OK] Stopped")
 
     async def on_champion_select(self, data: dict):
         """Handle champion selection event"""
-        if not data or not self.running:
+        if not data:
+            self.stager.reset()  # Champ select ended
+            self._last_champion = None
+            return
+        if not self.running:
             return
 
         try:
@@ -138,12 +196,14 @@ class VisualLeagueHelper:
 
                     role = player.get('assignedPosition', '').lower()
 
-                    # Prevent duplicate processing of same champion
-                    if hasattr(self, '_last_champion') and self._last_champion == (champion_id, role):
-                        return
+                    # Show each new selection once (and stage its rune page)
+                    if self._last_champion != (champion_id, role):
+                        self._last_champion = (champion_id, role)
+                        await self.process_champion_selection(champion_id, role)
 
-                    self._last_champion = (champion_id, role)
-                    await self.process_champion_selection(champion_id, role)
+                    # Locked in: send the page staged while hovering
+                    if local_pick_locked(data):
+                        await self.apply_locked_in(champion_id)
                     break
 
         except Exception as e:
@@ -168,6 +228,9 @@ class VisualLeagueHelper:
         print(f"Champion selected: {champion_name} ({role})")
         print(f"{'=' * 50}")
 
+        # Stage the rune page alongside the display fetch (same request, shared)
+        self.stager.hover(champion_id, role, champion_name)
+
         self.gui.update_status(f"Fetching {champion_name} build...", '#ffd93d')
 
         print("Fetching build data from U.GG...")
@@ -183,9 +246,11 @@ class VisualLeagueHelper:
         # Show a note if using generic build (champion not in custom db)
         is_known = champion_id in CHAMPION_BUILDS
         source_note = "U.GG" if is_known else "Generic (no custom build)"
+        if build_data.stale:
+            source_note += " (cached, refreshing)"
         self.gui.display_build(champion_name, role, build_data)
         self.gui.update_status(
-            f"{champion_name} | {source_note} | Click Apply Runes",
+            f"{champion_name} | {source_note} | Lock in or click Apply Runes",
             '#4ecca3' if is_known else '#ffd93d'
         )
         if not is_known:
@@ -193,6 +258,17 @@ class VisualLeagueHelper:
 
         print()
 
+    async def apply_locked_in(self, champion_id: int):
+        """Apply the staged rune page for a locked-in champion"""
+        champion_name = getattr(self, '_current_champion_name', 'Champion')
+        role = getattr(self, '_current_role', 'top')
+
+        success = await self.stager.lock_in(champion_id, role, champion_name)
+        if success:
+            self.gui.update_status(f"Runes applied for {champion_name}!", '#4ecca3')
+        else:
+            self.gui.update_status("Failed to apply runes", '#ff6b6b')
+
     async def apply_build(self, build_data):
         """Apply the build to League client"""
         print("Applying runes...")
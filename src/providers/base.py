@@ -7,6 +7,14 @@ from abc import ABC, abstractmethod
 from typing import Optional, Dict, List
 
 
+# Normalized Summoner's Rift roles (see BaseProvider.normalize_role)
+ROLES = ('top', 'jungle', 'middle', 'bottom', 'support')
+
+# Queue names used in cache keys
+RANKED_QUEUE = "ranked_solo_5x5"
+ARAM_QUEUE = "normal_aram"
+
+
 class RuneData:
     """Data structure for rune information"""
 
@@ -23,6 +31,15 @@ class RuneData:
             'selectedPerkIds': self.selected_perks
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RuneData':
+        """Create from LCU API format (inverse of to_dict)"""
+        return cls(
+            primary_style=data['primaryStyleId'],
+            sub_style=data['subStyleId'],
+            selected_perks=list(data['selectedPerkIds'])
+        )
+
 
 class ItemBuild:
     """Data structure for item build information"""
@@ -41,14 +58,46 @@ class ItemBuild:
             'situational_items': self.situational_items
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ItemBuild':
+        """Create from item set file format (inverse of to_dict)"""
+        return cls(
+            starting_items=list(data.get('starting_items', [])),
+            core_items=list(data.get('core_items', [])),
+            situational_items=list(data.get('situational_items', []))
+        )
+
 
 class BuildData:
     """Combined rune and item build data"""
 
-    def __init__(self, runes: RuneData, items: ItemBuild, summoner_spells: Optional[List[int]] = None):
+    def __init__(self, runes: RuneData, items: ItemBuild, summoner_spells: Optional[List[int]] = None,
+                 stale: bool = False):
         self.runes = runes
         self.items = items
         self.summoner_spells = summoner_spells or []
+        self.stale = stale  # True if served from cache past its soft TTL
+
+    def as_stale(self) -> 'BuildData':
+        """Copy of this build flagged as served stale (cached objects are shared)"""
+        return BuildData(self.runes, self.items, self.summoner_spells, stale=True)
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dict (used by the build cache)"""
+        return {
+            'runes': self.runes.to_dict(),
+            'items': self.items.to_dict(),
+            'summoner_spells': self.summoner_spells
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'BuildData':
+        """Create from a dict produced by to_dict"""
+        return cls(
+            runes=RuneData.from_dict(data['runes']),
+            items=ItemBuild.from_dict(data['items']),
+            summoner_spells=list(data.get('summoner_spells', []))
+        )
 
 
 class BaseProvider(ABC):
@@ -61,7 +110,8 @@ class BaseProvider(ABC):
         self.name = "BaseProvider"
 
     @abstractmethod
-    async def get_build(self, champion_id: int, role: str, patch: str) -> Optional[BuildData]:
+    async def get_build(self, champion_id: int, role: str, patch: str,
+                        refresh: bool = False) -> Optional[BuildData]:
         """
         Fetch build data for a champion
 
@@ -69,6 +119,7 @@ class BaseProvider(ABC):
             champion_id: Champion ID (e.g., 103 for Ahri)
             role: Role/position (e.g., 'middle', 'top', 'jungle', 'bottom', 'support')
             patch: Patch version (e.g., '14.1')
+            refresh: Skip any cached copy and fetch from the source
 
         Returns:
             BuildData object or None if not found
@@ -76,13 +127,15 @@ class BaseProvider(ABC):
         pass
 
     @abstractmethod
-    async def get_aram_build(self, champion_id: int, patch: str) -> Optional[BuildData]:
+    async def get_aram_build(self, champion_id: int, patch: str,
+                             refresh: bool = False) -> Optional[BuildData]:
         """
         Fetch ARAM build data for a champion
 
         Args:
             champion_id: Champion ID
             patch: Patch version
+            refresh: Skip any cached copy and fetch from the source
 
         Returns:
             BuildData object or None if not found
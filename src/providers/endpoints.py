@@ -0,0 +1,34 @@
+"""
+Provider Endpoints
+Base URLs of the sites providers talk to, overridable for local testing
+"""
+
+import os
+from typing import Optional
+
+
+# Service -> (default base URL, environment variable that overrides it)
+ENDPOINTS = {
+    'ugg': ("https://u.gg", 'UGG_BASE_URL'),
+    'ugg_stats': ("https://stats2.u.gg", 'UGG_STATS_BASE_URL'),
+    'ddragon': ("https://ddragon.leagueoflegends.com", 'DDRAGON_BASE_URL'),
+}
+
+
+def resolve_base_url(service: str, override: Optional[str] = None) -> str:
+    """
+    Get the base URL for a service
+
+    Precedence: explicit override, then the service's environment variable
+    (e.g., UGG_BASE_URL=http://127.0.0.1:8700 to use the mock server), then
+    the real site.
+
+    Args:
+        service: Key in ENDPOINTS ('ugg', 'ugg_stats', 'ddragon')
+        override: Base URL passed in by the caller, if any
+
+    Returns:
+        Base URL without a trailing slash
+    """
+    default, env_var = ENDPOINTS[service]
+    return (override or os.environ.get(env_var) or default).rstrip('/')
@@ -0,0 +1,111 @@
+"""
+HTTP Client
+Long-lived pooled aiohttp sessions shared by all providers
+"""
+
+import asyncio
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+# Connection pool settings (per host - each host gets its own session)
+DEFAULT_LIMIT_PER_HOST = 4
+DEFAULT_KEEPALIVE = 60         # seconds an idle connection is kept open
+DEFAULT_DNS_CACHE_TTL = 600    # seconds a DNS lookup is reused
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+class HTTPClient:
+    """
+    One keep-alive aiohttp session per host
+
+    Creating a ClientSession per request means a fresh DNS lookup and TCP+TLS
+    handshake every time. Sessions here are created on first use and reused
+    until close(). A session is tied to the event loop it was created on, so if
+    the loop changes (the tray UI runs a new loop after Stop/Start) the old
+    session is dropped and a new one is created.
+    """
+
+    def __init__(self, limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 keepalive: float = DEFAULT_KEEPALIVE,
+                 dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+                 timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT):
+        """
+        Initialize HTTPClient
+
+        Args:
+            limit_per_host: Maximum open connections per host
+            keepalive: Seconds to keep idle connections open
+            dns_cache_ttl: Seconds to cache DNS results
+            timeout: Default timeout for requests
+        """
+        self.limit_per_host = limit_per_host
+        self.keepalive = keepalive
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self._sessions: Dict[str, Tuple[aiohttp.ClientSession, asyncio.AbstractEventLoop]] = {}
+
+    def session(self, url: str) -> aiohttp.ClientSession:
+        """
+        Get the pooled session for a URL's host (must be called inside a running loop)
+
+        Args:
+            url: Any URL on the host
+
+        Returns:
+            Shared ClientSession - use it directly, don't close it
+        """
+        host = urlsplit(url).netloc
+        loop = asyncio.get_running_loop()
+
+        entry = self._sessions.get(host)
+        if entry is not None:
+            session, session_loop = entry
+            if not session.closed and session_loop is loop:
+                return session
+
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        self._sessions[host] = (session, loop)
+        return session
+
+    def get(self, url: str, **kwargs):
+        """
+        GET through the pooled session for the URL's host
+
+        Usage: async with client.get(url) as response: ...
+        """
+        return self.session(url).get(url, **kwargs)
+
+    async def close(self):
+        """Close all sessions (they are recreated on next use)"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        loop = asyncio.get_running_loop()
+        for session, session_loop in sessions:
+            # Sessions from a loop that's gone can't be closed from this one
+            if session_loop is loop and not session.closed:
+                await session.close()
+
+
+_shared_client: Optional[HTTPClient] = None
+
+
+def get_http_client() -> HTTPClient:
+    """Get the process-wide HTTP client used by providers by default"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = HTTPClient()
+    return _shared_client
+
+
+async def close_http_client():
+    """Close the shared client's sessions (call from the app's stop())"""
+    if _shared_client is not None:
+        await _shared_client.close()
@@ -0,0 +1,57 @@
+"""
+Single-Flight
+Coalesces concurrent identical requests into one in-flight call
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key
+
+    The first caller for a key starts the call; anyone asking for the same key
+    while it is running awaits the same future and gets the same result (or
+    exception). Once the call finishes the key is forgotten, so later calls
+    start fresh - caching results is the build cache's job, not this one's.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0  # Calls that joined an in-flight call instead of starting one
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `call` unless a call for `key` is already in flight
+
+        Args:
+            key: Dedup key (e.g., the cache key)
+            call: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            The call's result
+        """
+        future = self._calls.get(key)
+        if future is not None:
+            self.shared += 1
+        else:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+
+        # Shield so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future):
+        """Drop a finished call (and mark its exception as retrieved)"""
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        if not future.cancelled():
+            future.exception()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -3,20 +3,31 @@ U.GG Provider
 Fetches build data from U.GG's structured API endpoints
 """
 
-import aiohttp
 from typing import Optional, Dict, List
 from providers.base import BaseProvider, BuildData, RuneData, ItemBuild
+from providers.http import HTTPClient, get_http_client
+from providers.endpoints import resolve_base_url
 
 
 class UGGProvider(BaseProvider):
     """Provider for U.GG data"""
 
-    def __init__(self):
+    def __init__(self, http: Optional[HTTPClient] = None, base_url: Optional[str] = None):
+        """
+        Initialize UGGProvider
+
+        Args:
+            http: HTTP client to use; defaults to the shared pooled client
+            base_url: Stats API root (default: UGG_STATS_BASE_URL env var or
+                      https://stats2.u.gg)
+        """
         super().__init__()
         self.name = "U.GG"
-        self.base_url = "https://stats2.u.gg/lol/1.5"
+        self.base_url = f"{resolve_base_url('ugg_stats', base_url)}/lol/1.5"
+        self.http = http or get_http_client()
 
-    async def get_build(self, champion_id: int, role: str, patch: str) -> Optional[BuildData]:
+    async def get_build(self, champion_id: int, role: str, patch: str,
+                        refresh: bool = False) -> Optional[BuildData]:
         """
         Fetch build data from U.GG
 
@@ -24,6 +35,7 @@ class UGGProvider(BaseProvider):
             champion_id: Champion ID
             role: Role (top, jungle, middle, bottom, support)
             patch: Patch version (e.g., '14.1')
+            refresh: Unused (this provider doesn't cache)
 
         Returns:
             BuildData or None if not found
@@ -36,17 +48,16 @@ class UGGProvider(BaseProvider):
 
         try:
             print(f"DEBUG: Fetching from URL: {url}")
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    print(f"DEBUG: Response status: {response.status}")
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"DEBUG: Error response: {error_text[:200]}")
-                        return None
+            async with self.http.get(url) as response:
+                print(f"DEBUG: Response status: {response.status}")
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"DEBUG: Error response: {error_text[:200]}")
+                    return None
 
-                    data = await response.json()
-                    print(f"DEBUG: Successfully fetched data")
-                    return self._parse_build_data(data)
+                data = await response.json()
+                print(f"DEBUG: Successfully fetched data")
+                return self._parse_build_data(data)
 
         except Exception as e:
             print(f"U.GG fetch error: {e}")
@@ -54,13 +65,15 @@ class UGGProvider(BaseProvider):
             traceback.print_exc()
             return None
 
-    async def get_aram_build(self, champion_id: int, patch: str) -> Optional[BuildData]:
+    async def get_aram_build(self, champion_id: int, patch: str,
+                             refresh: bool = False) -> Optional[BuildData]:
         """
         Fetch ARAM build data from U.GG
 
         Args:
             champion_id: Champion ID
             patch: Patch version
+            refresh: Unused (this provider doesn't cache)
 
         Returns:
             BuildData or None if not found
@@ -70,13 +83,12 @@ class UGGProvider(BaseProvider):
         url = f"{self.base_url}/overview/{patch}/normal_aram/{champion_id}/1.5.0.json"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return None
+            async with self.http.get(url) as response:
+                if response.status != 200:
+                    return None
 
-                    data = await response.json()
-                    return self._parse_build_data(data)
+                data = await response.json()
+                return self._parse_build_data(data)
 
         except Exception as e:
             print(f"U.GG ARAM fetch error: {e}")
@@ -222,14 +234,13 @@ class UGGProvider(BaseProvider):
         """
         try:
             # U.GG has a version endpoint
-            url = "https://stats2.u.gg/lol/1.5/current_patch.json"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Format is usually '14_1' (underscore instead of dot)
-                        return data.get('patch', None)
+            url = f"{self.base_url}/current_patch.json"
+
+            async with self.http.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    # Format is usually '14_1' (underscore instead of dot)
+                    return data.get('patch', None)
 
         except Exception:
             pass
@@ -0,0 +1,328 @@
+"""
+U.GG Single-Pass Extractor
+Pulls runes, stat shards, items and summoner spells out of U.GG HTML in one scan
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from providers.base import RuneData, ItemBuild
+
+
+# Reverse map: folder name in icon path -> rune ID
+# Built from the complete Data Dragon 16.3.1 rune data
+RUNE_NAME_TO_ID = {
+    # Domination
+    "Electrocute": 8112, "DarkHarvest": 8128, "HailOfBlades": 9923,
+    "CheapShot": 8126, "TasteOfBlood": 8139, "SuddenImpact": 8143,
+    "SixthSense": 8137, "GrislyMementos": 8140, "DeepWard": 8141,
+    "TreasureHunter": 8135, "RelentlessHunter": 8105, "UltimateHunter": 8106,
+    # Inspiration
+    "GlacialAugment": 8351, "UnsealedSpellbook": 8360, "FirstStrike": 8369,
+    "HextechFlashtraption": 8306, "MagicalFootwear": 8304, "CashBack": 8321,
+    "TripleTonic": 8313, "TimeWarpTonic": 8352, "BiscuitDelivery": 8345,
+    "CosmicInsight": 8347, "ApproachVelocity": 8410, "JackOfAllTrades": 8316,
+    # Precision
+    "PressTheAttack": 8005, "LethalTempo": 8008, "FleetFootwork": 8021,
+    "Conqueror": 8010, "AbsorbLife": 9101, "Triumph": 9111,
+    "PresenceOfMind": 8009, "LegendAlacrity": 9104, "LegendHaste": 9105,
+    "LegendBloodline": 9103, "CoupDeGrace": 8014, "CutDown": 8017, "LastStand": 8299,
+    # Resolve
+    "GraspOfTheUndying": 8437, "VeteranAftershock": 8439, "Guardian": 8465,
+    "Demolish": 8446, "FontOfLife": 8463, "MirrorShell": 8401,
+    "Conditioning": 8429, "SecondWind": 8444, "BonePlating": 8473,
+    "Overgrowth": 8451, "Revitalize": 8453, "Unflinching": 8242,
+    # Sorcery
+    "SummonAery": 8214, "ArcaneComet": 8229, "PhaseRush": 8230,
+    "NullifyingOrb": 8224, "ManaflowBand": 8226, "NimbusCloak": 8275,
+    "Transcendence": 8210, "Celerity": 8234, "AbsoluteFocus": 8233,
+    "Scorch": 8237, "Waterwalking": 8232, "GatheringStorm": 8236,
+    # Stat shards (icon file names)
+    "StatModsAdaptiveForceIcon": 5008, "StatModsAttackSpeedIcon": 5005,
+    "StatModsCDRScalingIcon": 5007, "StatModsArmorIcon": 5002,
+    "StatModsMagicResIcon": 5003, "StatModsHealthScalingIcon": 5001,
+}
+
+# Tree name to style ID
+TREE_NAME_TO_ID = {
+    "Precision": 8000, "Domination": 8100, "Sorcery": 8200,
+    "Inspiration": 8300, "Resolve": 8400,
+}
+
+# Spell icon file name -> summoner spell ID
+SPELL_NAME_TO_ID = {
+    "SummonerFlash": 4, "SummonerDot": 14, "SummonerHaste": 6,
+    "SummonerHeal": 7, "SummonerExhaust": 3, "SummonerSmite": 11,
+    "SummonerTeleport": 12, "SummonerBoost": 1, "SummonerBarrier": 21,
+}
+
+# Consumables and wards that aren't part of a build
+IGNORED_ITEMS = frozenset((2003, 2055, 3340, 3364))
+
+DEFAULT_SHARD = 5008  # Adaptive Force
+MAX_ITEMS = 8
+MAX_SHARDS = 3
+
+# Characters kept from the end of each streamed chunk so an icon path split
+# across two chunks is still matched (longest path is well under this)
+CHUNK_OVERLAP = 256
+
+# How far before a '.png' a token can start (same bound as CHUNK_OVERLAP)
+MAX_TOKEN_LENGTH = CHUNK_OVERLAP
+
+# One alternation covering every icon path we care about. Only the rune
+# branch is case-insensitive, matching the separate per-field patterns.
+# Every token ends in '.png', which is what scan() searches for first
+# (so an upper-case '.PNG' rune icon is skipped; U.GG and Data Dragon use '.png').
+TOKEN_PATTERN = re.compile(
+    r'(?i:perk-images/(?:'
+    r'Styles/(?P<tree>\w+)/(?P<rune>\w+)/[\w.]+'
+    r'|StatMods/(?P<shard>StatMods\w+)(?:Icon)?(?:\.[\w]+)?'
+    r')\.png)'
+    r'|/img/item/(?P<item>\d{4,5})\.png'
+    r'|(?P<spell>Summoner\w+)\.png'
+)
+
+
+class ExtractedBuild:
+    """Raw fields found in a page, before fallbacks are applied"""
+
+    def __init__(self):
+        self.trees: Dict[str, List[int]] = {}  # tree name -> rune IDs in page order
+        # (primary tree, 4 runes, secondary tree, 2 runes) as of the first
+        # complete rune page; runes after it (alternative pages) are ignored
+        self.rune_page: Optional[Tuple[str, List[int], str, List[int]]] = None
+        self.shards: List[int] = []
+        self.items: List[int] = []
+        self.spells: List[int] = []
+        self.complete = False  # Every field filled; scanning stopped early
+
+    def add_rune(self, tree_name: str, rune_id: int):
+        """
+        Record a rune icon, fixing the rune page once it is complete
+
+        The page is complete as soon as one tree has 4 runes (keystone + 3) and
+        another has 2. The tree with the most runes at that point is primary,
+        the next one secondary. Pages can list alternative rune pages further
+        down; deciding at the first complete page keeps their runes out of the
+        counts, so the result doesn't depend on how much of the page was read.
+        """
+        if self.rune_page is not None:
+            return
+        self.trees.setdefault(tree_name, []).append(rune_id)
+
+        sorted_trees = sorted(self.trees.items(), key=lambda x: len(x[1]), reverse=True)
+        if len(sorted_trees) < 2 or len(sorted_trees[0][1]) < 4 or len(sorted_trees[1][1]) < 2:
+            return
+        (primary_tree_name, primary_runes), (sub_tree_name, sub_runes) = sorted_trees[:2]
+        self.rune_page = (primary_tree_name, primary_runes[:4], sub_tree_name, sub_runes[:2])
+
+    def runes(self) -> Optional[RuneData]:
+        """
+        The first complete rune page (see add_rune); missing stat shards are
+        padded with Adaptive Force
+        """
+        if self.rune_page is None:
+            return None
+        primary_tree_name, primary_runes, sub_tree_name, sub_runes = self.rune_page
+
+        shard_ids = self.shards[:MAX_SHARDS]
+        shard_ids += [DEFAULT_SHARD] * (MAX_SHARDS - len(shard_ids))
+
+        return RuneData(
+            primary_style=TREE_NAME_TO_ID[primary_tree_name],
+            sub_style=TREE_NAME_TO_ID[sub_tree_name],
+            selected_perks=primary_runes + sub_runes + shard_ids
+        )
+
+    def item_build(self) -> Optional[ItemBuild]:
+        """Item build from the first unique items (None if fewer than 3)"""
+        if len(self.items) < 3:
+            return None
+        return ItemBuild(
+            starting_items=self.items[:2],
+            core_items=self.items[2:5],
+            situational_items=self.items[5:8]
+        )
+
+
+class UGGExtractor:
+    """
+    Single-pass extractor for U.GG build pages
+
+    The multi-scan path (UGGScraperProvider._extract_*_from_html) runs one
+    regex over the whole page per field. This walks the page once, dispatching
+    each TOKEN_PATTERN match to its field, and stops as soon as every field is
+    filled: a complete rune page, 3 shards, 8 items and 2 spells. Because rune
+    icons come before the rest of the page, that usually happens well before
+    the end of the document.
+
+    Every field keeps its first values in page order (the rune page is fixed
+    when it first completes), so stopping early gives the same result as
+    stop_early=False, which scans to the end.
+
+    A single alternation has no literal prefix for the regex engine to skip
+    ahead on, so running TOKEN_PATTERN.finditer over the page tries every
+    branch at every offset (about twice the time of the four multi-scan
+    regexes). Instead scan() jumps between '.png' occurrences with str.find
+    and runs the pattern only over the few hundred characters before each.
+    """
+
+    def __init__(self, stop_early: bool = True):
+        """
+        Initialize UGGExtractor
+
+        Args:
+            stop_early: Stop scanning once every field is filled
+        """
+        self.stop_early = stop_early
+
+    def extract(self, html: str) -> ExtractedBuild:
+        """
+        Scan a full page
+
+        Args:
+            html: Page HTML
+
+        Returns:
+            ExtractedBuild with whatever was found
+        """
+        result = ExtractedBuild()
+        self.scan(html, result)
+        return result
+
+    def scan(self, text: str, result: ExtractedBuild, pos: int = 0) -> int:
+        """
+        Scan text from `pos`, adding matches to `result`
+
+        Args:
+            text: Text to scan
+            result: Extraction state to fill
+            pos: Offset to start at
+
+        Returns:
+            Offset just past the last match (or `pos` if nothing matched)
+        """
+        shards = result.shards
+        items = result.items
+        spells = result.spells
+        end = pos
+        find = text.find
+        search = TOKEN_PATTERN.search
+
+        while True:
+            # Each match ends in '.png'; look for one just before the next '.png'
+            index = find('.png', pos)
+            if index < 0:
+                break
+            stop = index + 4
+            match = search(text, max(pos, index - MAX_TOKEN_LENGTH), stop)
+            pos = stop
+            if match is None:
+                continue
+            end = stop
+            kind = match.lastgroup
+
+            if kind == 'rune':
+                if result.rune_page is not None:
+                    continue
+                tree_name = match.group('tree')
+                if tree_name not in TREE_NAME_TO_ID:
+                    continue
+                rune_id = RUNE_NAME_TO_ID.get(match.group('rune'))
+                if rune_id is None:
+                    continue
+                result.add_rune(tree_name, rune_id)
+
+            elif kind == 'shard':
+                if len(shards) >= MAX_SHARDS:
+                    continue
+                name = match.group('shard')
+                shard_id = RUNE_NAME_TO_ID.get(name) or RUNE_NAME_TO_ID.get(name + "Icon")
+                if shard_id and shard_id not in shards:
+                    shards.append(shard_id)
+
+            elif kind == 'item':
+                if len(items) >= MAX_ITEMS:
+                    continue
+                item_id = int(match.group('item'))
+                if item_id > 1000 and item_id not in IGNORED_ITEMS and item_id not in items:
+                    items.append(item_id)
+
+            elif kind == 'spell':
+                if len(spells) >= 2:
+                    continue
+                spell_id = SPELL_NAME_TO_ID.get(match.group('spell'))
+                if spell_id is not None and spell_id not in spells:
+                    spells.append(spell_id)
+
+            else:
+                continue
+
+            if self.stop_early and self._is_complete(result):
+                result.complete = True
+                break
+
+        return end
+
+    @staticmethod
+    def _is_complete(result: ExtractedBuild) -> bool:
+        """True once every field is filled"""
+        return (result.rune_page is not None and len(result.spells) >= 2
+                and len(result.items) >= MAX_ITEMS and len(result.shards) >= MAX_SHARDS)
+
+
+class StreamingExtractor:
+    """
+    Incremental wrapper around UGGExtractor for pages arriving in chunks
+
+    feed() scans each chunk as it arrives. A match can be split across two
+    chunks, so the unmatched tail of each chunk (up to CHUNK_OVERLAP
+    characters) is kept and rescanned in front of the next one. Text already
+    consumed by a match is never rescanned, so nothing is counted twice.
+    Fed a whole page, the result is the same as UGGExtractor.extract().
+    """
+
+    def __init__(self, extractor: Optional[UGGExtractor] = None):
+        """
+        Initialize StreamingExtractor
+
+        Args:
+            extractor: Extractor to scan with (defaults to one with early stop)
+        """
+        self.extractor = extractor or UGGExtractor()
+        self.result = ExtractedBuild()
+        self._tail = ''
+
+    @property
+    def complete(self) -> bool:
+        """True once every field is filled and the rest of the page can be skipped"""
+        return self.result.complete
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Scan the next chunk of the page
+
+        Args:
+            chunk: Decoded text following everything fed so far
+
+        Returns:
+            True once the build is complete
+        """
+        if self.result.complete:
+            return True
+
+        text = self._tail + chunk
+        end = self.extractor.scan(text, self.result)
+        self._tail = text[max(end, len(text) - CHUNK_OVERLAP):]
+        return self.result.complete
+
+    def finish(self) -> ExtractedBuild:
+        """
+        Mark the end of the page
+
+        Returns:
+            Everything extracted (complete or not)
+        """
+        self._tail = ''
+        return self.result
@@ -4,53 +4,42 @@ Scrapes U.GG website HTML for build data since their API is not public
 """
 
 import aiohttp
+import asyncio
+import codecs
 import re
 import json
 from typing import Optional, List
 from bs4 import BeautifulSoup
-from providers.base import BaseProvider, BuildData, RuneData, ItemBuild
+from providers.base import BaseProvider, BuildData, RuneData, ItemBuild, RANKED_QUEUE, ARAM_QUEUE
 from providers.champion_builds import get_champion_build
+from providers.singleflight import SingleFlight
+from providers.ugg_extractor import (UGGExtractor, StreamingExtractor, ExtractedBuild,
+                                     RUNE_NAME_TO_ID, TREE_NAME_TO_ID,
+                                     SPELL_NAME_TO_ID, IGNORED_ITEMS)
+from providers.http import HTTPClient, get_http_client
+from providers.endpoints import resolve_base_url
+from cache.build_cache import BuildCache
+from cache.refresh import RefreshQueue
+from cache.negative import (NegativeCache, FAILURE_NOT_FOUND, FAILURE_FORBIDDEN,
+                            FAILURE_PARSE, FAILURE_TIMEOUT, FAILURE_ERROR)
 
 
-# Reverse map: folder name in icon path -> rune ID
-# Built from the complete Data Dragon 16.3.1 rune data
-RUNE_NAME_TO_ID = {
-    # Domination
-    "Electrocute": 8112, "DarkHarvest": 8128, "HailOfBlades": 9923,
-    "CheapShot": 8126, "TasteOfBlood": 8139, "SuddenImpact": 8143,
-    "SixthSense": 8137, "GrislyMementos": 8140, "DeepWard": 8141,
-    "TreasureHunter": 8135, "RelentlessHunter": 8105, "UltimateHunter": 8106,
-    # Inspiration
-    "GlacialAugment": 8351, "UnsealedSpellbook": 8360, "FirstStrike": 8369,
-    "HextechFlashtraption": 8306, "MagicalFootwear": 8304, "CashBack": 8321,
-    "TripleTonic": 8313, "TimeWarpTonic": 8352, "BiscuitDelivery": 8345,
-    "CosmicInsight": 8347, "ApproachVelocity": 8410, "JackOfAllTrades": 8316,
-    # Precision
-    "PressTheAttack": 8005, "LethalTempo": 8008, "FleetFootwork": 8021,
-    "Conqueror": 8010, "AbsorbLife": 9101, "Triumph": 9111,
-    "PresenceOfMind": 8009, "LegendAlacrity": 9104, "LegendHaste": 9105,
-    "LegendBloodline": 9103, "CoupDeGrace": 8014, "CutDown": 8017, "LastStand": 8299,
-    # Resolve
-    "GraspOfTheUndying": 8437, "VeteranAftershock": 8439, "Guardian": 8465,
-    "Demolish": 8446, "FontOfLife": 8463, "MirrorShell": 8401,
-    "Conditioning": 8429, "SecondWind": 8444, "BonePlating": 8473,
-    "Overgrowth": 8451, "Revitalize": 8453, "Unflinching": 8242,
-    # Sorcery
-    "SummonAery": 8214, "ArcaneComet": 8229, "PhaseRush": 8230,
-    "NullifyingOrb": 8224, "ManaflowBand": 8226, "NimbusCloak": 8275,
-    "Transcendence": 8210, "Celerity": 8234, "AbsoluteFocus": 8233,
-    "Scorch": 8237, "Waterwalking": 8232, "GatheringStorm": 8236,
-    # Stat shards (icon file names)
-    "StatModsAdaptiveForceIcon": 5008, "StatModsAttackSpeedIcon": 5005,
-    "StatModsCDRScalingIcon": 5007, "StatModsArmorIcon": 5002,
-    "StatModsMagicResIcon": 5003, "StatModsHealthScalingIcon": 5001,
-}
+# Timeout for a single page scrape
+SCRAPE_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
-# Tree name to style ID
-TREE_NAME_TO_ID = {
-    "Precision": 8000, "Domination": 8100, "Sorcery": 8200,
-    "Inspiration": 8300, "Resolve": 8400,
-}
+# Bytes read per chunk when streaming a page
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# HTTP status -> negative cache failure class (anything else is FAILURE_ERROR)
+STATUS_FAILURES = {404: FAILURE_NOT_FOUND, 403: FAILURE_FORBIDDEN}
+
+# Per-field patterns used by the multi-scan extractors below
+PERK_PATTERN = re.compile(r'perk-images/Styles/(\w+)/(\w+)/[\w.]+\.png', re.IGNORECASE)
+STAT_PATTERN = re.compile(
+    r'perk-images/StatMods/(StatMods\w+)(?:Icon)?(?:\.[\w]+)?\.png', re.IGNORECASE
+)
+ITEM_PATTERN = re.compile(r'/img/item/(\d{4,5})\.png')
+SPELL_PATTERN = re.compile(r'(Summoner\w+)\.png')
 
 
 # Champion ID to name mapping (will expand this)
@@ -94,22 +83,50 @@ CHAMPION_NAMES = {
 class UGGScraperProvider(BaseProvider):
     """Provider that scrapes U.GG website for build data"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[BuildCache] = None,
+                 negative_cache: Optional[NegativeCache] = None,
+                 http: Optional[HTTPClient] = None, streaming: bool = True,
+                 base_url: Optional[str] = None, ddragon_url: Optional[str] = None):
+        """
+        Initialize UGGScraperProvider
+
+        Args:
+            cache: Optional build cache consulted before scraping
+            negative_cache: Recent failures to skip; a default one is created if None
+            http: HTTP client to use; defaults to the shared pooled client
+            streaming: Parse pages while they download and stop reading once
+                       the build is complete (False reads the whole page first)
+            base_url: U.GG site root (default: UGG_BASE_URL env var or https://u.gg)
+            ddragon_url: Data Dragon root (default: DDRAGON_BASE_URL env var
+                         or https://ddragon.leagueoflegends.com)
+        """
         super().__init__()
         self.name = "U.GG"
-        self.base_url = "https://u.gg/lol/champions"
-
-    async def get_build(self, champion_id: int, role: str, patch: str) -> Optional[BuildData]:
+        self.base_url = f"{resolve_base_url('ugg', base_url)}/lol/champions"
+        self.ddragon_url = resolve_base_url('ddragon', ddragon_url)
+        self.cache = cache
+        self.negative_cache = negative_cache if negative_cache is not None else NegativeCache()
+        self.refresher = RefreshQueue()
+        self.in_flight = SingleFlight()
+        self.http = http or get_http_client()
+        self.extractor = UGGExtractor()
+        self.streaming = streaming
+
+    async def get_build(self, champion_id: int, role: str, patch: str,
+                        refresh: bool = False) -> Optional[BuildData]:
         """
         Scrape build data from U.GG website
 
         Args:
             champion_id: Champion ID
             role: Role (top, jungle, middle, bottom, support)
-            patch: Patch version (not used for scraping, we get latest)
+            patch: Patch version (not used for scraping, we get latest;
+                   only used to key the cache)
+            refresh: Skip cache reads and scrape (the result is still cached)
 
         Returns:
-            BuildData or None if not found
+            BuildData or None if not found. build.stale is True when a cached
+            build past its soft TTL was returned while it is being refreshed.
         """
         champion_name = CHAMPION_NAMES.get(champion_id)
         if not champion_name:
@@ -120,6 +137,85 @@ class UGGScraperProvider(BaseProvider):
 
         # U.GG URL format: https://u.gg/lol/champions/{champion}/build?role={role}
         url = f"{self.base_url}/{champion_name}/build?role={role}"
+        if refresh:
+            return await self._scrape(champion_id, role, RANKED_QUEUE, patch, url,
+                                      remember=False)
+        return await self._get_cached_build(champion_id, role, RANKED_QUEUE, patch, url)
+
+    async def get_aram_build(self, champion_id: int, patch: str,
+                             refresh: bool = False) -> Optional[BuildData]:
+        """Scrape ARAM build data"""
+        champion_name = CHAMPION_NAMES.get(champion_id)
+        if not champion_name:
+            return get_champion_build(champion_id, 'aram')
+
+        url = f"{self.base_url}/{champion_name}/build?queueType=normal_aram"
+        if refresh:
+            return await self._scrape(champion_id, 'aram', ARAM_QUEUE, patch, url,
+                                      remember=False)
+        return await self._get_cached_build(champion_id, 'aram', ARAM_QUEUE, patch, url)
+
+    async def _get_cached_build(self, champion_id: int, role: str, queue: str,
+                                patch: str, url: str) -> BuildData:
+        """
+        Serve a build from cache when possible (stale-while-revalidate)
+
+        - fresh entry: returned as is
+        - stale entry, or a build cached for an older patch: returned right
+          away flagged stale, and a background refresh is queued
+        - nothing cached: scraped inline
+        """
+        if self.cache is None:
+            return await self._scrape(champion_id, role, queue, patch, url)
+
+        entry = self.cache.lookup(self.name, champion_id, role, queue, patch)
+        if entry and not entry.is_stale:
+            return entry.build
+
+        previous = entry.build if entry else self.cache.get_fallback(
+            self.name, champion_id, role, queue, patch
+        )
+        if previous:
+            self.refresher.schedule(
+                (self.name, champion_id, role, queue, patch),
+                lambda: self._scrape(champion_id, role, queue, patch, url, remember=False)
+            )
+            return previous.as_stale()
+
+        return await self._scrape(champion_id, role, queue, patch, url)
+
+    async def _scrape(self, champion_id: int, role: str, queue: str, patch: str,
+                      url: str, remember: bool = True) -> BuildData:
+        """
+        Scrape a build, sharing the result with concurrent scrapes of the same key
+
+        Champ select events arrive in bursts, and hovers, background refreshes
+        and the cache warmer can all ask for the same page at once; only the
+        first request goes to the network. `remember` is passed to the cache
+        (False for warming and background refreshes).
+        """
+        return await self.in_flight.do(
+            (self.name, champion_id, role, queue, patch),
+            lambda: self._scrape_page(champion_id, role, queue, patch, url, remember)
+        )
+
+    async def _scrape_page(self, champion_id: int, role: str, queue: str, patch: str,
+                           url: str, remember: bool = True) -> BuildData:
+        """
+        Fetch and parse a U.GG build page, storing live results in the cache
+
+        Failures are recorded in the negative cache by class (404, 403, parse
+        failure, timeout, other); until that entry expires the page is not
+        requested again and the fallback build is returned straight away.
+
+        Returns:
+            Live BuildData, or a fallback build if the scrape failed
+        """
+        negative_key = (self.name, champion_id, role, queue)
+        failure = self.negative_cache.check(negative_key)
+        if failure:
+            print(f"DEBUG: Skipping scrape for champion {champion_id} ({failure} recently)")
+            return self._fallback_build(champion_id, role, queue, patch)
 
         try:
             print(f"DEBUG: Scraping URL: {url}")
@@ -128,73 +224,124 @@ class UGGScraperProvider(BaseProvider):
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    print(f"DEBUG: Response status: {response.status}")
+            async with self.http.get(url, headers=headers, timeout=SCRAPE_TIMEOUT) as response:
+                print(f"DEBUG: Response status: {response.status}")
 
-                    if response.status != 200:
-                        error_text = await response.text()
-                        print(f"DEBUG: Error: {error_text[:200]}")
-                        return get_champion_build(champion_id, role)
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"DEBUG: Error: {error_text[:200]}")
+                    failure = STATUS_FAILURES.get(response.status, FAILURE_ERROR)
+                    self.negative_cache.record(negative_key, failure)
+                    return self._fallback_build(champion_id, role, queue, patch)
 
+                if self.streaming:
+                    extracted = await self._stream_extract(response)
+                    build = self._build_from_extracted(extracted, champion_id, role)
+                else:
                     html = await response.text()
-                    return self._parse_html(html, champion_id, role)
+                    build = self._extract_build(html, champion_id, role)
+                if build:
+                    self.negative_cache.clear(negative_key)
+                    if self.cache is not None:
+                        self.cache.put(self.name, champion_id, role, queue, patch, build,
+                                       remember=remember)
+                    return build
+                self.negative_cache.record(negative_key, FAILURE_PARSE)
+                return self._fallback_build(champion_id, role, queue, patch)
+
+        except asyncio.TimeoutError:
+            print(f"U.GG scraping timed out: {url}")
+            self.negative_cache.record(negative_key, FAILURE_TIMEOUT)
+            return self._fallback_build(champion_id, role, queue, patch)
 
         except Exception as e:
             print(f"U.GG scraping error: {e}")
             import traceback
             traceback.print_exc()
-            return get_champion_build(champion_id, role)
+            self.negative_cache.record(negative_key, FAILURE_ERROR)
+            return self._fallback_build(champion_id, role, queue, patch)
 
-    async def get_aram_build(self, champion_id: int, patch: str) -> Optional[BuildData]:
-        """Scrape ARAM build data"""
-        champion_name = CHAMPION_NAMES.get(champion_id)
-        if not champion_name:
-            return get_champion_build(champion_id, 'aram')
+    async def _stream_extract(self, response: aiohttp.ClientResponse) -> ExtractedBuild:
+        """
+        Feed a page into the extractor chunk by chunk as it downloads
 
-        url = f"{self.base_url}/{champion_name}/build?queueType=normal_aram"
+        Rune, item and spell icons come near the top of a build page, so once
+        the build is complete the rest of the body is not read: the response
+        is closed, which drops the connection instead of returning it to the
+        pool, but skips downloading (and decoding) the bulk of the page.
 
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+        Args:
+            response: Open 200 response
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        return get_champion_build(champion_id, 'aram')
+        Returns:
+            Everything extracted from the part of the page that was read
+        """
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        stream = StreamingExtractor(self.extractor)
+        received = 0
+
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            received += len(chunk)
+            if stream.feed(decoder.decode(chunk)):
+                print(f"DEBUG: Build complete after {received // 1024} KB, "
+                      f"closing download")
+                response.close()
+                return stream.finish()
+
+        stream.feed(decoder.decode(b'', final=True))
+        return stream.finish()
+
+    def _fallback_build(self, champion_id: int, role: str, queue: str, patch: str) -> BuildData:
+        """
+        Build to use when a live scrape fails.
+        Prefers a cached build from an older patch generation over the
+        hardcoded champion builds.
+        """
+        if self.cache is not None:
+            previous = self.cache.get_fallback(self.name, champion_id, role, queue, patch)
+            if previous:
+                print(f"DEBUG: Using cached build from an older patch for champion {champion_id}")
+                return previous
 
-                    html = await response.text()
-                    return self._parse_html(html, champion_id, 'aram')
+        print(f"DEBUG: Using champion-specific fallback for champion {champion_id}")
+        return get_champion_build(champion_id, role)
 
-        except Exception:
-            return get_champion_build(champion_id, 'aram')
+    def _extract_build(self, html: str, champion_id: int, role: str) -> Optional[BuildData]:
+        """
+        Extract a live build from U.GG HTML.
+        This never falls back, so callers can tell live data (which is worth
+        caching) apart from the hardcoded fallback builds.
+
+        Returns:
+            BuildData or None if no runes could be extracted
+        """
+        return self._build_from_extracted(self.extractor.extract(html), champion_id, role)
 
-    def _parse_html(self, html: str, champion_id: int, role: str) -> Optional[BuildData]:
+    def _build_from_extracted(self, extracted: ExtractedBuild, champion_id: int,
+                              role: str) -> Optional[BuildData]:
         """
-        Parse U.GG HTML to extract runes and items.
-        Strategy: find rune icon image src paths which encode the rune name,
-        then map names -> IDs using our Data Dragon lookup table.
+        Turn extracted page fields into a live build
+
+        Returns:
+            BuildData or None if no runes could be extracted
         """
         try:
-            runes = self._extract_runes_from_html(html)
-            items = self._extract_items_from_html(html)
-
-            if runes:
-                print(f"DEBUG: Successfully extracted live runes from U.GG for champion {champion_id}")
-                from providers.champion_builds import _get_role_items
-                return BuildData(
-                    runes=runes,
-                    items=items or _get_role_items(role),
-                    summoner_spells=self._extract_summoner_spells(html, champion_id)
-                )
-
-            print(f"DEBUG: Using champion-specific fallback for champion {champion_id}")
-            return get_champion_build(champion_id, role)
+            runes = extracted.runes()
+            if not runes:
+                return None
+
+            print(f"DEBUG: Successfully extracted live runes from U.GG for champion {champion_id}")
+            from providers.champion_builds import _get_role_items
+            return BuildData(
+                runes=runes,
+                items=extracted.item_build() or _get_role_items(role),
+                summoner_spells=extracted.spells if len(extracted.spells) == 2
+                else self._default_spells(champion_id)
+            )
 
         except Exception as e:
             print(f"HTML parsing error: {e}")
-            return get_champion_build(champion_id, role)
+            return None
 
     def _extract_runes_from_html(self, html: str) -> Optional[RuneData]:
         """
@@ -202,16 +349,13 @@ class UGGScraperProvider(BaseProvider):
         U.GG includes rune icon URLs like:
           .../perk-images/Styles/Domination/Electrocute/Electrocute.png
         We read the tree names and rune folder names and map them to IDs.
+
+        Multi-scan path kept unchanged as the baseline for UGGExtractor (see
+        benchmarks). It counts runes over the whole page, so pages listing
+        alternative rune pages can rank the wrong trees.
         """
         # Find all rune-related image src attributes
-        perk_pattern = re.compile(
-            r'perk-images/Styles/(\w+)/(\w+)/[\w.]+\.png', re.IGNORECASE
-        )
-        stat_pattern = re.compile(
-            r'perk-images/StatMods/(StatMods\w+)(?:Icon)?(?:\.[\w]+)?\.png', re.IGNORECASE
-        )
-
-        matches = perk_pattern.findall(html)
+        matches = PERK_PATTERN.findall(html)
         if not matches:
             return None
 
@@ -224,7 +368,7 @@ class UGGScraperProvider(BaseProvider):
         sub_tree = None
 
         for tree_name, rune_folder in matches:
-            if tree_name not in ("Precision", "Domination", "Sorcery", "Inspiration", "Resolve"):
+            if tree_name not in TREE_NAME_TO_ID:
                 continue
             rune_id = RUNE_NAME_TO_ID.get(rune_folder)
             if rune_id is None:
@@ -254,7 +398,7 @@ class UGGScraperProvider(BaseProvider):
             return None
 
         # Extract stat shards
-        stat_matches = stat_pattern.findall(html)
+        stat_matches = STAT_PATTERN.findall(html)
         shard_ids = []
         for match in stat_matches:
             shard_id = RUNE_NAME_TO_ID.get(match) or RUNE_NAME_TO_ID.get(match + "Icon")
@@ -278,13 +422,12 @@ class UGGScraperProvider(BaseProvider):
         Extract recommended items by parsing item icon image paths.
         U.GG uses img src like: /cdn/16.x.x/img/item/3020.png
         """
-        item_pattern = re.compile(r'/img/item/(\d{4,5})\.png')
         item_ids = []
         seen = set()
-        for match in item_pattern.finditer(html):
+        for match in ITEM_PATTERN.finditer(html):
             item_id = int(match.group(1))
             # Filter out consumables and wards
-            if item_id not in seen and item_id > 1000 and item_id not in (2003, 2055, 3340, 3364):
+            if item_id not in seen and item_id > 1000 and item_id not in IGNORED_ITEMS:
                 seen.add(item_id)
                 item_ids.append(item_id)
 
@@ -299,39 +442,65 @@ class UGGScraperProvider(BaseProvider):
 
     def _extract_summoner_spells(self, html: str, champion_id: int) -> List[int]:
         """Extract summoner spells from page, fallback to champion default"""
-        from providers.champion_builds import CHAMPION_BUILDS
         # Spell icon pattern: SummonerFlash.png, SummonerDot.png etc.
-        spell_map = {
-            "SummonerFlash": 4, "SummonerDot": 14, "SummonerHaste": 6,
-            "SummonerHeal": 7, "SummonerExhaust": 3, "SummonerSmite": 11,
-            "SummonerTeleport": 12, "SummonerBoost": 1, "SummonerBarrier": 21,
-        }
-        spell_pattern = re.compile(r'(Summoner\w+)\.png')
         found = []
         seen = set()
-        for match in spell_pattern.finditer(html):
+        for match in SPELL_PATTERN.finditer(html):
             name = match.group(1)
-            if name in spell_map and name not in seen:
+            if name in SPELL_NAME_TO_ID and name not in seen:
                 seen.add(name)
-                found.append(spell_map[name])
+                found.append(SPELL_NAME_TO_ID[name])
             if len(found) == 2:
                 return found
 
-        # Fall back to champion-specific or default
+        return self._default_spells(champion_id)
+
+    def _default_spells(self, champion_id: int) -> List[int]:
+        """Champion-specific summoner spells, or Flash + Ignite"""
+        from providers.champion_builds import CHAMPION_BUILDS
         if champion_id in CHAMPION_BUILDS:
             return CHAMPION_BUILDS[champion_id].get('summoner_spells', [4, 14])
         return [4, 14]
 
     async def get_current_patch(self) -> Optional[str]:
-        """Get current patch from Data Dragon"""
+        """
+        Get current patch from Data Dragon.
+        When a cache is attached, a newly seen patch becomes the cache's active
+        generation; builds from the previous patch are kept as fallbacks.
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://ddragon.leagueoflegends.com/api/versions.json", timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    if resp.status == 200:
-                        versions = await resp.json()
-                        return versions[0]  # Latest patch
+            async with self.http.get(
+                f"{self.ddragon_url}/api/versions.json", timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                if resp.status == 200:
+                    versions = await resp.json()
+                    patch = versions[0]  # Latest patch
+                    if self.cache is not None:
+                        self.cache.set_patch(patch)
+                    return patch
         except Exception:
             pass
         return "16.3.1"
+
+    async def get_runes_reforged(self, patch: Optional[str] = None) -> Optional[list]:
+        """
+        Get the rune trees from Data Dragon's runesReforged.json
+        (perk catalog fallback when the client's /lol-perks/v1/styles fails)
+
+        Args:
+            patch: Data Dragon version (default: the current patch)
+
+        Returns:
+            List of styles with their rune slots, or None on failure
+        """
+        patch = patch or await self.get_current_patch()
+        try:
+            async with self.http.get(
+                f"{self.ddragon_url}/cdn/{patch}/data/en_US/runesReforged.json",
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.json()
+        except Exception:
+            pass
+        return None
@@ -0,0 +1,323 @@
+"""
+Perk Catalog
+Index of every rune (perk) by style and slot row, used to validate and
+repair a rune page locally before it is sent to the client
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from providers.base import RuneData
+
+
+# Rune trees: style ID -> rows of perk IDs (row 0 is the keystone row).
+# Bundled fallback for when the client's /lol-perks/v1/styles isn't available;
+# same IDs as providers.ugg_extractor.RUNE_NAME_TO_ID.
+STYLE_ROWS: Dict[int, List[List[int]]] = {
+    8000: [  # Precision
+        [8005, 8008, 8021, 8010],
+        [9101, 9111, 8009],
+        [9104, 9105, 9103],
+        [8014, 8017, 8299],
+    ],
+    8100: [  # Domination
+        [8112, 8128, 9923],
+        [8126, 8139, 8143],
+        [8137, 8140, 8141],
+        [8135, 8105, 8106],
+    ],
+    8200: [  # Sorcery
+        [8214, 8229, 8230],
+        [8224, 8226, 8275],
+        [8210, 8234, 8233],
+        [8237, 8232, 8236],
+    ],
+    8300: [  # Inspiration
+        [8351, 8360, 8369],
+        [8306, 8304, 8321],
+        [8313, 8352, 8345],
+        [8347, 8410, 8316],
+    ],
+    8400: [  # Resolve
+        [8437, 8439, 8465],
+        [8446, 8463, 8401],
+        [8429, 8444, 8473],
+        [8451, 8453, 8242],
+    ],
+}
+
+# Stat shard rows (offense, flex, defense); the first of each row is the default
+STAT_SHARD_ROWS: List[List[int]] = [
+    [5008, 5005, 5007],  # Adaptive Force, Attack Speed, Ability Haste
+    [5008, 5010, 5001],  # Adaptive Force, Move Speed, Health Scaling
+    [5011, 5013, 5001],  # Health, Tenacity and Slow Resist, Health Scaling
+]
+
+# Perks on a page: keystone + 3 primary, 2 secondary, 3 shards
+PRIMARY_PERKS = 4
+SECONDARY_PERKS = 2
+PAGE_SIZE = PRIMARY_PERKS + SECONDARY_PERKS + len(STAT_SHARD_ROWS)
+
+# () -> Data Dragon runesReforged.json data, or None (e.g., provider.get_runes_reforged)
+RunesReforgedFetcher = Callable[[], Awaitable[Optional[List[dict]]]]
+
+# LCU /lol-perks/v1/styles slot types
+KEYSTONE_SLOT = 'kKeyStone'
+STAT_SLOT = 'kStatMod'
+
+
+class PerkCatalog:
+    """
+    Perk ID -> (style, row) index with rune page validation and repair
+
+    Every check is a dict lookup, so validating or repairing a 9-perk page
+    costs nothing next to the LCU round trip it saves.
+    """
+
+    def __init__(self, styles: Dict[int, List[List[int]]], shard_rows: List[List[int]],
+                 names: Optional[Dict[int, str]] = None, source: str = "bundled"):
+        """
+        Initialize PerkCatalog
+
+        Args:
+            styles: Style ID -> rows of perk IDs (keystone row first)
+            shard_rows: Stat shard rows, in page order
+            names: Perk ID -> display name (for messages)
+            source: Where the data came from (for logging)
+        """
+        self.styles = styles
+        self.shard_rows = shard_rows
+        self.names = names or {}
+        self.source = source
+        self._index: Dict[int, Tuple[int, int]] = {
+            perk_id: (style_id, row)
+            for style_id, rows in styles.items()
+            for row, perks in enumerate(rows)
+            for perk_id in perks
+        }
+        self._shard_rows = [set(row) for row in shard_rows]
+
+    # === Construction ===
+
+    @classmethod
+    def bundled(cls) -> 'PerkCatalog':
+        """Catalog from the bundled STYLE_ROWS / STAT_SHARD_ROWS tables"""
+        return cls(STYLE_ROWS, STAT_SHARD_ROWS)
+
+    @classmethod
+    def from_lcu(cls, styles: List[dict], perks: Optional[List[dict]] = None) -> 'PerkCatalog':
+        """
+        Build from the client's /lol-perks/v1/styles (and /lol-perks/v1/perks for names)
+
+        Args:
+            styles: Styles with 'slots' [{'type': 'kKeyStone' | ... | 'kStatMod', 'perks': [...]}]
+            perks: Perks with 'id' and 'name'
+        """
+        rows: Dict[int, List[List[int]]] = {}
+        shard_rows: List[List[int]] = []
+        for style in styles:
+            style_rows = []
+            style_shards = []
+            for slot in style.get('slots', []):
+                perk_ids = list(slot.get('perks', []))
+                if slot.get('type') == STAT_SLOT:
+                    style_shards.append(perk_ids)
+                elif slot.get('type') == KEYSTONE_SLOT:
+                    style_rows.insert(0, perk_ids)
+                else:
+                    style_rows.append(perk_ids)
+            if style_rows:
+                rows[style['id']] = style_rows
+            if style_shards and not shard_rows:
+                shard_rows = style_shards
+
+        names = {perk['id']: perk.get('name', '') for perk in perks or []}
+        return cls(rows, shard_rows or STAT_SHARD_ROWS, names, source="client")
+
+    @classmethod
+    def from_runes_reforged(cls, data: List[dict]) -> 'PerkCatalog':
+        """
+        Build from Data Dragon's runesReforged.json
+
+        It has no stat shards, so the bundled STAT_SHARD_ROWS are used.
+
+        Args:
+            data: [{'id': 8000, 'slots': [{'runes': [{'id': 8005, 'name': ...}, ...]}, ...]}, ...]
+        """
+        rows = {}
+        names = {}
+        for style in data:
+            rows[style['id']] = [[rune['id'] for rune in slot.get('runes', [])]
+                                 for slot in style.get('slots', [])]
+            for slot in style.get('slots', []):
+                for rune in slot.get('runes', []):
+                    names[rune['id']] = rune.get('name', '')
+        return cls(rows, STAT_SHARD_ROWS, names, source="Data Dragon")
+
+    @classmethod
+    async def load(cls, lcu_api,
+                   runes_reforged: Optional[RunesReforgedFetcher] = None) -> 'PerkCatalog':
+        """
+        Build from the running client, falling back to Data Dragon, then to
+        the bundled tables
+
+        Args:
+            lcu_api: LCUAPI to fetch styles and perks with
+            runes_reforged: Fetches runesReforged.json when the client's styles
+                            aren't available
+        """
+        styles, perks = await asyncio.gather(lcu_api.get_perk_styles(), lcu_api.get_perks())
+        if styles:
+            catalog = cls.from_lcu(styles, perks)
+            if catalog.styles:
+                return catalog
+
+        if runes_reforged is not None:
+            data = await runes_reforged()
+            if data:
+                catalog = cls.from_runes_reforged(data)
+                if catalog.styles:
+                    return catalog
+        return cls.bundled()
+
+    # === Lookups ===
+
+    def locate(self, perk_id: int) -> Optional[Tuple[int, int]]:
+        """(style ID, row) of a rune, or None for unknown IDs and stat shards"""
+        return self._index.get(perk_id)
+
+    def name(self, perk_id: int) -> str:
+        """Display name of a perk (its ID if unknown)"""
+        return self.names.get(perk_id) or str(perk_id)
+
+    def validate(self, runes: RuneData) -> List[str]:
+        """
+        Check a rune page without changing it
+
+        Args:
+            runes: Rune page to check
+
+        Returns:
+            Problems found (empty if the page is valid)
+        """
+        problems = []
+        perks = list(runes.selected_perks)
+        if len(perks) != PAGE_SIZE:
+            problems.append(f"{len(perks)} perks (expected {PAGE_SIZE})")
+        if runes.primary_style not in self.styles:
+            problems.append(f"unknown primary style {runes.primary_style}")
+        if runes.sub_style not in self.styles or runes.sub_style == runes.primary_style:
+            problems.append(f"invalid secondary style {runes.sub_style}")
+
+        for row, perk_id in enumerate(perks[:PRIMARY_PERKS]):
+            if self._index.get(perk_id) != (runes.primary_style, row):
+                problems.append(f"{self.name(perk_id)} is not a row {row} "
+                                f"{runes.primary_style} rune")
+
+        secondary_rows = set()
+        for perk_id in perks[PRIMARY_PERKS:PRIMARY_PERKS + SECONDARY_PERKS]:
+            location = self._index.get(perk_id)
+            if location is None or location[0] != runes.sub_style or location[1] == 0 \
+                    or location[1] in secondary_rows:
+                problems.append(f"{self.name(perk_id)} is not a valid {runes.sub_style} "
+                                f"secondary rune")
+            else:
+                secondary_rows.add(location[1])
+
+        for row, perk_id in enumerate(perks[PRIMARY_PERKS + SECONDARY_PERKS:]):
+            if row >= len(self._shard_rows) or perk_id not in self._shard_rows[row]:
+                problems.append(f"{self.name(perk_id)} is not a row {row} stat shard")
+        return problems
+
+    def repair(self, runes: RuneData) -> Tuple[RuneData, List[str]]:
+        """
+        Turn a page into a valid one, keeping as much of it as possible
+
+        Runes are placed by their own style and row rather than by position;
+        missing or invalid slots get the first rune of that row. Primary runes
+        are ordered by row, while secondary runes keep their order, as the
+        client (and validate()) accepts them in either order, so a page that
+        passes validate() comes back unchanged.
+
+        Args:
+            runes: Rune page, possibly incomplete or with stale IDs
+
+        Returns:
+            (repaired page, descriptions of what was changed)
+        """
+        fixes = []
+        perks = list(runes.selected_perks)
+        if len(perks) == PAGE_SIZE:
+            rune_ids = perks[:PRIMARY_PERKS + SECONDARY_PERKS]
+            shard_ids = perks[PRIMARY_PERKS + SECONDARY_PERKS:]
+        else:
+            # Incomplete page: positions mean nothing, so sort runes from shards by ID
+            rune_ids = [perk_id for perk_id in perks if perk_id in self._index]
+            shard_ids = [perk_id for perk_id in perks if perk_id not in self._index]
+            fixes.append(f"{len(perks)} perks (expected {PAGE_SIZE})")
+
+        # Styles: trust the page's, else infer from where its runes belong
+        primary_style = runes.primary_style
+        if primary_style not in self.styles:
+            keystone = self._index.get(perks[0]) if perks else None
+            primary_style = keystone[0] if keystone else next(iter(self.styles))
+            fixes.append(f"primary style {runes.primary_style} -> {primary_style}")
+
+        sub_style = runes.sub_style
+        if sub_style not in self.styles or sub_style == primary_style:
+            others = [self._index[perk_id][0] for perk_id in rune_ids
+                      if perk_id in self._index and self._index[perk_id][0] != primary_style]
+            sub_style = others[0] if others else next(style_id for style_id in self.styles
+                                                      if style_id != primary_style)
+            fixes.append(f"secondary style {runes.sub_style} -> {sub_style}")
+
+        # Place each rune in its own row (secondary rows in the order they come)
+        primary: Dict[int, int] = {}
+        secondary: Dict[int, int] = {}
+        for perk_id in rune_ids:
+            location = self._index.get(perk_id)
+            if location is None:
+                fixes.append(f"dropped unknown rune {perk_id}")
+                continue
+            style_id, row = location
+            if style_id == primary_style and row not in primary:
+                primary[row] = perk_id
+            elif style_id == sub_style and row > 0 and row not in secondary \
+                    and len(secondary) < SECONDARY_PERKS:
+                secondary[row] = perk_id
+            else:
+                fixes.append(f"dropped {self.name(perk_id)} (doesn't fit the page)")
+
+        rows = self.styles[primary_style]
+        for row in range(min(PRIMARY_PERKS, len(rows))):
+            if row not in primary:
+                primary[row] = rows[row][0]
+                fixes.append(f"filled primary row {row} with {self.name(rows[row][0])}")
+
+        sub_rows = self.styles[sub_style]
+        for row in range(1, len(sub_rows)):
+            if len(secondary) >= SECONDARY_PERKS:
+                break
+            if row not in secondary:
+                secondary[row] = sub_rows[row][0]
+                fixes.append(f"filled secondary row {row} with {self.name(sub_rows[row][0])}")
+
+        shards = []
+        for row, options in enumerate(self.shard_rows):
+            perk_id = shard_ids[row] if row < len(shard_ids) else None
+            if perk_id in self._shard_rows[row]:
+                shards.append(perk_id)
+            else:
+                shards.append(options[0])
+                fixes.append(f"stat shard row {row}: {perk_id} -> {options[0]}")
+
+        selected = [primary[row] for row in sorted(primary)] + \
+                   list(secondary.values()) + shards
+        if selected == perks and not fixes:
+            return runes, fixes
+        if not fixes:
+            fixes.append("reordered runes by row")
+        return RuneData(primary_style, sub_style, selected), fixes
+
+    def __len__(self) -> int:
+        return len(self._index)
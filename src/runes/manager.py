@@ -6,14 +6,54 @@ Handles applying runes to the League client
 from typing import Optional
 from lcu.api import LCUAPI
 from providers.base import BuildData, RuneData
+from runes.catalog import PerkCatalog, RunesReforgedFetcher
 
 
 class RuneManager:
     """Manages rune page creation and application"""
 
-    def __init__(self, lcu_api: LCUAPI, provider_name: str = "Auto"):
+    def __init__(self, lcu_api: LCUAPI, provider_name: str = "Auto",
+                 catalog: Optional[PerkCatalog] = None):
+        """
+        Initialize RuneManager
+
+        Args:
+            lcu_api: LCU API wrapper
+            provider_name: Prefix for rune page names
+            catalog: Perk catalog for checking pages before they are sent
+                     (default: bundled tables until load_catalog() is called)
+        """
         self.lcu_api = lcu_api
         self.provider_name = provider_name
+        self.catalog = catalog if catalog is not None else PerkCatalog.bundled()
+
+    async def load_catalog(self, runes_reforged: Optional[RunesReforgedFetcher] = None):
+        """
+        Replace the bundled perk catalog with the running client's
+
+        Args:
+            runes_reforged: Fetches Data Dragon's runesReforged.json, used when
+                            the client's styles aren't available
+        """
+        self.catalog = await PerkCatalog.load(self.lcu_api, runes_reforged)
+        print(f"[OK] Perk catalog loaded ({len(self.catalog)} runes, {self.catalog.source})")
+
+    def prepare_runes(self, runes: RuneData) -> RuneData:
+        """
+        Validate a rune page against the catalog and repair it if needed
+
+        Args:
+            runes: Rune page from a provider
+
+        Returns:
+            A page the client will accept
+        """
+        for problem in self.catalog.validate(runes):
+            print(f"[WARN] Rune page from {self.provider_name}: {problem}")
+        repaired, fixes = self.catalog.repair(runes)
+        for fix in fixes:
+            print(f"[FIXED] Rune page: {fix}")
+        return repaired
 
     async def apply_build(self, build_data: BuildData, champion_name: str, role: str) -> bool:
         """
@@ -46,28 +86,49 @@ class RuneManager:
             True if successfully applied
         """
         try:
-            # Create page name
-            page_name = f"{self.provider_name} - {champion_name} {role.capitalize()}"
-
-            # Apply the rune page
-            result = await self.lcu_api.apply_rune_page(
-                name=page_name,
-                primary_style=runes.primary_style,
-                sub_style=runes.sub_style,
-                selected_perks=runes.selected_perks
-            )
-
-            if result:
-                print(f"[OK] Applied runes: {page_name}")
-                return True
-            else:
-                print(f"[FAILED] Failed to apply runes: {page_name}")
-                return False
+            rune_page = self.stage_runes(runes, champion_name, role)
+            await self.lcu_api.ensure_managed_page()
+            return await self.apply_staged(rune_page)
 
         except Exception as e:
             print(f"Error applying runes: {e}")
             return False
 
+    def stage_runes(self, runes: RuneData, champion_name: str, role: str) -> dict:
+        """
+        Build the request body for a rune page without sending it
+
+        Args:
+            runes: RuneData object with rune configuration
+            champion_name: Name of the champion
+            role: Role being played
+
+        Returns:
+            Validated rune page body for apply_staged()
+        """
+        # Create page name
+        page_name = f"{self.provider_name} - {champion_name} {role.capitalize()}"
+
+        # Fix invalid or missing runes locally instead of after a failed request
+        runes = self.prepare_runes(runes)
+
+        return self.lcu_api.build_rune_page(page_name, runes.primary_style, runes.sub_style,
+                                            runes.selected_perks)
+
+    async def apply_staged(self, rune_page: dict) -> bool:
+        """
+        Send a rune page built by stage_runes() (one request once the managed page is known)
+
+        Returns:
+            True if successfully applied
+        """
+        result = await self.lcu_api.write_rune_page(rune_page)
+        if result is not None:  # {} for a 204 No Content update
+            print(f"[OK] Applied runes: {rune_page['name']}")
+            return True
+        print(f"[FAILED] Failed to apply runes: {rune_page['name']}")
+        return False
+
     async def get_current_runes(self) -> Optional[dict]:
         """Get the currently active rune page"""
         return await self.lcu_api.get_current_rune_page()
@@ -0,0 +1,164 @@
+"""
+Rune Page Stager
+Resolves and validates the rune page for a hovered champion ahead of time,
+so lock-in only has to send it
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional, Tuple
+
+from providers.base import BuildData
+from runes.manager import RuneManager
+
+
+# (champion_id, role) -> build for that selection
+BuildResolver = Callable[[int, str], Awaitable[Optional[BuildData]]]
+
+
+class StagingStats:
+    """Counts of speculative staging work"""
+
+    def __init__(self):
+        self.staged = 0        # Pages built ahead of lock-in
+        self.cancelled = 0     # Stale hovers abandoned before they finished
+        self.hits = 0          # Lock-ins whose page was staged (or staging) on hover
+        self.misses = 0        # Lock-ins that had to start staging
+        self.applied = 0
+
+    def to_dict(self) -> dict:
+        """Convert to a plain dict (for logging/display)"""
+        return {
+            'staged': self.staged,
+            'cancelled': self.cancelled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'applied': self.applied
+        }
+
+
+class RunePageStager:
+    """
+    Pre-stages the rune page for the champion being hovered
+
+    hover() fetches the build, resolves the managed page and validates the
+    rune page in the background; hovering something else cancels that work.
+    lock_in() then sends the staged page, which is a single LCU request once
+    the managed page is known.
+    """
+
+    def __init__(self, rune_manager: RuneManager, resolve: BuildResolver):
+        """
+        Initialize RunePageStager
+
+        Args:
+            rune_manager: Builds and sends the rune page
+            resolve: Async (champion_id, role) -> BuildData (e.g., provider.get_build)
+        """
+        self.rune_manager = rune_manager
+        self.resolve = resolve
+        self.stats = StagingStats()
+        self._key: Optional[Tuple[int, str]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._applied: Optional[Tuple[int, str]] = None
+
+    @property
+    def staged_key(self) -> Optional[Tuple[int, str]]:
+        """(champion_id, role) currently staged or being staged"""
+        return self._key
+
+    def hover(self, champion_id: int, role: str, champion_name: str):
+        """
+        Start staging the page for a hovered champion (no-op if already staged)
+
+        Args:
+            champion_id: Hovered champion ID
+            role: Assigned role
+            champion_name: Name for the rune page
+        """
+        key = (champion_id, role)
+        if key == self._key and self._task is not None and not self._task_failed():
+            return
+
+        self._cancel()
+        self._key = key
+        self._task = asyncio.create_task(self._stage(champion_id, role, champion_name))
+
+    async def lock_in(self, champion_id: int, role: str, champion_name: str) -> bool:
+        """
+        Apply the page for a locked-in champion, staging it first if needed
+
+        Args:
+            champion_id: Locked champion ID
+            role: Assigned role
+            champion_name: Name for the rune page
+
+        Returns:
+            True if the page was applied (or already had been)
+        """
+        key = (champion_id, role)
+        if key == self._applied:
+            return True
+
+        if key == self._key and self._task is not None and not self._task_failed():
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            self.hover(champion_id, role, champion_name)
+
+        task = self._task
+        try:
+            rune_page = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return False  # Superseded by another selection
+            raise
+        if rune_page is None or key != self._key:
+            return False
+
+        success = await self.rune_manager.apply_staged(rune_page)
+        if success:
+            self._applied = key
+            self.stats.applied += 1
+        return success
+
+    def reset(self):
+        """Forget the staged page (champ select ended or the client reconnected)"""
+        self._cancel()
+        self._key = None
+        self._applied = None
+
+    async def _stage(self, champion_id: int, role: str, champion_name: str) -> Optional[dict]:
+        """Fetch the build and resolve the managed page concurrently, then build the page"""
+        try:
+            build_data, _ = await asyncio.gather(
+                self.resolve(champion_id, role),
+                self.rune_manager.lcu_api.ensure_managed_page()
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error staging runes: {e}")
+            return None
+
+        if not build_data or not build_data.runes:
+            print(f"[FAILED] No build to stage for {champion_name} ({role})")
+            return None
+
+        rune_page = self.rune_manager.stage_runes(build_data.runes, champion_name, role)
+        self.stats.staged += 1
+        print(f"DEBUG: Staged runes for {champion_name} ({role})")
+        return rune_page
+
+    def _task_failed(self) -> bool:
+        """Whether the current staging task finished without a page (worth retrying)"""
+        task = self._task
+        if task is None or not task.done():
+            return False
+        return task.cancelled() or task.exception() is not None or task.result() is None
+
+    def _cancel(self):
+        """Cancel unfinished staging for a hover that is no longer current"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            self.stats.cancelled += 1
+        self._task = None